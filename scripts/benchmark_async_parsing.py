@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark async scraping with HTML parsing on the event loop vs. a process pool.
+
+Serves a synthetic documentation site from a local HTTP server and scrapes
+it with DocToSkillConverter in async mode, once per parse_workers setting,
+reporting sustained pages/sec for each.
+
+Usage:
+    python scripts/benchmark_async_parsing.py
+    python scripts/benchmark_async_parsing.py --pages 500 --workers 16 --parse-workers 0 2 4
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skill_seekers.cli.doc_scraper import DocToSkillConverter
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler without per-request logging."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def generate_site(root: Path, pages: int, sections: int) -> None:
+    """Write a linked set of heavy documentation pages under root/docs/."""
+    docs = root / "docs"
+    docs.mkdir(parents=True, exist_ok=True)
+
+    for i in range(pages):
+        links = "".join(
+            f'<li><a href="/docs/page{(i + k) % pages}.html">Page {(i + k) % pages}</a></li>'
+            for k in range(1, 11)
+        )
+        body = []
+        for s in range(sections):
+            body.append(f'<h2 id="s{s}">Section {s}</h2>')
+            body.append(f"<p>Section {s} of page {i} explains configuration, usage and caveats in detail.</p>")
+            body.append("<p>Example: the snippet below shows the typical use of this API.</p>")
+            body.append(
+                '<pre><code class="language-python">'
+                f"def handler_{s}(request):\n    value = compute({s})\n    return respond(value)\n"
+                "</code></pre>"
+            )
+        html = (
+            f"<html><head><title>Page {i}</title></head><body>"
+            f"<nav><ul>{links}</ul></nav>"
+            f'<div role="main"><h1>Page {i}</h1>{"".join(body)}</div>'
+            "</body></html>"
+        )
+        (docs / f"page{i}.html").write_text(html, encoding="utf-8")
+
+
+def run_scrape(base_url: str, pages: int, workers: int, parse_workers: int) -> float:
+    """Scrape the synthetic site once and return pages/sec."""
+    config = {
+        "name": f"bench_parse_{parse_workers}",
+        "base_url": f"{base_url}/docs/",
+        "start_urls": [f"{base_url}/docs/page0.html"],
+        "selectors": {"main_content": 'div[role="main"]', "title": "title", "code_blocks": "pre code"},
+        "rate_limit": 0,
+        "max_pages": pages,
+        "workers": workers,
+        "parse_workers": parse_workers,
+        "async_mode": True,
+        "skip_llms_txt": True,
+    }
+    converter = DocToSkillConverter(config)
+    start = time.perf_counter()
+    asyncio.run(converter.scrape_all_async())
+    elapsed = time.perf_counter() - start
+    return len(converter.pages) / elapsed if elapsed > 0 else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark async parsing modes")
+    parser.add_argument("--pages", type=int, default=300, help="Pages in the synthetic site (default: 300)")
+    parser.add_argument("--sections", type=int, default=40, help="Sections per page (default: 40)")
+    parser.add_argument("--workers", type=int, default=16, help="Async workers (default: 16)")
+    parser.add_argument("--parse-workers", type=int, nargs="+", default=[0, os.cpu_count() or 2],
+                        help="parse_workers settings to compare (default: 0 and CPU count)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        site = Path(tmp) / "site"
+        generate_site(site, args.pages, args.sections)
+
+        handler = partial(QuietHandler, directory=str(site))
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        # DocToSkillConverter writes to ./output, keep that inside the temp dir
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            print(f"Pages: {args.pages}  Sections/page: {args.sections}  Async workers: {args.workers}\n")
+            results = {}
+            for parse_workers in args.parse_workers:
+                rate = run_scrape(base_url, args.pages, args.workers, parse_workers)
+                results[parse_workers] = rate
+                mode = "event loop" if parse_workers == 0 else f"{parse_workers} processes"
+                print(f"  parse_workers={parse_workers:<3} ({mode:<14}) {rate:8.1f} pages/sec")
+        finally:
+            os.chdir(cwd)
+            server.shutdown()
+
+    baseline = results.get(0)
+    if baseline:
+        print()
+        for parse_workers, rate in results.items():
+            if parse_workers:
+                print(f"  parse_workers={parse_workers}: {rate / baseline:.2f}x vs event loop")
+
+
+if __name__ == "__main__":
+    main()
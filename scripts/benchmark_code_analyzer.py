@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark CodeAnalyzer's Python analysis against the previous method check.
+
+The previous analyzer decided whether each function is a method by walking
+the whole AST again for every function, which is quadratic in file size.
+This script analyzes large real-world files (the biggest modules of the
+standard library and of this repository, or the given files) with both
+approaches, checks that the classes/functions output is identical, and
+reports the cost per 1000 lines. It then analyzes one file concatenated
+1, 2, 4 and 8 times: the cost per line stays flat when analysis is linear.
+Files the analyzer cannot handle (with either approach) are reported and
+skipped.
+
+Usage:
+    python scripts/benchmark_code_analyzer.py
+    python scripts/benchmark_code_analyzer.py --files 5 path/to/big_module.py
+"""
+
+import argparse
+import ast
+import sys
+import sysconfig
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skill_seekers.cli.code_analyzer import CodeAnalyzer
+
+
+def analyze_rewalk(analyzer: CodeAnalyzer, content: str) -> Dict[str, Any]:
+    """Previous analysis: re-walk the whole tree to check each function."""
+    tree = ast.parse(content)
+    classes = []
+    functions = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            classes.append(asdict(analyzer._extract_python_class(node)))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            is_method = any(isinstance(parent, ast.ClassDef)
+                            for parent in ast.walk(tree)
+                            if hasattr(parent, 'body') and isinstance(parent.body, list) and node in parent.body)
+            if not is_method:
+                functions.append(asdict(analyzer._extract_python_function(node)))
+    return {'classes': classes, 'functions': functions}
+
+
+def largest_files(count: int) -> List[Path]:
+    """Return the largest Python modules defining functions in the stdlib and this repository."""
+    roots = [Path(sysconfig.get_paths()['stdlib']), Path(__file__).parent.parent / 'skill_seekers']
+    files = []
+    for root in roots:
+        for path in root.rglob('*.py'):
+            if 'site-packages' in path.parts or 'test' in path.parts or 'tests' in path.parts:
+                continue
+            try:
+                files.append((path.stat().st_size, path))
+            except OSError:
+                continue
+    files.sort(reverse=True)
+
+    parseable = []
+    for _, path in files:
+        try:
+            tree = ast.parse(path.read_text(encoding='utf-8'))
+        except (SyntaxError, UnicodeDecodeError, ValueError):
+            continue
+        if not any(isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) for node in ast.walk(tree)):
+            continue  # Data modules (e.g. pydoc topics) exercise nothing
+        parseable.append(path)
+        if len(parseable) == count:
+            break
+    return parseable
+
+
+def timed(analyze: Callable[[str], Dict[str, Any]], content: str):
+    """Return (result, seconds) of one analysis."""
+    start = time.perf_counter()
+    result = analyze(content)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Python code analysis')
+    parser.add_argument('paths', nargs='*', type=Path, help='Python files to analyze (default: largest real-world files)')
+    parser.add_argument('--files', type=int, default=6, help='Number of largest files to pick (default: 6)')
+    args = parser.parse_args()
+
+    analyzer = CodeAnalyzer(depth='deep')
+    single_pass = lambda content: analyzer._analyze_python(content, '<benchmark>')
+    rewalk = lambda content: analyze_rewalk(analyzer, content)
+
+    paths = args.paths or largest_files(args.files)
+    print(f"{'file':<32} {'lines':>7} {'defs':>6} {'rewalk ms/kline':>16} {'single-pass ms/kline':>21}")
+    identical = True
+    analyzed = []
+    for path in paths:
+        content = path.read_text(encoding='utf-8')
+        lines = content.count('\n') + 1
+        try:
+            new, new_time = timed(single_pass, content)
+            old, old_time = timed(rewalk, content)
+        except Exception as e:
+            print(f"{path.parent.name + '/' + path.name:<32} ⚠️  skipped, analyzer failed: {type(e).__name__}: {e}")
+            continue
+        analyzed.append(path)
+        identical &= new == old
+        defs = len(new['classes']) + len(new['functions']) + sum(len(c['methods']) for c in new['classes'])
+        print(f"{path.parent.name + '/' + path.name:<32} {lines:>7} {defs:>6} {old_time * 1000000 / lines:>16.1f} "
+              f"{new_time * 1000000 / lines:>21.1f}")
+
+    if not analyzed:
+        print("❌ No file could be analyzed")
+        return 1
+
+    # Scaling: the same file concatenated k times
+    content = analyzed[-1].read_text(encoding='utf-8')
+    print(f"\nScaling ({analyzed[-1].name} concatenated k times):")
+    print(f"{'k':>3} {'lines':>7} {'rewalk ms/kline':>16} {'single-pass ms/kline':>21}")
+    for k in (1, 2, 4, 8):
+        text = '\n'.join([content] * k)
+        lines = text.count('\n') + 1
+        new, new_time = timed(single_pass, text)
+        old, old_time = timed(rewalk, text)
+        identical &= new == old
+        print(f"{k:>3} {lines:>7} {old_time * 1000000 / lines:>16.1f} {new_time * 1000000 / lines:>21.1f}")
+
+    if not identical:
+        print("❌ Results differ")
+        return 1
+    print(f"✅ Identical classes/functions output ({len(analyzed)} of {len(paths)} files analyzed)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -13,6 +13,7 @@ Supports multiple languages with language-specific parsers.
 import ast
 import re
 import logging
+from bisect import bisect_left
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 
@@ -55,6 +56,27 @@ class ClassSignature:
     line_number: Optional[int] = None
 
 
+class LineIndex:
+    """
+    Line numbers of character offsets in a text.
+
+    The newline offsets are collected once per text and each lookup is a
+    binary search, instead of counting newlines in the text before every
+    match (which is quadratic in the number of matches).
+    """
+
+    def __init__(self, content: str):
+        self._newlines: List[int] = []
+        offset = content.find('\n')
+        while offset != -1:
+            self._newlines.append(offset)
+            offset = content.find('\n', offset + 1)
+
+    def line_number(self, offset: int) -> int:
+        """1-based line number of the character at offset."""
+        return bisect_left(self._newlines, offset) + 1
+
+
 class CodeAnalyzer:
     """
     Analyzes code at different depth levels.
@@ -110,24 +132,19 @@ class CodeAnalyzer:
 
         classes = []
         functions = []
+        methods = set()  # ids of functions defined directly in a class body
 
+        # One breadth-first pass: a class is always visited before the
+        # functions in its body, so methods are known when reached
         for node in ast.walk(tree):
             if isinstance(node, ast.ClassDef):
                 class_sig = self._extract_python_class(node)
                 classes.append(asdict(class_sig))
-            elif isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-                # Only top-level functions (not methods)
-                # Fix AST parser to check isinstance(parent.body, list) before 'in' operator
-                is_method = False
-                try:
-                    is_method = any(isinstance(parent, ast.ClassDef)
-                                  for parent in ast.walk(tree)
-                                  if hasattr(parent, 'body') and isinstance(parent.body, list) and node in parent.body)
-                except (TypeError, AttributeError):
-                    # If body is not iterable or check fails, assume it's a top-level function
-                    is_method = False
-
-                if not is_method:
+                methods.update(id(item) for item in node.body
+                               if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)))
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                # Only top-level functions (not methods); nested functions count as functions
+                if id(node) not in methods:
                     func_sig = self._extract_python_function(node)
                     functions.append(asdict(func_sig))
 
@@ -234,6 +251,8 @@ class CodeAnalyzer:
         classes = []
         functions = []
 
+        lines = LineIndex(content)
+
         # Extract class definitions
         class_pattern = r'class\s+(\w+)(?:\s+extends\s+(\w+))?\s*\{'
         for match in re.finditer(class_pattern, content):
@@ -255,7 +274,7 @@ class CodeAnalyzer:
                 'base_classes': [base_class] if base_class else [],
                 'methods': methods,
                 'docstring': None,
-                'line_number': content[:match.start()].count('\n') + 1
+                'line_number': lines.line_number(match.start())
             })
 
         # Extract top-level functions
@@ -272,7 +291,7 @@ class CodeAnalyzer:
                 'parameters': params,
                 'return_type': None,  # JS doesn't have type annotations (unless TS)
                 'docstring': None,
-                'line_number': content[:match.start()].count('\n') + 1,
+                'line_number': lines.line_number(match.start()),
                 'is_async': is_async,
                 'is_method': False,
                 'decorators': []
@@ -292,7 +311,7 @@ class CodeAnalyzer:
                 'parameters': params,
                 'return_type': None,
                 'docstring': None,
-                'line_number': content[:match.start()].count('\n') + 1,
+                'line_number': lines.line_number(match.start()),
                 'is_async': is_async,
                 'is_method': False,
                 'decorators': []
@@ -381,6 +400,8 @@ class CodeAnalyzer:
         classes = []
         functions = []
 
+        lines = LineIndex(content)
+
         # Extract class definitions (simplified - doesn't handle nested classes)
         class_pattern = r'class\s+(\w+)(?:\s*:\s*public\s+(\w+))?\s*\{'
         for match in re.finditer(class_pattern, content):
@@ -392,7 +413,7 @@ class CodeAnalyzer:
                 'base_classes': [base_class] if base_class else [],
                 'methods': [],  # Simplified - would need to parse class body
                 'docstring': None,
-                'line_number': content[:match.start()].count('\n') + 1
+                'line_number': lines.line_number(match.start())
             })
 
         # Extract function declarations
@@ -413,7 +434,7 @@ class CodeAnalyzer:
                 'parameters': params,
                 'return_type': return_type,
                 'docstring': None,
-                'line_number': content[:match.start()].count('\n') + 1,
+                'line_number': lines.line_number(match.start()),
                 'is_async': False,
                 'is_method': False,
                 'decorators': []
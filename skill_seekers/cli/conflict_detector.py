@@ -17,6 +17,8 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from difflib import SequenceMatcher
 
+from skill_seekers.cli.page_store import PageStore
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -38,16 +40,20 @@ class ConflictDetector:
     Detects conflicts between documentation and code sources.
     """
 
-    def __init__(self, docs_data: Dict[str, Any], github_data: Dict[str, Any]):
+    def __init__(self, docs_data: Dict[str, Any], github_data: Dict[str, Any],
+                 page_store: Optional[PageStore] = None):
         """
         Initialize conflict detector.
 
         Args:
             docs_data: Data from documentation scraper
             github_data: Data from GitHub scraper with code analysis
+            page_store: Optional page store of the documentation scrape. When given,
+                full page content is streamed from it instead of using docs_data['pages']
         """
         self.docs_data = docs_data
         self.github_data = github_data
+        self.page_store = page_store
 
         # Extract API information from both sources
         self.docs_apis = self._extract_docs_apis()
@@ -65,6 +71,20 @@ class ConflictDetector:
         """
         apis = {}
 
+        if self.page_store is not None:
+            # Stream full pages (content + code samples) from the scraper's page store
+            for page in self.page_store.iter_pages():
+                url = page.get('url', '')
+                title = page.get('title', '')
+                if any(keyword in title.lower() or keyword in url.lower()
+                       for keyword in ['api', 'reference', 'class', 'function', 'method']):
+                    content = '\n'.join(
+                        [page.get('content', '')] +
+                        [sample.get('code', '') for sample in page.get('code_samples', [])]
+                    )
+                    apis.update(self._parse_doc_content_for_apis(content, url))
+            return apis
+
         # Documentation structure varies, but typically has 'pages' or 'references'
         pages = self.docs_data.get('pages', {})
 
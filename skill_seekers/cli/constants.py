@@ -11,6 +11,8 @@ DEFAULT_RATE_LIMIT = 0.5  # seconds between requests
 DEFAULT_MAX_PAGES = 500   # maximum pages to scrape
 DEFAULT_CHECKPOINT_INTERVAL = 1000  # pages between checkpoints
 DEFAULT_ASYNC_MODE = False  # use async mode for parallel scraping (opt-in)
+DEFAULT_PAGE_STORE = 'jsonl'  # page storage backend: jsonl, sqlite or directory
+DEFAULT_PDF_CACHE_SIZE_MB = 512  # size limit of the on-disk PDF page extraction cache
 
 # Content analysis limits
 CONTENT_PREVIEW_LENGTH = 500  # characters to check for categorization
@@ -52,6 +54,8 @@ __all__ = [
     'DEFAULT_MAX_PAGES',
     'DEFAULT_CHECKPOINT_INTERVAL',
     'DEFAULT_ASYNC_MODE',
+    'DEFAULT_PAGE_STORE',
+    'DEFAULT_PDF_CACHE_SIZE_MB',
     'CONTENT_PREVIEW_LENGTH',
     'MAX_PAGES_WARNING_THRESHOLD',
     'MIN_CATEGORIZATION_SCORE',
@@ -18,26 +18,34 @@ import argparse
 import hashlib
 import logging
 import asyncio
+import threading
 import requests
 import httpx
-from pathlib import Path
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
-from collections import deque, defaultdict
-from typing import Optional, Dict, List, Tuple, Set, Deque, Any
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Dict, Iterable, List, Tuple, Set, Any
 
 # Add parent directory to path for imports when run as script
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from skill_seekers.cli.llms_txt_detector import LlmsTxtDetector
+from skill_seekers.cli.llms_txt_detector import DEFAULT_NEGATIVE_TTL, LlmsTxtDetector
 from skill_seekers.cli.llms_txt_parser import LlmsTxtParser
 from skill_seekers.cli.llms_txt_downloader import LlmsTxtDownloader
-from skill_seekers.cli.language_detector import LanguageDetector
+from skill_seekers.cli.language_detector import DetectionCache, LanguageDetector
+from skill_seekers.cli.url_frontier import URLFrontier
+from skill_seekers.cli.http_cache import HTTPCache
+from skill_seekers.cli.rate_limiter import THROTTLE_STATUS_CODES, HostRateLimiter
+from skill_seekers.cli.http_client import RETRY_STATUS_CODES, HTTPClient
+from skill_seekers.cli.page_store import PAGE_STORE_BACKENDS, PageStore, open_page_store
+from skill_seekers.cli.keyword_categorizer import KeywordCategorizer, get_categorizer
 from skill_seekers.cli.constants import (
     DEFAULT_RATE_LIMIT,
     DEFAULT_MAX_PAGES,
     DEFAULT_CHECKPOINT_INTERVAL,
     DEFAULT_ASYNC_MODE,
+    DEFAULT_PAGE_STORE,
     CONTENT_PREVIEW_LENGTH,
     MAX_PAGES_WARNING_THRESHOLD,
     MIN_CATEGORIZATION_SCORE
@@ -46,6 +54,15 @@ from skill_seekers.cli.constants import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Bump when the build manifest layout changes (older manifests are ignored)
+BUILD_MANIFEST_VERSION = 2
+
+# Bump when extract_content() output changes (pages cached by older versions are re-parsed)
+PAGE_FORMAT_VERSION = 1
+
+# (page, detection cache entries added, CSS class languages seen) from a parse worker
+ParseResult = Tuple[Dict[str, Any], List[Tuple[str, Tuple[str, float]]], Counter]
+
 
 def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     """Configure logging based on verbosity level.
@@ -135,72 +152,18 @@ def infer_description_from_docs(base_url: str, first_page_content: Optional[str]
     return f'Use when working with {name}' if name else f'Use when working with documentation at {urlparse(base_url).netloc}'
 
 
-class DocToSkillConverter:
-    def __init__(self, config: Dict[str, Any], dry_run: bool = False, resume: bool = False) -> None:
-        self.config = config
-        self.name = config['name']
-        self.base_url = config['base_url']
-        self.dry_run = dry_run
-        self.resume = resume
-
-        # Paths
-        self.data_dir = f"output/{self.name}_data"
-        self.skill_dir = f"output/{self.name}"
-        self.checkpoint_file = f"{self.data_dir}/checkpoint.json"
+class PageExtractor:
+    """Extracts page data (title, content, code samples, links) from parsed HTML.
 
-        # Checkpoint config
-        checkpoint_config = config.get('checkpoint', {})
-        self.checkpoint_enabled = checkpoint_config.get('enabled', False)
-        self.checkpoint_interval = checkpoint_config.get('interval', DEFAULT_CHECKPOINT_INTERVAL)
-
-        # llms.txt detection state
-        skip_llms_txt_value = config.get('skip_llms_txt', False)
-        if not isinstance(skip_llms_txt_value, bool):
-            logger.warning(
-                "Invalid value for 'skip_llms_txt': %r (expected bool). Defaulting to False.",
-                skip_llms_txt_value
-            )
-            self.skip_llms_txt = False
-        else:
-            self.skip_llms_txt = skip_llms_txt_value
-        self.llms_txt_detected = False
-        self.llms_txt_variant = None
-        self.llms_txt_variants: List[str] = []  # Track all downloaded variants
-
-        # Parallel scraping config
-        self.workers = config.get('workers', 1)
-        self.async_mode = config.get('async_mode', DEFAULT_ASYNC_MODE)
-
-        # Playwright config for SPA support
-        self.use_playwright = config.get('use_playwright', False)
-
-        # State
-        self.visited_urls: set[str] = set()
-        # Support multiple starting URLs
-        start_urls = config.get('start_urls', [self.base_url])
-        self.pending_urls = deque(start_urls)
-        self.pages: List[Dict[str, Any]] = []
-        self.pages_scraped = 0
-
-        # Language detection
-        self.language_detector = LanguageDetector(min_confidence=0.15)
-
-        # Thread-safe lock for parallel scraping
-        if self.workers > 1:
-            import threading
-            self.lock = threading.Lock()
+    Holds only the config and a language detector, so pool workers can
+    build one cheaply (see parse_workers) without a full converter.
+    """
 
-        # Create directories (unless dry-run)
-        if not dry_run:
-            os.makedirs(f"{self.data_dir}/pages", exist_ok=True)
-            os.makedirs(f"{self.skill_dir}/references", exist_ok=True)
-            os.makedirs(f"{self.skill_dir}/scripts", exist_ok=True)
-            os.makedirs(f"{self.skill_dir}/assets", exist_ok=True)
+    def __init__(self, config: Dict[str, Any], language_detector: LanguageDetector) -> None:
+        self.config = config
+        self.base_url = config['base_url']
+        self.language_detector = language_detector
 
-        # Load checkpoint if resuming
-        if resume and not dry_run:
-            self.load_checkpoint()
-    
     def is_valid_url(self, url: str) -> bool:
         """Check if URL should be scraped based on patterns.
 
@@ -225,61 +188,6 @@ class DocToSkillConverter:
 
         return True
 
-    def save_checkpoint(self) -> None:
-        """Save progress checkpoint"""
-        if not self.checkpoint_enabled or self.dry_run:
-            return
-
-        checkpoint_data = {
-            "config": self.config,
-            "visited_urls": list(self.visited_urls),
-            "pending_urls": list(self.pending_urls),
-            "pages_scraped": self.pages_scraped,
-            "last_updated": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            "checkpoint_interval": self.checkpoint_interval
-        }
-
-        try:
-            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(checkpoint_data, f, indent=2)
-            logger.info("  💾 Checkpoint saved (%d pages)", self.pages_scraped)
-        except Exception as e:
-            logger.warning("  ⚠️  Failed to save checkpoint: %s", e)
-
-    def load_checkpoint(self) -> None:
-        """Load progress from checkpoint"""
-        if not os.path.exists(self.checkpoint_file):
-            logger.info("ℹ️  No checkpoint found, starting fresh")
-            return
-
-        try:
-            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                checkpoint_data = json.load(f)
-
-            self.visited_urls = set(checkpoint_data["visited_urls"])
-            self.pending_urls = deque(checkpoint_data["pending_urls"])
-            self.pages_scraped = checkpoint_data["pages_scraped"]
-
-            logger.info("✅ Resumed from checkpoint")
-            logger.info("   Pages already scraped: %d", self.pages_scraped)
-            logger.info("   URLs visited: %d", len(self.visited_urls))
-            logger.info("   URLs pending: %d", len(self.pending_urls))
-            logger.info("   Last updated: %s", checkpoint_data['last_updated'])
-            logger.info("")
-
-        except Exception as e:
-            logger.warning("⚠️  Failed to load checkpoint: %s", e)
-            logger.info("   Starting fresh")
-
-    def clear_checkpoint(self) -> None:
-        """Remove checkpoint file"""
-        if os.path.exists(self.checkpoint_file):
-            try:
-                os.remove(self.checkpoint_file)
-                logger.info("✅ Checkpoint cleared")
-            except Exception as e:
-                logger.warning("⚠️  Failed to clear checkpoint: %s", e)
-
     def extract_content(self, soup: Any, url: str) -> Dict[str, Any]:
         """Extract content with improved code and pattern detection"""
         page = {
@@ -387,19 +295,318 @@ class DocToSkillConverter:
         """Clean text content"""
         text = re.sub(r'\s+', ' ', text)
         return text.strip()
+
+
+class DocToSkillConverter:
+    def __init__(self, config: Dict[str, Any], dry_run: bool = False, resume: bool = False) -> None:
+        self.config = config
+        self.name = config['name']
+        self.base_url = config['base_url']
+        self.dry_run = dry_run
+        self.resume = resume
+
+        # Paths
+        self.data_dir = f"output/{self.name}_data"
+        self.skill_dir = f"output/{self.name}"
+        self.checkpoint_file = f"{self.data_dir}/checkpoint.json"
+
+        # Incremental build: only rewrite reference files whose pages changed
+        self.incremental_build = config.get('incremental_build', False)
+        self.build_manifest_file = f"{self.data_dir}/build_manifest.json"
+
+        # Checkpoint config
+        checkpoint_config = config.get('checkpoint', {})
+        self.checkpoint_enabled = checkpoint_config.get('enabled', False)
+        self.checkpoint_interval = checkpoint_config.get('interval', DEFAULT_CHECKPOINT_INTERVAL)
+
+        # llms.txt detection state
+        skip_llms_txt_value = config.get('skip_llms_txt', False)
+        if not isinstance(skip_llms_txt_value, bool):
+            logger.warning(
+                "Invalid value for 'skip_llms_txt': %r (expected bool). Defaulting to False.",
+                skip_llms_txt_value
+            )
+            self.skip_llms_txt = False
+        else:
+            self.skip_llms_txt = skip_llms_txt_value
+        self.llms_txt_detected = False
+        self.llms_txt_variant = None
+        self.llms_txt_variants: List[str] = []  # Track all downloaded variants
+        self.llms_txt_negative_ttl = config.get('llms_txt_negative_ttl', DEFAULT_NEGATIVE_TTL)
+
+        # Background llms.txt probe; HTML crawling starts speculatively meanwhile and
+        # fetched pages are buffered until the probe resolves (see _resolve_llms_txt_probe)
+        self._llms_probe: Optional[Future] = None
+        self._llms_probe_variants: List[Dict[str, str]] = []
+        self._speculative_pages: Optional[List[Tuple[Dict[str, Any], Any]]] = None
+        self._speculation_lock = threading.Lock()
+
+        # Parallel scraping config
+        self.workers = config.get('workers', 1)
+        self.parse_workers = config.get('parse_workers', 0)  # Async mode: processes for HTML parsing (0 = event loop)
+        self.async_mode = config.get('async_mode', DEFAULT_ASYNC_MODE)
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
+        # Playwright config for SPA support
+        self.use_playwright = config.get('use_playwright', False)
+
+        # Conditional HTTP cache (ETag/Last-Modified) for re-scrapes
+        self.http_cache_dir = f"{self.data_dir}/http_cache"
+        self.http_cache: Optional[HTTPCache] = None
+        if config.get('http_cache', True) and not dry_run:
+            self.http_cache = HTTPCache(self.http_cache_dir, fingerprint=self._extraction_fingerprint())
+
+        # Pooled HTTP client for the sync/threaded paths (keep-alive connections per host).
+        # Throttling statuses are retried by _fetch() through the rate limiter instead
+        http_client_config = config.get('http_client', {})
+        self.http = HTTPClient(
+            pool_connections=http_client_config.get('pool_connections', 10),
+            pool_maxsize=http_client_config.get('pool_maxsize', max(10, self.workers)),
+            max_retries=http_client_config.get('max_retries', 3),
+            retry_statuses=RETRY_STATUS_CODES - THROTTLE_STATUS_CODES
+        )
+
+        # Per-host rate limiter shared by all workers (adapts to 429/503 and Crawl-delay)
+        limiter_config = config.get('rate_limiter', {})
+        self.throttle_retries = limiter_config.get('max_retries', 3)
+        self.rate_limiter = HostRateLimiter(
+            rate_limit=config.get('rate_limit', DEFAULT_RATE_LIMIT),
+            burst=limiter_config.get('burst', 1),
+            max_delay=limiter_config.get('max_delay', 60.0),
+            respect_crawl_delay=limiter_config.get('respect_crawl_delay', True),
+            client=self.http
+        )
+
+        # Frontier config (disk-backed store for very large crawls)
+        frontier_config = config.get('frontier', {})
+        self.frontier_disk_backed = frontier_config.get('disk_backed', False)
+        self.frontier_file = f"{self.data_dir}/frontier.db"
+
+        # State
+        self.visited_urls: set[str] = set()
+        self.in_flight_urls: set[str] = set()  # Claimed but not finished (async mode)
+        # Support multiple starting URLs
+        start_urls = config.get('start_urls', [self.base_url])
+        self.frontier = self._create_frontier(start_urls)
+        # Title and URL of each page scraped this run (full pages live in the page store)
+        self.pages: List[Dict[str, str]] = []
+        self.pages_scraped = 0
+
+        # Language detection (memoized per process, and across runs in data_dir).
+        # language_detection_max_chars bounds the work per code block: only
+        # the head and tail of longer blocks are scanned, and languages are
+        # tried in order of the CSS classes seen so far on the site
+        self.language_detector = LanguageDetector(min_confidence=0.15,
+                                                  max_chars=config.get('language_detection_max_chars'))
+        self.language_cache_file: Optional[str] = None
+        if config.get('language_cache', True) and not dry_run:
+            self.language_cache_file = f"{self.data_dir}/language_cache.json"
+            self.language_detector.cache.load(self.language_cache_file)
+        self.extractor = PageExtractor(config, self.language_detector)
+
+        # Keyword categorizer for the category definitions last categorized against
+        self._categorizer: Optional[Tuple[Dict[str, List[str]], KeywordCategorizer]] = None
+
+        # Thread-safe lock for parallel scraping
+        if self.workers > 1:
+            self.lock = threading.Lock()
+
+        # Page storage backend (jsonl, sqlite or directory)
+        self.page_store_backend = config.get('page_store', DEFAULT_PAGE_STORE)
+        self.page_store: Optional[PageStore] = None
+
+        # Create directories and open the page store (unless dry-run)
+        if not dry_run:
+            os.makedirs(self.data_dir, exist_ok=True)
+            os.makedirs(f"{self.skill_dir}/references", exist_ok=True)
+            os.makedirs(f"{self.skill_dir}/scripts", exist_ok=True)
+            os.makedirs(f"{self.skill_dir}/assets", exist_ok=True)
+            self.page_store = open_page_store(self.data_dir, self.page_store_backend)
+
+        # Load checkpoint if resuming
+        if resume and not dry_run:
+            self.load_checkpoint()
     
+    def _extraction_fingerprint(self) -> str:
+        """Hash of the settings extract_content() depends on.
+
+        Stored with every HTTP cache entry: an unchanged response is only
+        served from the page store if its page was built with the same
+        selectors, URL patterns and code language settings.
+        """
+        settings = {
+            'page_format': PAGE_FORMAT_VERSION,
+            'base_url': self.base_url,
+            'selectors': self.config.get('selectors', {}),
+            'url_patterns': self.config.get('url_patterns', {}),
+            'language_detection_max_chars': self.config.get('language_detection_max_chars'),
+            'language_rules': DetectionCache.fingerprint()
+        }
+        digest = hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    def _create_frontier(self, start_urls: List[str]) -> URLFrontier:
+        """Create the URL frontier (in-memory, or SQLite-backed if configured).
+
+        A disk-backed frontier left over from a previous run is discarded
+        unless resuming, so fresh scrapes never inherit stale state.
+        """
+        if not self.frontier_disk_backed or self.dry_run:
+            return URLFrontier(start_urls)
+
+        if not self.resume:
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(self.frontier_file + suffix):
+                    os.remove(self.frontier_file + suffix)
+
+        return URLFrontier(start_urls, store_path=self.frontier_file)
+
+    def is_valid_url(self, url: str) -> bool:
+        """Check if URL should be scraped based on patterns (see PageExtractor.is_valid_url)."""
+        return self.extractor.is_valid_url(url)
+
+    def extract_content(self, soup: Any, url: str) -> Dict[str, Any]:
+        """Extract page data from parsed HTML (see PageExtractor.extract_content)."""
+        return self.extractor.extract_content(soup, url)
+
+    def save_checkpoint(self) -> None:
+        """Save progress checkpoint"""
+        if not self.checkpoint_enabled or self.dry_run:
+            return
+
+        # URLs still being fetched, and pages only buffered while the llms.txt
+        # probe runs, are saved as pending so a resume fetches them again
+        with self._speculation_lock:
+            unsaved = {page['url'] for page, _ in self._speculative_pages or []}
+        unsaved |= self.in_flight_urls
+        checkpoint_data = {
+            "config": self.config,
+            "visited_urls": list(self.visited_urls - unsaved),
+            "pending_urls": list(unsaved) + self.frontier.pending(),
+            "pages_scraped": self.pages_scraped,
+            "last_updated": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "checkpoint_interval": self.checkpoint_interval
+        }
+
+        try:
+            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
+                json.dump(checkpoint_data, f, indent=2)
+            logger.info("  💾 Checkpoint saved (%d pages)", self.pages_scraped)
+        except Exception as e:
+            logger.warning("  ⚠️  Failed to save checkpoint: %s", e)
+
+    def load_checkpoint(self) -> None:
+        """Load progress from checkpoint"""
+        if not os.path.exists(self.checkpoint_file):
+            logger.info("ℹ️  No checkpoint found, starting fresh")
+            return
+
+        try:
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                checkpoint_data = json.load(f)
+
+            self.visited_urls = set(checkpoint_data["visited_urls"])
+            self.frontier.close()
+            self.frontier = self._create_frontier([])
+            for url in self.visited_urls:
+                self.frontier.mark_seen(url)
+            self.frontier.extend(checkpoint_data["pending_urls"])
+            self.pages_scraped = checkpoint_data["pages_scraped"]
+
+            logger.info("✅ Resumed from checkpoint")
+            logger.info("   Pages already scraped: %d", self.pages_scraped)
+            logger.info("   URLs visited: %d", len(self.visited_urls))
+            logger.info("   URLs pending: %d", len(self.frontier))
+            logger.info("   Last updated: %s", checkpoint_data['last_updated'])
+            logger.info("")
+
+        except Exception as e:
+            logger.warning("⚠️  Failed to load checkpoint: %s", e)
+            logger.info("   Starting fresh")
+
+    def clear_checkpoint(self) -> None:
+        """Remove checkpoint file"""
+        if os.path.exists(self.checkpoint_file):
+            try:
+                os.remove(self.checkpoint_file)
+                logger.info("✅ Checkpoint cleared")
+            except Exception as e:
+                logger.warning("⚠️  Failed to clear checkpoint: %s", e)
+
     def save_page(self, page: Dict[str, Any]) -> None:
-        """Save page data"""
-        url_hash = hashlib.md5(page['url'].encode()).hexdigest()[:10]
-        safe_title = re.sub(r'[^\w\s-]', '', page['title'])[:50]
-        safe_title = re.sub(r'[-\s]+', '_', safe_title)
-        
-        filename = f"{safe_title}_{url_hash}.json"
-        filepath = os.path.join(self.data_dir, "pages", filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(page, f, indent=2, ensure_ascii=False)
-    
+        """Save page data to the page store"""
+        self.page_store.save(page)
+
+    def _record_page(self, page: Dict[str, Any]) -> None:
+        """Remember a scraped page for the summary (only its title and URL are kept in memory)."""
+        self.pages.append({'title': page.get('title', ''), 'url': page['url']})
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Return If-None-Match/If-Modified-Since headers for a previously fetched URL."""
+        if self.http_cache is None:
+            return {}
+        return self.http_cache.conditional_headers(url)
+
+    def _load_unchanged_page(self, url: str, response: Any) -> Optional[Dict[str, Any]]:
+        """Return the saved page dict if the response shows the page is unchanged.
+
+        Args:
+            url: Requested URL
+            response: requests or httpx response (304, or 200 with an identical body)
+
+        Returns:
+            dict or None: Page data from the previous run, None if it must be re-parsed
+        """
+        if self.http_cache is None:
+            return None
+        if not self.http_cache.is_unchanged(url, response.status_code, response.content):
+            return None
+
+        page = self.page_store.get(url)
+        if page is None:
+            return None
+
+        self.http_cache.record(unchanged=True)
+        return page
+
+    def _save_fetched_page(self, page: Dict[str, Any], response: Any) -> None:
+        """Save a freshly parsed page and cache its response validators.
+
+        While the llms.txt probe is still running the page is only buffered;
+        it is saved once the probe finds no llms.txt.
+        """
+        with self._speculation_lock:
+            if self._speculative_pages is not None:
+                self._speculative_pages.append((page, response))
+                return
+
+        self._store_fetched_page(page, response)
+
+    def _store_fetched_page(self, page: Dict[str, Any], response: Any) -> None:
+        """Write a freshly parsed page to the page store and its validators to the HTTP cache."""
+        self.save_page(page)
+        if self.http_cache is not None:
+            self.http_cache.store(page['url'], response.headers, response.content)
+            self.http_cache.record(unchanged=False)
+
+    def _fetch(self, url: str, headers: Dict[str, str]) -> requests.Response:
+        """GET a URL through the per-host rate limiter, retrying throttled (429/503) responses."""
+        for _ in range(self.throttle_retries + 1):
+            self.rate_limiter.acquire(url)
+            response = self.http.get(url, headers=headers, timeout=30)
+            if not self.rate_limiter.observe(url, response.status_code, response.headers):
+                break
+        return response
+
+    async def _fetch_async(self, client: httpx.AsyncClient, url: str, headers: Dict[str, str]) -> httpx.Response:
+        """Async version of _fetch() using the shared httpx client."""
+        for _ in range(self.throttle_retries + 1):
+            await self.rate_limiter.acquire_async(url)
+            response = await client.get(url, headers=headers, timeout=30.0)
+            if not self.rate_limiter.observe(url, response.status_code, response.headers):
+                break
+        return response
+
     def scrape_page(self, url: str) -> None:
         """Scrape a single page with thread-safe operations.
 
@@ -415,38 +622,39 @@ class DocToSkillConverter:
         try:
             # Scraping part (no lock needed - independent)
             headers = {'User-Agent': 'Mozilla/5.0 (Documentation Scraper)'}
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
+            response = self._fetch(url, {**headers, **self._conditional_headers(url)})
+
+            # Reuse the saved page if it has not changed since the last run
+            page = self._load_unchanged_page(url, response)
+            unchanged = page is not None
+            if not unchanged:
+                if response.status_code == 304:
+                    # Validators matched but the saved page is gone, fetch it again
+                    response = self._fetch(url, headers)
+                response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            page = self.extract_content(soup, url)
+                soup = BeautifulSoup(response.content, 'html.parser')
+                page = self.extract_content(soup, url)
 
             # Thread-safe operations (lock required)
             if self.workers > 1:
                 with self.lock:
-                    logger.info("  %s", url)
-                    self.save_page(page)
-                    self.pages.append(page)
+                    logger.info("  %s%s", url, " (unchanged)" if unchanged else "")
+                    if not unchanged:
+                        self._save_fetched_page(page, response)
+                    self._record_page(page)
 
                     # Add new URLs
-                    for link in page['links']:
-                        if link not in self.visited_urls and link not in self.pending_urls:
-                            self.pending_urls.append(link)
+                    self.frontier.extend(page['links'])
             else:
                 # Single-threaded mode (no lock needed)
-                logger.info("  %s", url)
-                self.save_page(page)
-                self.pages.append(page)
+                logger.info("  %s%s", url, " (unchanged)" if unchanged else "")
+                if not unchanged:
+                    self._save_fetched_page(page, response)
+                self._record_page(page)
 
                 # Add new URLs
-                for link in page['links']:
-                    if link not in self.visited_urls and link not in self.pending_urls:
-                        self.pending_urls.append(link)
-
-            # Rate limiting
-            rate_limit = self.config.get('rate_limit', DEFAULT_RATE_LIMIT)
-            if rate_limit > 0:
-                time.sleep(rate_limit)
+                self.frontier.extend(page['links'])
 
         except Exception as e:
             if self.workers > 1:
@@ -471,49 +679,202 @@ class DocToSkillConverter:
             try:
                 # Async HTTP request
                 headers = {'User-Agent': 'Mozilla/5.0 (Documentation Scraper)'}
-                response = await client.get(url, headers=headers, timeout=30.0)
-                response.raise_for_status()
-
-                # BeautifulSoup parsing (still synchronous, but fast)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                page = self.extract_content(soup, url)
+                response = await self._fetch_async(client, url, {**headers, **self._conditional_headers(url)})
+
+                # Reuse the saved page if it has not changed since the last run
+                page = self._load_unchanged_page(url, response)
+                unchanged = page is not None
+                if not unchanged:
+                    if response.status_code == 304:
+                        # Validators matched but the saved page is gone, fetch it again
+                        response = await self._fetch_async(client, url, headers)
+                    response.raise_for_status()
+
+                    if self._parse_pool is not None:
+                        # Parse in a worker process so the event loop only does I/O
+                        loop = asyncio.get_running_loop()
+                        page = self._merge_parse_result(await loop.run_in_executor(
+                            self._parse_pool, _parse_page_in_worker, response.content, url
+                        ))
+                    else:
+                        # BeautifulSoup parsing (still synchronous, but fast)
+                        soup = BeautifulSoup(response.content, 'html.parser')
+                        page = self.extract_content(soup, url)
 
                 # Async-safe operations (no lock needed - single event loop)
-                logger.info("  %s", url)
-                self.save_page(page)
-                self.pages.append(page)
+                logger.info("  %s%s", url, " (unchanged)" if unchanged else "")
+                if not unchanged:
+                    self._save_fetched_page(page, response)
+                self._record_page(page)
 
                 # Add new URLs
-                for link in page['links']:
-                    if link not in self.visited_urls and link not in self.pending_urls:
-                        self.pending_urls.append(link)
-
-                # Rate limiting
-                rate_limit = self.config.get('rate_limit', DEFAULT_RATE_LIMIT)
-                if rate_limit > 0:
-                    await asyncio.sleep(rate_limit)
+                self.frontier.extend(page['links'])
 
             except Exception as e:
                 logger.error("  ✗ Error scraping %s: %s: %s", url, type(e).__name__, e)
 
-    def _try_llms_txt(self) -> bool:
+    def _merge_parse_result(self, result: ParseResult) -> Dict[str, Any]:
+        """Take over the language detections of a parse worker and return its page."""
+        page, detections, class_languages = result
+        if self.language_detector.cache is not None:
+            for key, detection in detections:
+                self.language_detector.cache.put(key, detection)
+        self.language_detector.class_languages.update(class_languages)
+        return page
+
+    def _llms_txt_cache_dir(self) -> Optional[str]:
+        """HTTP cache directory for llms.txt downloads (None if caching is off)."""
+        return self.http_cache_dir if self.http_cache is not None else None
+
+    def _llms_txt_detector(self) -> LlmsTxtDetector:
+        """Create the llms.txt detector (misses are cached per site for llms_txt_negative_ttl seconds)."""
+        return LlmsTxtDetector(
+            self.base_url,
+            client=self.http,
+            negative_cache_file=os.path.join(self.data_dir, 'llms_txt_probe.json'),
+            negative_ttl=self.llms_txt_negative_ttl
+        )
+
+    def _download_llms_txt_variants(self, variants: List[Dict[str, str]]) -> Dict[str, Dict[str, Any]]:
+        """Download llms.txt variants concurrently.
+
+        Args:
+            variants: Detected variants ({'url', 'variant'} dicts)
+
+        Returns:
+            dict: variant -> {'content', 'filename', 'size'} for every successful download
+        """
+        if not variants:
+            return {}
+
+        def download(variant_info: Dict[str, str]) -> Tuple[Dict[str, str], LlmsTxtDownloader, Optional[str]]:
+            downloader = LlmsTxtDownloader(variant_info['url'], cache_dir=self._llms_txt_cache_dir(), client=self.http)
+            return variant_info, downloader, downloader.download()
+
+        logger.info("  📥 Downloading %s...", ", ".join(v['variant'] for v in variants))
+        with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+            results = list(executor.map(download, variants))
+
+        downloaded = {}
+        for variant_info, downloader, content in results:
+            if content:
+                filename = downloader.get_proper_filename()
+                downloaded[variant_info['variant']] = {
+                    'content': content,
+                    'filename': filename,
+                    'size': len(content)
+                }
+                logger.info("     ✓ %s (%d chars)", filename, len(content))
+        return downloaded
+
+    def _start_llms_txt_probe(self) -> None:
+        """Probe for llms.txt in the background so HTML crawling can start right away."""
+        logger.info("\n🔍 Checking for llms.txt at %s (HTML crawl starts meanwhile)...", self.base_url)
+        executor = ThreadPoolExecutor(max_workers=1)
+        with self._speculation_lock:
+            self._llms_probe = executor.submit(self._llms_txt_detector().detect_all)
+            self._llms_probe_variants = []
+            self._speculative_pages = []
+        executor.shutdown(wait=False)
+
+    def _resolve_llms_txt_probe(self, wait: bool = False) -> bool:
+        """Check the background llms.txt probe.
+
+        If no llms.txt exists, the speculatively fetched pages are saved and
+        crawling simply continues. If llms.txt exists, the variants are kept
+        in _llms_probe_variants and the caller should stop crawling.
+
+        Args:
+            wait: Block until the probe finishes
+
+        Returns:
+            bool: True if llms.txt was found (stop HTML crawling)
+        """
+        probe = self._llms_probe
+        if probe is None:
+            return bool(self._llms_probe_variants)
+        if not wait and not probe.done():
+            return False
+
+        try:
+            variants = probe.result()
+        except Exception as e:
+            logger.warning("⚠️  llms.txt probe failed: %s", e)
+            variants = []
+
+        with self._speculation_lock:
+            if self._llms_probe is None:  # Resolved by another thread meanwhile
+                return bool(self._llms_probe_variants)
+            self._llms_probe = None
+            if variants:
+                self._llms_probe_variants = variants
+                logger.info("✅ Found %d llms.txt variant(s), stopping HTML crawl", len(variants))
+                return True
+
+            # Saved before the buffer is dropped, so a checkpoint never sees
+            # these pages as neither buffered nor stored
+            buffered = self._speculative_pages or []
+            logger.info("ℹ️  No llms.txt found, continuing HTML scraping (%d page(s) already fetched)", len(buffered))
+            for page, response in buffered:
+                self._store_fetched_page(page, response)
+            self._speculative_pages = None
+        return False
+
+    def _finish_speculative_crawl(self, pages_before: int) -> bool:
+        """Wrap up a crawl that ran alongside the llms.txt probe.
+
+        Args:
+            pages_before: len(self.pages) when the crawl started
+
+        Returns:
+            bool: True if llms.txt was used (the HTML pages were discarded),
+                  False if HTML scraping should continue or is complete
+        """
+        if not self._resolve_llms_txt_probe(wait=True):
+            return False
+
+        with self._speculation_lock:
+            buffered, self._speculative_pages = self._speculative_pages or [], None
+        variants, self._llms_probe_variants = self._llms_probe_variants, []
+
+        html_pages = self.pages[pages_before:]
+        del self.pages[pages_before:]
+        if self._try_llms_txt(variants):
+            logger.info("\n✅ Used llms.txt (%s) - skipping HTML scraping", self.llms_txt_variant)
+            return True
+
+        # llms.txt was unusable: keep the HTML pages fetched so far and carry on
+        self.pages.extend(html_pages)
+        for page, response in buffered:
+            self._save_fetched_page(page, response)
+        return False
+
+    def _try_llms_txt(self, variants: Optional[List[Dict[str, str]]] = None) -> bool:
         """
         Try to use llms.txt instead of HTML scraping.
         Downloads ALL available variants and stores with .md extension.
 
+        Args:
+            variants: Already detected variants (skips detection)
+
         Returns:
             True if llms.txt was found and processed successfully
         """
-        logger.info("\n🔍 Checking for llms.txt at %s...", self.base_url)
+        if variants is None:
+            logger.info("\n🔍 Checking for llms.txt at %s...", self.base_url)
 
         # Check for explicit config URL first
         explicit_url = self.config.get('llms_txt_url')
         if explicit_url:
             logger.info("\n📌 Using explicit llms_txt_url from config: %s", explicit_url)
 
-            # Download explicit file first
-            downloader = LlmsTxtDownloader(explicit_url)
-            content = downloader.download()
+            # Download explicit file while detecting the other variants
+            downloader = LlmsTxtDownloader(explicit_url, cache_dir=self._llms_txt_cache_dir(), client=self.http)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                detection = executor.submit(self._llms_txt_detector().detect_all) if variants is None else None
+                content = downloader.download()
+                if detection is not None:
+                    variants = detection.result()
 
             if content:
                 # Save explicit file with proper .md extension
@@ -525,30 +886,15 @@ class DocToSkillConverter:
                     f.write(content)
                 logger.info("  💾 Saved %s (%d chars)", filename, len(content))
 
-                # Also try to detect and download ALL other variants
-                detector = LlmsTxtDetector(self.base_url)
-                variants = detector.detect_all()
-
+                # Also download ALL other variants
                 if variants:
                     logger.info("\n🔍 Found %d total variant(s), downloading remaining...", len(variants))
-                    for variant_info in variants:
-                        url = variant_info['url']
-                        variant = variant_info['variant']
-
-                        # Skip the explicit one we already downloaded
-                        if url == explicit_url:
-                            continue
-
-                        logger.info("  📥 Downloading %s...", variant)
-                        extra_downloader = LlmsTxtDownloader(url)
-                        extra_content = extra_downloader.download()
-
-                        if extra_content:
-                            extra_filename = extra_downloader.get_proper_filename()
-                            extra_filepath = os.path.join(self.skill_dir, "references", extra_filename)
-                            with open(extra_filepath, 'w', encoding='utf-8') as f:
-                                f.write(extra_content)
-                            logger.info("     ✓ %s (%d chars)", extra_filename, len(extra_content))
+                    # Skip the explicit one we already downloaded
+                    remaining = [v for v in variants if v['url'] != explicit_url]
+                    for extra in self._download_llms_txt_variants(remaining).values():
+                        extra_filepath = os.path.join(self.skill_dir, "references", extra['filename'])
+                        with open(extra_filepath, 'w', encoding='utf-8') as f:
+                            f.write(extra['content'])
 
                 # Parse explicit file for skill building
                 parser = LlmsTxtParser(content)
@@ -557,15 +903,15 @@ class DocToSkillConverter:
                 if pages:
                     for page in pages:
                         self.save_page(page)
-                        self.pages.append(page)
+                        self._record_page(page)
 
                     self.llms_txt_detected = True
                     self.llms_txt_variant = 'explicit'
                     return True
 
         # Auto-detection: Find ALL variants
-        detector = LlmsTxtDetector(self.base_url)
-        variants = detector.detect_all()
+        if variants is None:
+            variants = self._llms_txt_detector().detect_all()
 
         if not variants:
             logger.info("ℹ️  No llms.txt found, using HTML scraping")
@@ -574,23 +920,7 @@ class DocToSkillConverter:
         logger.info("✅ Found %d llms.txt variant(s)", len(variants))
 
         # Download ALL variants
-        downloaded = {}
-        for variant_info in variants:
-            url = variant_info['url']
-            variant = variant_info['variant']
-
-            logger.info("  📥 Downloading %s...", variant)
-            downloader = LlmsTxtDownloader(url)
-            content = downloader.download()
-
-            if content:
-                filename = downloader.get_proper_filename()
-                downloaded[variant] = {
-                    'content': content,
-                    'filename': filename,
-                    'size': len(content)
-                }
-                logger.info("     ✓ %s (%d chars)", filename, len(content))
+        downloaded = self._download_llms_txt_variants(variants)
 
         if not downloaded:
             logger.warning("⚠️  Failed to download any variants, falling back to HTML scraping")
@@ -621,7 +951,7 @@ class DocToSkillConverter:
         # Save pages for skill building
         for page in pages:
             self.save_page(page)
-            self.pages.append(page)
+            self._record_page(page)
 
         self.llms_txt_detected = True
         self.llms_txt_variants = list(downloaded.keys())
@@ -638,13 +968,21 @@ class DocToSkillConverter:
             asyncio.run(self.scrape_all_async())
             return
 
-        # Try llms.txt first (unless dry-run or explicitly disabled)
+        # Try llms.txt first (unless dry-run or explicitly disabled). Auto-detection
+        # runs in the background while the HTML crawl starts speculatively.
+        speculative = False
         if not self.dry_run and not self.skip_llms_txt:
-            llms_result = self._try_llms_txt()
-            if llms_result:
-                logger.info("\n✅ Used llms.txt (%s) - skipping HTML scraping", self.llms_txt_variant)
-                self.save_summary()
-                return
+            if self.config.get('llms_txt_url') or self.use_playwright:
+                llms_result = self._try_llms_txt()
+                if llms_result:
+                    logger.info("\n✅ Used llms.txt (%s) - skipping HTML scraping", self.llms_txt_variant)
+                    self.save_summary()
+                    return
+            else:
+                self._start_llms_txt_probe()
+                speculative = True
+        pages_before = len(self.pages)
+        interrupted = False  # Stopped because the llms.txt probe found llms.txt
 
         # Use Playwright for SPA websites (if enabled in config)
         if self.use_playwright and not self.dry_run:
@@ -682,12 +1020,12 @@ class DocToSkillConverter:
 
         # Single-threaded mode (original sequential logic)
         if self.workers <= 1:
-            while self.pending_urls and (unlimited or len(self.visited_urls) < preview_limit):
-                url = self.pending_urls.popleft()
-
-                if url in self.visited_urls:
-                    continue
+            while self.frontier and (unlimited or len(self.visited_urls) < preview_limit):
+                if speculative and self._resolve_llms_txt_probe():
+                    interrupted = True
+                    break
 
+                url = self.frontier.pop()
                 self.visited_urls.add(url)
 
                 if self.dry_run:
@@ -695,7 +1033,7 @@ class DocToSkillConverter:
                     logger.info("  [Preview] %s", url)
                     try:
                         headers = {'User-Agent': 'Mozilla/5.0 (Documentation Scraper - Dry Run)'}
-                        response = requests.get(url, headers=headers, timeout=10)
+                        response = self.http.get(url, headers=headers, timeout=10)
                         soup = BeautifulSoup(response.content, 'html.parser')
 
                         main_selector = self.config.get('selectors', {}).get('main_content', 'div[role="main"]')
@@ -704,8 +1042,8 @@ class DocToSkillConverter:
                         if main:
                             for link in main.find_all('a', href=True):
                                 href = urljoin(url, link['href'])
-                                if self.is_valid_url(href) and href not in self.visited_urls:
-                                    self.pending_urls.append(href)
+                                if self.is_valid_url(href):
+                                    self.frontier.add(href)
                     except Exception as e:
                         # Failed to extract links in fast mode, continue anyway
                         logger.warning("⚠️  Warning: Could not extract links from %s: %s", url, e)
@@ -728,20 +1066,22 @@ class DocToSkillConverter:
             with ThreadPoolExecutor(max_workers=self.workers) as executor:
                 futures = []
 
-                while self.pending_urls and (unlimited or len(self.visited_urls) < preview_limit):
+                while self.frontier and (unlimited or len(self.visited_urls) < preview_limit):
+                    if speculative and self._resolve_llms_txt_probe():
+                        interrupted = True
+                        break
+
                     # Get next batch of URLs (thread-safe)
                     batch = []
-                    batch_size = min(self.workers * 2, len(self.pending_urls))
+                    batch_size = min(self.workers * 2, len(self.frontier))
 
                     with self.lock:
                         for _ in range(batch_size):
-                            if not self.pending_urls:
+                            url = self.frontier.pop()
+                            if url is None:
                                 break
-                            url = self.pending_urls.popleft()
-
-                            if url not in self.visited_urls:
-                                self.visited_urls.add(url)
-                                batch.append(url)
+                            self.visited_urls.add(url)
+                            batch.append(url)
 
                     # Submit batch to executor
                     for url in batch:
@@ -785,6 +1125,16 @@ class DocToSkillConverter:
                     with self.lock:
                         self.pages_scraped += 1
 
+        if speculative:
+            if self._finish_speculative_crawl(pages_before):
+                self.save_summary()
+                return
+            if interrupted:
+                # llms.txt turned out to be unusable, resume the HTML crawl
+                self.skip_llms_txt = True
+                self.scrape_all()
+                return
+
         if self.dry_run:
             logger.info("\n✅ Dry run complete: would scrape ~%d pages", len(self.visited_urls))
             if len(self.visited_urls) >= preview_limit:
@@ -801,15 +1151,27 @@ class DocToSkillConverter:
         compared to thread-based scraping, with lower memory overhead and better
         CPU utilization.
 
+        Uses a producer/consumer pipeline: ``workers`` long-lived coroutines pull
+        URLs from an asyncio.Queue and, as each page finishes, claim newly
+        discovered links from the frontier. A slow page only occupies its own
+        worker instead of stalling a whole batch.
+
         Performance: ~2-3x faster than sync mode with same worker count.
         """
-        # Try llms.txt first (unless dry-run or explicitly disabled)
+        # Try llms.txt first (unless dry-run or explicitly disabled). Auto-detection
+        # runs in the background while the HTML crawl starts speculatively.
+        speculative = False
         if not self.dry_run and not self.skip_llms_txt:
-            llms_result = self._try_llms_txt()
-            if llms_result:
-                logger.info("\n✅ Used llms.txt (%s) - skipping HTML scraping", self.llms_txt_variant)
-                self.save_summary()
-                return
+            if self.config.get('llms_txt_url'):
+                llms_result = self._try_llms_txt()
+                if llms_result:
+                    logger.info("\n✅ Used llms.txt (%s) - skipping HTML scraping", self.llms_txt_variant)
+                    self.save_summary()
+                    return
+            else:
+                self._start_llms_txt_probe()
+                speculative = True
+        interrupted = False  # Stopped because the llms.txt probe found llms.txt
 
         # HTML scraping (async version)
         logger.info("\n" + "=" * 60)
@@ -825,6 +1187,8 @@ class DocToSkillConverter:
         else:
             logger.info("Output: %s", self.data_dir)
             logger.info("Workers: %d concurrent tasks (async)", self.workers)
+            if self.parse_workers > 0:
+                logger.info("Parse workers: %d processes", self.parse_workers)
             logger.info("")
 
         max_pages = self.config.get('max_pages', DEFAULT_MAX_PAGES)
@@ -840,57 +1204,110 @@ class DocToSkillConverter:
 
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(self.workers)
+        queue: asyncio.Queue = asyncio.Queue()
+        failed: asyncio.Future = asyncio.get_running_loop().create_future()
+        start_time = time.time()
+        pages_before = len(self.pages)
+
+        def fill_queue() -> None:
+            """Claim URLs from the frontier until the queue has a small lookahead.
+
+            Each claimed URL counts against the page budget, so the crawl
+            stops exactly at max_pages. Nothing more is claimed once the
+            llms.txt probe found llms.txt.
+            """
+            nonlocal interrupted
+            if speculative and self._resolve_llms_txt_probe():
+                interrupted = True
+                return
+            while queue.qsize() < self.workers and (unlimited or len(self.visited_urls) < preview_limit):
+                url = self.frontier.pop()
+                if url is None:
+                    return
+                self.visited_urls.add(url)
+                self.in_flight_urls.add(url)
+                queue.put_nowait(url)
+
+        async def worker(client: httpx.AsyncClient) -> None:
+            """Long-lived consumer: scrape one URL, feed the frontier, repeat."""
+            while True:
+                url = await queue.get()
+                try:
+                    if self.dry_run:
+                        logger.info("  [Preview] %s", url)
+                    else:
+                        await self.scrape_page_async(url, semaphore, client)
+                        self.in_flight_urls.discard(url)
+                        self.pages_scraped += 1
 
-        # Create shared HTTP client with connection pooling
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            limits=httpx.Limits(max_connections=self.workers * 2)
-        ) as client:
-            tasks = []
-
-            while self.pending_urls and (unlimited or len(self.visited_urls) < preview_limit):
-                # Get next batch of URLs
-                batch = []
-                batch_size = min(self.workers * 2, len(self.pending_urls))
-
-                for _ in range(batch_size):
-                    if not self.pending_urls:
-                        break
-                    url = self.pending_urls.popleft()
-
-                    if url not in self.visited_urls:
-                        self.visited_urls.add(url)
-                        batch.append(url)
-
-                # Create async tasks for batch
-                for url in batch:
-                    if unlimited or len(self.visited_urls) <= preview_limit:
-                        if self.dry_run:
-                            logger.info("  [Preview] %s", url)
-                        else:
-                            task = asyncio.create_task(
-                                self.scrape_page_async(url, semaphore, client)
-                            )
-                            tasks.append(task)
-
-                # Wait for batch to complete before continuing
-                if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
-                    tasks = []
-                    self.pages_scraped = len(self.visited_urls)
-
-                    # Progress indicator
-                    if self.pages_scraped % 10 == 0 and not self.dry_run:
-                        logger.info("  [%d pages scraped]", self.pages_scraped)
-
-                    # Checkpoint saving
-                    if not self.dry_run and self.checkpoint_enabled:
-                        if self.pages_scraped % self.checkpoint_interval == 0:
+                        # Progress indicator
+                        if self.pages_scraped % 10 == 0:
+                            elapsed = time.time() - start_time
+                            rate = (len(self.pages) - pages_before) / elapsed if elapsed > 0 else 0
+                            logger.info("  [%d pages scraped, %.1f pages/sec]", self.pages_scraped, rate)
+
+                        # Checkpoint saving (in-flight URLs are stored as pending)
+                        if self.checkpoint_enabled and self.pages_scraped % self.checkpoint_interval == 0:
                             self.save_checkpoint()
+                finally:
+                    try:
+                        self.in_flight_urls.discard(url)
 
-            # Wait for any remaining tasks
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+                        # Claim newly discovered links before marking this URL done,
+                        # so queue.join() cannot return while work remains
+                        fill_queue()
+                    except Exception as e:
+                        # Claiming writes buffered pages and pops the frontier; a
+                        # failure stops the crawl instead of silently losing a worker
+                        if not failed.done():
+                            failed.set_exception(e)
+                    finally:
+                        queue.task_done()
+
+        # Offload CPU-bound parsing to a process pool if configured
+        if self.parse_workers > 0 and not self.dry_run:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                initializer=_init_parse_worker,
+                initargs=(self.config,)
+            )
+
+        # Create shared HTTP client with connection pooling
+        try:
+            async with httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=self.workers * 2)
+            ) as client:
+                fill_queue()
+                workers = [asyncio.create_task(worker(client)) for _ in range(self.workers)]
+                joined = asyncio.create_task(queue.join())
+                try:
+                    await asyncio.wait([joined, failed], return_when=asyncio.FIRST_COMPLETED)
+                    if failed.done():
+                        failed.result()  # Re-raise the worker's error
+                finally:
+                    joined.cancel()
+                    for task in workers:
+                        task.cancel()
+                    await asyncio.gather(joined, *workers, return_exceptions=True)
+        finally:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
+
+        elapsed = time.time() - start_time
+
+        if speculative:
+            if self._llms_probe is not None:
+                await asyncio.wrap_future(self._llms_probe)
+            if self._finish_speculative_crawl(pages_before):
+                self.save_summary()
+                return
+            if interrupted:
+                # llms.txt turned out to be unusable, resume the HTML crawl
+                self.skip_llms_txt = True
+                await self.scrape_all_async()
+                return
 
         if self.dry_run:
             logger.info("\n✅ Dry run complete: would scrape ~%d pages", len(self.visited_urls))
@@ -898,7 +1315,9 @@ class DocToSkillConverter:
                 logger.info("   (showing first %d, actual scraping may find more)", int(preview_limit))
             logger.info("\n💡 To actually scrape, run without --dry-run")
         else:
-            logger.info("\n✅ Scraped %d pages (async mode)", len(self.visited_urls))
+            scraped = len(self.pages) - pages_before
+            logger.info("\n✅ Scraped %d pages (async mode)", scraped)
+            logger.info("   Throughput: %.1f pages/sec over %.1fs", scraped / elapsed if elapsed > 0 else 0, elapsed)
             self.save_summary()
 
     async def _scrape_with_playwright(self) -> None:
@@ -925,10 +1344,10 @@ class DocToSkillConverter:
         logger.info("")
 
         # Create Playwright scraper
-        scraper = PlaywrightScraper(self.config)
+        scraper = PlaywrightScraper(self.config, rate_limiter=self.rate_limiter)
 
         # Scrape all URLs
-        urls_to_scrape = list(self.pending_urls)
+        urls_to_scrape = self.frontier.pending()
         max_pages = self.config.get('max_pages', DEFAULT_MAX_PAGES)
         if max_pages and max_pages > 0:
             urls_to_scrape = urls_to_scrape[:max_pages]
@@ -942,7 +1361,7 @@ class DocToSkillConverter:
                 soup = BeautifulSoup(result['html'], 'html.parser')
                 page = self.extract_content(soup, result['url'])
                 self.save_page(page)
-                self.pages.append(page)
+                self._record_page(page)
                 self.visited_urls.add(result['url'])
             except Exception as e:
                 logger.warning("  ⚠ Failed to process %s: %s", result['url'], e)
@@ -955,35 +1374,53 @@ class DocToSkillConverter:
 
     def save_summary(self) -> None:
         """Save scraping summary"""
+        if self.page_store is not None:
+            self.page_store.flush()
+
         summary = {
             'name': self.name,
             'total_pages': len(self.pages),
             'base_url': self.base_url,
             'llms_txt_detected': self.llms_txt_detected,
             'llms_txt_variant': self.llms_txt_variant,
-            'pages': [{'title': p['title'], 'url': p['url']} for p in self.pages]
+            'pages': self.pages
         }
 
+        if self.http_cache is not None:
+            summary['http_cache'] = {
+                'unchanged': self.http_cache.hits,
+                'fetched': self.http_cache.misses
+            }
+            if self.http_cache.hits:
+                logger.info("   HTTP cache: %d unchanged, %d fetched", self.http_cache.hits, self.http_cache.misses)
+
+        http_stats = self.http.stats()
+        if http_stats['requests']:
+            summary['http'] = http_stats
+            logger.info("   HTTP: %d requests over %d connections (avg connect %.1fms, TLS %.1fms, TTFB %.1fms)",
+                        http_stats['requests'], http_stats['new_connections'], http_stats['avg_connect_ms'],
+                        http_stats['avg_tls_ms'], http_stats['avg_ttfb_ms'])
+
+        if self.language_cache_file is not None:
+            language_cache = self.language_detector.cache
+            summary['language_cache'] = language_cache.stats()
+            language_cache.save(self.language_cache_file)
+            logger.info("   Language detection cache: %d hits, %d misses",
+                        language_cache.hits, language_cache.misses)
+
+        if self.rate_limiter.throttled:
+            summary['throttled_responses'] = self.rate_limiter.throttled
+            logger.info("   Throttled: %d responses (429/503), waited %.1fs in total",
+                        self.rate_limiter.throttled, self.rate_limiter.waited)
+
         with open(f"{self.data_dir}/summary.json", 'w', encoding='utf-8') as f:
             json.dump(summary, f, indent=2, ensure_ascii=False)
     
     def load_scraped_data(self) -> List[Dict[str, Any]]:
         """Load previously scraped data"""
-        pages = []
-        pages_dir = Path(self.data_dir) / "pages"
-        
-        if not pages_dir.exists():
+        if self.page_store is None:
             return []
-        
-        for json_file in pages_dir.glob("*.json"):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    pages.append(json.load(f))
-            except Exception as e:
-                logger.error("⚠️  Error loading scraped data file %s: %s: %s", json_file, type(e).__name__, e)
-                logger.error("   Suggestion: File may be corrupted, consider re-scraping with --fresh")
-        
-        return pages
+        return list(self.page_store.iter_pages())
     
     def smart_categorize(self, pages: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Improved categorization with better pattern matching"""
@@ -997,36 +1434,23 @@ class DocToSkillConverter:
         categories['other'] = []
         
         for page in pages:
-            url = page['url'].lower()
-            title = page['title'].lower()
-            content = page.get('content', '').lower()[:CONTENT_PREVIEW_LENGTH]  # Check first N chars for categorization
-            
-            categorized = False
-            
-            # Match against keywords
-            for cat, keywords in category_defs.items():
-                score = 0
-                for keyword in keywords:
-                    keyword = keyword.lower()
-                    if keyword in url:
-                        score += 3
-                    if keyword in title:
-                        score += 2
-                    if keyword in content:
-                        score += 1
-                
-                if score >= MIN_CATEGORIZATION_SCORE:  # Threshold for categorization
-                    categories[cat].append(page)
-                    categorized = True
-                    break
-            
-            if not categorized:
-                categories['other'].append(page)
+            categories[self.categorize_page(page, category_defs)].append(page)
         
         # Remove empty categories
         categories = {k: v for k, v in categories.items() if v}
         
         return categories
+
+    def categorize_page(self, page: Dict[str, Any], category_defs: Dict[str, List[str]]) -> str:
+        """Return the first category whose keywords score high enough for a page, or 'other'"""
+        content = page.get('content', '').lower()[:CONTENT_PREVIEW_LENGTH]  # Check first N chars for categorization
+
+        # Match against keywords: each keyword found scores 3 in the URL, 2 in the title, 1 in the content
+        if self._categorizer is None or self._categorizer[0] is not category_defs:
+            self._categorizer = (category_defs, get_categorizer(category_defs))
+        category = self._categorizer[1].first([(page['url'], 3), (page['title'], 2), (content, 1)],
+                                              MIN_CATEGORIZATION_SCORE)
+        return 'other' if category is None else category
     
     def infer_categories(self, pages: List[Dict[str, Any]]) -> Dict[str, List[str]]:
         """Infer categories from URL patterns (IMPROVED)"""
@@ -1056,73 +1480,94 @@ class DocToSkillConverter:
         
         return categories
     
-    def generate_quick_reference(self, pages: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    def generate_quick_reference(self, pages: Iterable[Dict[str, Any]]) -> List[Dict[str, str]]:
         """Generate quick reference from common patterns (NEW FEATURE)"""
         quick_ref = []
         
-        # Collect all patterns
-        all_patterns = []
-        for page in pages:
-            all_patterns.extend(page.get('patterns', []))
-        
-        # Get most common code patterns
+        # Get most common code patterns (pages are consumed lazily, stop at 15)
         seen_codes = set()
-        for pattern in all_patterns:
-            code = pattern['code']
-            if code not in seen_codes and len(code) < 300:
-                quick_ref.append(pattern)
-                seen_codes.add(code)
-                if len(quick_ref) >= 15:
-                    break
+        for page in pages:
+            for pattern in page.get('patterns', []):
+                code = pattern['code']
+                if code not in seen_codes and len(code) < 300:
+                    quick_ref.append(pattern)
+                    seen_codes.add(code)
+                    if len(quick_ref) >= 15:
+                        return quick_ref
         
         return quick_ref
     
-    def create_reference_file(self, category: str, pages: List[Dict[str, Any]]) -> None:
-        """Create enhanced reference file"""
-        if not pages:
+    def create_reference_file(
+        self,
+        category: str,
+        pages: Iterable[Dict[str, Any]],
+        page_count: Optional[int] = None
+    ) -> None:
+        """Create enhanced reference file.
+
+        Pages are written one at a time, so a generator keeps memory bounded
+        to a single page regardless of category size.
+
+        Args:
+            category: Category name (file is references/{category}.md)
+            pages: Pages of the category, in order
+            page_count: Number of pages (required up front for the header;
+                        computed by materializing pages if omitted)
+        """
+        if page_count is None:
+            pages = list(pages)
+            page_count = len(pages)
+        if not page_count:
             return
         
-        lines = []
-        lines.append(f"# {self.name.title()} - {category.replace('_', ' ').title()}\n")
-        lines.append(f"**Pages:** {len(pages)}\n")
-        lines.append("---\n")
-        
-        for page in pages:
-            lines.append(f"## {page['title']}\n")
-            lines.append(f"**URL:** {page['url']}\n")
-            
-            # Table of contents from headings
-            if page.get('headings'):
-                lines.append("**Contents:**")
-                for h in page['headings'][:10]:
-                    level = int(h['level'][1]) if len(h['level']) > 1 else 1
-                    indent = "  " * max(0, level - 2)
-                    lines.append(f"{indent}- {h['text']}")
-                lines.append("")
-            
-            # Content (NO TRUNCATION)
-            if page.get('content'):
-                lines.append(page['content'])
-                lines.append("")
-
-            # Code examples with language (NO TRUNCATION)
-            if page.get('code_samples'):
-                lines.append("**Examples:**\n")
-                for i, sample in enumerate(page['code_samples'][:4], 1):
-                    lang = sample.get('language', 'unknown')
-                    code = sample.get('code', sample if isinstance(sample, str) else '')
-                    lines.append(f"Example {i} ({lang}):")
-                    lines.append(f"```{lang}")
-                    lines.append(code)  # Full code, no truncation
-                    lines.append("```\n")
-            
-            lines.append("---\n")
+        header = []
+        header.append(f"# {self.name.title()} - {category.replace('_', ' ').title()}\n")
+        header.append(f"**Pages:** {page_count}\n")
+        header.append("---\n")
         
         filepath = os.path.join(self.skill_dir, "references", f"{category}.md")
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+            f.write('\n'.join(header))
+            for page in pages:
+                f.write('\n')
+                f.write('\n'.join(self._format_reference_page(page)))
+
+        logger.info("  ✓ %s.md (%d pages)", category, page_count)
 
-        logger.info("  ✓ %s.md (%d pages)", category, len(pages))
+    def _format_reference_page(self, page: Dict[str, Any]) -> List[str]:
+        """Return the reference file lines of one page"""
+        lines = []
+        lines.append(f"## {page['title']}\n")
+        lines.append(f"**URL:** {page['url']}\n")
+        
+        # Table of contents from headings
+        if page.get('headings'):
+            lines.append("**Contents:**")
+            for h in page['headings'][:10]:
+                level = int(h['level'][1]) if len(h['level']) > 1 else 1
+                indent = "  " * max(0, level - 2)
+                lines.append(f"{indent}- {h['text']}")
+            lines.append("")
+        
+        # Content (NO TRUNCATION)
+        if page.get('content'):
+            lines.append(page['content'])
+            lines.append("")
+
+        # Code examples with language (NO TRUNCATION)
+        if page.get('code_samples'):
+            lines.append("**Examples:**\n")
+            for i, sample in enumerate(page['code_samples'][:4], 1):
+                lang = sample.get('language', 'unknown')
+                code = sample.get('code', sample if isinstance(sample, str) else '')
+                lines.append(f"Example {i} ({lang}):")
+                lines.append(f"```{lang}")
+                lines.append(code)  # Full code, no truncation
+                lines.append("```\n")
+        
+        lines.append("---\n")
+
+        return lines
     
     def create_enhanced_skill_md(self, categories: Dict[str, List[Dict[str, Any]]], quick_ref: List[Dict[str, str]]) -> None:
         """Create SKILL.md with actual examples (IMPROVED)"""
@@ -1252,7 +1697,7 @@ To refresh this skill with updated documentation:
 
         logger.info("  ✓ SKILL.md (enhanced with %d examples)", len(example_codes))
     
-    def create_index(self, categories: Dict[str, List[Dict[str, Any]]]) -> None:
+    def create_index(self, categories: Dict[str, List[Any]]) -> None:
         """Create navigation index"""
         lines = []
         lines.append(f"# {self.name.title()} Documentation Index\n")
@@ -1264,61 +1709,234 @@ To refresh this skill with updated documentation:
             lines.append(f"**Pages:** {len(pages)}\n")
         
         filepath = os.path.join(self.skill_dir, "references", "index.md")
+        content = '\n'.join(lines)
+
+        # Leave the file untouched if nothing changed (keeps mtimes stable for packaging)
+        if os.path.exists(filepath):
+            with open(filepath, 'r', encoding='utf-8') as f:
+                if f.read() == content:
+                    return
+
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+            f.write(content)
 
         logger.info("  ✓ index.md")
     
-    def build_skill(self) -> bool:
+    def load_build_manifest(self) -> Dict[str, Any]:
+        """Load the manifest written by the previous build (empty if missing or unreadable)"""
+        if not os.path.exists(self.build_manifest_file):
+            return {}
+        try:
+            with open(self.build_manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("⚠️  Ignoring unreadable build manifest: %s", e)
+            return {}
+        return manifest if manifest.get('version') == BUILD_MANIFEST_VERSION else {}
+
+    def save_build_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Save the build manifest used by the next incremental build"""
+        with open(self.build_manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+
+    def _load_build_page(self, url: str) -> Dict[str, Any]:
+        """Load one page from the page store (not cached, callers drop it when done)"""
+        return self.page_store.get(url)
+
+    def _scan_pages(self, previous: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Collect the content hash of every stored page, reusing unchanged category assignments.
+
+        Args:
+            previous: Page entries from the previous manifest (url -> entry)
+
+        Returns:
+            dict: url -> {'hash', 'category'} in store order.
+                  'category' is None for new or changed pages.
+        """
+        entries: Dict[str, Dict[str, Any]] = {}
+        for url, page_hash in self.page_store.iter_hashes():
+            old = previous.get(url)
+            entries[url] = {
+                'hash': page_hash,
+                'category': old['category'] if old and old['hash'] == page_hash else None,
+            }
+        return entries
+
+    def build_skill(self, incremental: Optional[bool] = None) -> bool:
         """Build the skill from scraped data.
 
-        Loads scraped JSON files, categorizes pages, extracts patterns,
-        and generates SKILL.md and reference files.
+        Streams pages from the page store: categorization keeps only page
+        URLs, each reference file is written page by page, and the quick
+        reference and SKILL.md examples are collected with bounded
+        accumulators, so memory stays flat regardless of the number of pages.
+
+        A manifest of per-page content hashes and category assignments is
+        saved after every build. In incremental mode it is used to skip
+        unchanged pages and to leave reference files (and SKILL.md) whose
+        page set and content did not change untouched on disk.
+
+        Args:
+            incremental: Reuse the previous build manifest (default: config 'incremental_build')
 
         Returns:
             bool: True if build succeeded, False otherwise
         """
+        if incremental is None:
+            incremental = self.incremental_build
+
         logger.info("\n" + "=" * 60)
-        logger.info("BUILDING SKILL: %s", self.name)
+        logger.info("BUILDING SKILL: %s%s", self.name, " (incremental)" if incremental else "")
         logger.info("=" * 60 + "\n")
 
+        previous = self.load_build_manifest()
+        reuse = previous if incremental else {}
+
         # Load data
         logger.info("Loading scraped data...")
-        pages = self.load_scraped_data()
+        entries = self._scan_pages(reuse.get('pages', {})) if self.page_store is not None else {}
 
-        if not pages:
+        if not entries:
             logger.error("✗ No scraped data found!")
             return False
 
-        logger.info("  ✓ Loaded %d pages\n", len(pages))
+        changed = sum(1 for entry in entries.values() if entry['category'] is None)
+        logger.info("  ✓ Loaded %d pages (%d new or changed)\n", len(entries), changed)
 
         # Categorize
         logger.info("Categorizing pages...")
-        categories = self.smart_categorize(pages)
-        logger.info("  ✓ Created %d categories\n", len(categories))
+        category_defs = self.config.get('categories', {})
+        if not category_defs:
+            category_defs = self.infer_categories([{'url': url} for url in entries])
+        categories_digest = hashlib.sha256(
+            json.dumps([category_defs, MIN_CATEGORIZATION_SCORE, CONTENT_PREVIEW_LENGTH], sort_keys=True).encode()
+        ).hexdigest()
+        recategorize = categories_digest != reuse.get('categories_digest')
+
+        categories: Dict[str, List[str]] = {cat: [] for cat in category_defs.keys()}
+        categories['other'] = []
+        for url, entry in entries.items():
+            if recategorize or entry['category'] is None:
+                entry['category'] = self.categorize_page(self._load_build_page(url), category_defs)
+            categories[entry['category']].append(url)
 
-        # Generate quick reference
-        logger.info("Generating quick reference...")
-        quick_ref = self.generate_quick_reference(pages)
-        logger.info("  ✓ Extracted %d patterns\n", len(quick_ref))
+        # Remove empty categories
+        categories = {k: v for k, v in categories.items() if v}
+        logger.info("  ✓ Created %d categories\n", len(categories))
 
-        # Create reference files
+        # Create reference files (only for categories whose page set or content changed)
         logger.info("Creating reference files...")
-        for cat, cat_pages in categories.items():
-            self.create_reference_file(cat, cat_pages)
+        reference_digests: Dict[str, str] = {}
+        skipped = 0
+        for cat, urls in categories.items():
+            digest = hashlib.sha256(
+                '\n'.join(entries[url]['hash'] for url in urls).encode()
+            ).hexdigest()
+            reference_digests[cat] = digest
+            ref_path = os.path.join(self.skill_dir, "references", f"{cat}.md")
+            if reuse.get('references', {}).get(cat) == digest and os.path.exists(ref_path):
+                skipped += 1
+                continue
+            self.create_reference_file(cat, (self._load_build_page(url) for url in urls), len(urls))
+
+        if skipped:
+            logger.info("  ↺ %d unchanged reference file(s) left untouched", skipped)
+
+        # Remove reference files of categories that no longer exist
+        for cat in previous.get('references', {}):
+            ref_path = os.path.join(self.skill_dir, "references", f"{cat}.md")
+            if cat not in categories and os.path.exists(ref_path):
+                os.remove(ref_path)
+                logger.info("  ✗ Removed %s.md (category now empty)", cat)
 
         # Create index
         self.create_index(categories)
         logger.info("")
 
-        # Create enhanced SKILL.md
-        logger.info("Creating SKILL.md...")
-        self.create_enhanced_skill_md(categories, quick_ref)
+        # SKILL.md depends on every category, the quick reference and the description
+        skill_digest = hashlib.sha256(json.dumps(
+            [reference_digests, self.config.get('description')], sort_keys=True
+        ).encode()).hexdigest()
+        skill_md_path = os.path.join(self.skill_dir, "SKILL.md")
+        if reuse.get('skill_digest') == skill_digest and os.path.exists(skill_md_path):
+            logger.info("SKILL.md unchanged, left untouched")
+        else:
+            # Generate quick reference
+            logger.info("Generating quick reference...")
+            quick_ref = self.generate_quick_reference(self.page_store.iter_pages())
+            logger.info("  ✓ Extracted %d patterns\n", len(quick_ref))
+
+            # Create enhanced SKILL.md (only the first pages of each category are used)
+            logger.info("Creating SKILL.md...")
+            self.create_enhanced_skill_md(
+                {cat: [self._load_build_page(url) for url in urls[:3]] for cat, urls in categories.items()},
+                quick_ref
+            )
+
+        # Peak RSS of the whole process: in a scrape-then-build run it covers the scrape too
+        peak_mb = peak_memory_mb()
+        self.save_build_manifest({
+            'version': BUILD_MANIFEST_VERSION,
+            'categories_digest': categories_digest,
+            'pages': entries,
+            'references': reference_digests,
+            'skill_digest': skill_digest,
+            'build_summary': {
+                'pages': len(entries),
+                'categories': len(categories),
+                'process_peak_memory_mb': round(peak_mb, 1) if peak_mb is not None else None,
+            },
+        })
 
         logger.info("\n✅ Skill built: %s/", self.skill_dir)
+        logger.info("   Pages: %d  Categories: %d", len(entries), len(categories))
+        if peak_mb is not None:
+            logger.info("   Peak memory (whole process): %.1f MB", peak_mb)
         return True
 
 
+def peak_memory_mb() -> Optional[float]:
+    """Return the peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux/BSD
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+# Per-process extractor used by the async parse pool (see parse_workers)
+_parse_worker_extractor: Optional[PageExtractor] = None
+
+
+def _init_parse_worker(config: Dict[str, Any]) -> None:
+    """Process pool initializer: build one page extractor per worker."""
+    global _parse_worker_extractor
+    detector = LanguageDetector(min_confidence=0.15, cache=DetectionCache(),
+                                max_chars=config.get('language_detection_max_chars'))
+    _parse_worker_extractor = PageExtractor(config, detector)
+
+
+def _parse_page_in_worker(content: bytes, url: str) -> ParseResult:
+    """Parse a fetched page in a pool worker.
+
+    Returns the page dict together with the language detections and CSS
+    class languages it added, which the parent merges into its own
+    detector (see DocToSkillConverter._merge_parse_result) so they reach
+    language_cache.json and the bounded-mode priors.
+    """
+    assert _parse_worker_extractor is not None, "parse worker not initialized"
+    detector = _parse_worker_extractor.language_detector
+    classes_before = Counter(detector.class_languages)
+    detector.cache.journal = []
+    try:
+        soup = BeautifulSoup(content, 'html.parser')
+        page = _parse_worker_extractor.extract_content(soup, url)
+        return page, detector.cache.journal, detector.class_languages - classes_before
+    finally:
+        detector.cache.journal = None
+
+
 def validate_config(config: Dict[str, Any]) -> Tuple[List[str], List[str]]:
     """Validate configuration structure and values.
 
@@ -1394,6 +2012,16 @@ def validate_config(config: Dict[str, Any]) -> Tuple[List[str], List[str]]:
         except (ValueError, TypeError):
             errors.append(f"'rate_limit' must be a number (got {config['rate_limit']})")
 
+    # Validate page_store
+    if 'page_store' in config and config['page_store'] not in PAGE_STORE_BACKENDS:
+        errors.append(f"Invalid page_store: '{config['page_store']}' (use one of: {', '.join(PAGE_STORE_BACKENDS)})")
+
+    # Validate parse_workers
+    if 'parse_workers' in config:
+        parse_workers = config['parse_workers']
+        if not isinstance(parse_workers, int) or parse_workers < 0:
+            errors.append(f"'parse_workers' must be a non-negative integer (got {parse_workers})")
+
     # Validate max_pages
     if 'max_pages' in config:
         max_p_value = config['max_pages']
@@ -1588,6 +2216,8 @@ def setup_argument_parser() -> argparse.ArgumentParser:
                        help='Skill description')
     parser.add_argument('--skip-scrape', action='store_true',
                        help='Skip scraping, use existing data')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only rebuild reference files whose pages changed since the last build')
     parser.add_argument('--dry-run', action='store_true',
                        help='Preview what will be scraped without actually scraping')
     parser.add_argument('--enhance', action='store_true',
@@ -1608,8 +2238,14 @@ def setup_argument_parser() -> argparse.ArgumentParser:
                        help='Number of parallel workers for faster scraping (default: 1, max: 10)')
     parser.add_argument('--async', dest='async_mode', action='store_true',
                        help='Enable async mode for better parallel performance (2-3x faster than threads)')
+    parser.add_argument('--parse-workers', type=int, metavar='N',
+                       help='Async mode: parse HTML in N worker processes instead of on the event loop (default: 0)')
     parser.add_argument('--no-rate-limit', action='store_true',
                        help='Disable rate limiting completely (same as --rate-limit 0)')
+    parser.add_argument('--no-http-cache', action='store_true',
+                       help='Ignore cached ETag/Last-Modified validators and re-download every page')
+    parser.add_argument('--no-language-cache', action='store_true',
+                       help='Do not load or save detected code languages between runs')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose output (DEBUG level logging)')
     parser.add_argument('--quiet', '-q', action='store_true',
@@ -1671,6 +2307,18 @@ def get_configuration(args: argparse.Namespace) -> Dict[str, Any]:
         else:
             logger.info("⚡ Rate limit override: %ss per page", args.rate_limit)
 
+    # Apply CLI override for incremental builds
+    if args.incremental:
+        config['incremental_build'] = True
+
+    # Apply CLI override for the conditional HTTP cache
+    if args.no_http_cache:
+        config['http_cache'] = False
+
+    # Apply CLI override for the persisted language detection cache
+    if args.no_language_cache:
+        config['language_cache'] = False
+
     # Apply CLI overrides for worker count
     if args.workers:
         # Validate workers count
@@ -1685,6 +2333,13 @@ def get_configuration(args: argparse.Namespace) -> Dict[str, Any]:
         if args.workers > 1:
             logger.info("🚀 Parallel scraping enabled: %d workers", args.workers)
 
+    # Apply CLI override for parse worker processes
+    if args.parse_workers is not None:
+        if args.parse_workers < 0:
+            logger.error("❌ Error: --parse-workers must be 0 or more (got %d)", args.parse_workers)
+            sys.exit(1)
+        config['parse_workers'] = args.parse_workers
+
     # Apply CLI override for async mode
     if args.async_mode:
         config['async_mode'] = True
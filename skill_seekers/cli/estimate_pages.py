@@ -20,6 +20,8 @@ from skill_seekers.cli.constants import (
     DEFAULT_MAX_DISCOVERY,
     DISCOVERY_THRESHOLD
 )
+from skill_seekers.cli.url_frontier import URLFrontier
+from skill_seekers.cli.http_client import HTTPClient
 
 
 def estimate_pages(config, max_discovery=DEFAULT_MAX_DISCOVERY, timeout=30):
@@ -39,8 +41,8 @@ def estimate_pages(config, max_discovery=DEFAULT_MAX_DISCOVERY, timeout=30):
     url_patterns = config.get('url_patterns', {'include': [], 'exclude': []})
     rate_limit = config.get('rate_limit', DEFAULT_RATE_LIMIT)
 
-    visited = set()
-    pending = list(start_urls)
+    frontier = URLFrontier(start_urls)
+    client = HTTPClient(timeout=timeout)  # Keep-alive pool: one connection for the whole estimate
     discovered = 0
 
     include_patterns = url_patterns.get('include', [])
@@ -65,14 +67,8 @@ def estimate_pages(config, max_discovery=DEFAULT_MAX_DISCOVERY, timeout=30):
     start_time = time.time()
 
     # Loop condition: stop if no more URLs, or if limit reached (when not unlimited)
-    while pending and (unlimited or discovered < max_discovery):
-        url = pending.pop(0)
-
-        # Skip if already visited
-        if url in visited:
-            continue
-
-        visited.add(url)
+    while frontier and (unlimited or discovered < max_discovery):
+        url = frontier.pop()
         discovered += 1
 
         # Progress indicator
@@ -82,16 +78,15 @@ def estimate_pages(config, max_discovery=DEFAULT_MAX_DISCOVERY, timeout=30):
             print(f"⏳ Discovered: {discovered} pages ({rate:.1f} pages/sec)", end='\r')
 
         try:
-            # HEAD request first to check if page exists (faster)
-            head_response = requests.head(url, timeout=timeout, allow_redirects=True)
+            # Streamed GET: headers arrive first, so non-HTML bodies are never downloaded
+            response = client.get(url, stream=True)
 
             # Skip non-HTML content
-            content_type = head_response.headers.get('Content-Type', '')
+            content_type = response.headers.get('Content-Type', '')
             if 'text/html' not in content_type:
+                response.close()
                 continue
 
-            # Now GET the page to find links
-            response = requests.get(url, timeout=timeout)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -109,9 +104,8 @@ def estimate_pages(config, max_discovery=DEFAULT_MAX_DISCOVERY, timeout=30):
                 if not is_valid_url(full_url, base_url, include_patterns, exclude_patterns):
                     continue
 
-                # Add to pending if not visited
-                if full_url not in visited and full_url not in pending:
-                    pending.append(full_url)
+                # Add to pending if not already seen
+                frontier.add(full_url)
 
             # Rate limiting
             time.sleep(rate_limit)
@@ -124,16 +118,19 @@ def estimate_pages(config, max_discovery=DEFAULT_MAX_DISCOVERY, timeout=30):
             pass
 
     elapsed = time.time() - start_time
+    http_stats = client.stats()
+    client.close()
 
     # Results
     results = {
         'discovered': discovered,
-        'pending': len(pending),
-        'estimated_total': discovered + len(pending),
+        'pending': len(frontier),
+        'estimated_total': discovered + len(frontier),
         'elapsed_seconds': round(elapsed, 2),
         'discovery_rate': round(discovered / elapsed if elapsed > 0 else 0, 2),
         'hit_limit': (not unlimited) and (discovered >= max_discovery),
-        'unlimited': unlimited
+        'unlimited': unlimited,
+        'http': http_stats
     }
 
     return results
@@ -179,6 +176,12 @@ def print_results(results, config):
     print(f"⏱️  Time Elapsed: {results['elapsed_seconds']}s")
     print(f"⚡ Discovery Rate: {results['discovery_rate']} pages/sec")
 
+    http_stats = results.get('http')
+    if http_stats and http_stats['requests']:
+        print(f"🔌 HTTP: {http_stats['requests']} requests over {http_stats['new_connections']} connections "
+              f"(avg connect {http_stats['avg_connect_ms']}ms, TLS {http_stats['avg_tls_ms']}ms, "
+              f"TTFB {http_stats['avg_ttfb_ms']}ms)")
+
     if results.get('unlimited', False):
         print()
         print("✅ UNLIMITED MODE - Discovered all reachable pages")
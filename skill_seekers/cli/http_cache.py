@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Conditional HTTP cache for re-scrapes.
+
+Stores the validators of every fetched URL (ETag, Last-Modified) together
+with a hash of the response body, so later runs can send
+``If-None-Match``/``If-Modified-Since`` and skip unchanged pages. Each URL
+gets one small JSON entry under the cache directory, sharded into
+subdirectories by key prefix so no directory grows past a few hundred
+files on large sites; callers may attach extra fields or keep a copy of
+the body itself.
+
+Callers that reuse what they built from a response (e.g. a parsed page)
+pass a fingerprint of the settings it was built with. Entries stored
+under another fingerprint count as absent, so changed settings make every
+page be fetched and processed again.
+
+Usage:
+    from skill_seekers.cli.http_cache import HTTPCache
+
+    cache = HTTPCache('output/react_data/http_cache', fingerprint=settings_hash)
+    headers.update(cache.conditional_headers(url))
+    response = requests.get(url, headers=headers)
+    if response.status_code == 304:
+        entry = cache.get(url)
+    else:
+        cache.store(url, response.headers, response.content)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPCache:
+    """On-disk store of HTTP validators and body hashes, keyed by URL."""
+
+    def __init__(self, cache_dir: Union[str, Path], fingerprint: Optional[str] = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one entry per URL (created if missing)
+            fingerprint: Hash of the settings responses are processed with.
+                Entries stored under a different fingerprint are ignored
+        """
+        self.cache_dir = Path(cache_dir)
+        self.fingerprint = fingerprint
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0  # Responses confirmed unchanged (304 or same body hash)
+        self.misses = 0  # Responses that had to be processed again
+        self._lock = threading.Lock()
+        self._migrate_flat_entries()
+
+    def _migrate_flat_entries(self) -> None:
+        """Move entries written by versions without sharding into their shard directory."""
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(('.json', '.body')):
+                shard = self.cache_dir / entry.name[:2]
+                shard.mkdir(exist_ok=True)
+                os.replace(entry.path, shard / entry.name)
+
+    @staticmethod
+    def body_hash(body: bytes) -> str:
+        """Return the SHA-256 hex digest of a response body."""
+        return hashlib.sha256(body).hexdigest()
+
+    def _entry_path(self, url: str, suffix: str = '.json') -> Path:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+        return self.cache_dir / key[:2] / f"{key}{suffix}"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cache entry for a URL, or None if absent, unreadable or stale."""
+        path = self._entry_path(url)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable HTTP cache entry %s: %s", path, e)
+            return None
+        if entry.get('url') != url or entry.get('fingerprint') != self.fingerprint:
+            return None
+        return entry
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Return If-None-Match/If-Modified-Since headers for a cached URL."""
+        entry = self.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def is_unchanged(self, url: str, status_code: int, body: bytes) -> bool:
+        """Return True if a response shows the cached copy of a URL is still current.
+
+        A 304 is always unchanged; a 200 is unchanged when its body hash
+        matches the cached one (for servers that ignore conditional headers).
+        """
+        if status_code == 304:
+            return self.get(url) is not None
+        if status_code != 200:
+            return False
+        entry = self.get(url)
+        return bool(entry) and entry.get('body_hash') == self.body_hash(body)
+
+    def store(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        body: bytes,
+        keep_body: bool = False,
+        **extra: Any
+    ) -> None:
+        """Record the validators and body hash of a fresh 200 response.
+
+        Args:
+            url: Requested URL
+            headers: Response headers (case-insensitive mapping)
+            body: Raw response body
+            keep_body: Also store the body, for callers that need it on a 304
+            **extra: Additional fields to keep in the entry
+        """
+        entry: Dict[str, Any] = {
+            'url': url,
+            'etag': headers.get('ETag') or headers.get('etag'),
+            'last_modified': headers.get('Last-Modified') or headers.get('last-modified'),
+            'body_hash': self.body_hash(body),
+        }
+        if self.fingerprint is not None:
+            entry['fingerprint'] = self.fingerprint
+        entry.update(extra)
+
+        if keep_body:
+            self._write_atomic(self._entry_path(url, '.body'), body)
+        self._write_atomic(self._entry_path(url), json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+
+    def load_body(self, url: str) -> Optional[bytes]:
+        """Return the stored body of a URL cached with keep_body=True."""
+        path = self._entry_path(url, '.body')
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def record(self, unchanged: bool) -> None:
+        """Update hit/miss counters (thread-safe)."""
+        with self._lock:
+            if unchanged:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
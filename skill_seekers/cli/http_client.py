@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Pooled, thread-safe HTTP client shared by the scraping tools.
+
+Wraps one requests.Session with keep-alive connection pools per host, so
+repeated requests to the same documentation site reuse TCP/TLS
+connections instead of paying a new handshake per page. Transient
+network errors and server error statuses (5xx, 429) are retried with
+utils.retry_with_backoff.
+
+Every response gets a ``timing`` attribute (RequestTiming) with the
+connect, TLS and time-to-first-byte durations of the request, and the
+client keeps running totals so the gain from connection reuse is visible.
+
+Usage:
+    from skill_seekers.cli.http_client import HTTPClient
+
+    client = HTTPClient(pool_maxsize=8)
+    response = client.get('https://docs.example.com/intro')
+    print(response.timing.ttfb, response.timing.reused)
+    print(client.stats())
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from skill_seekers.cli.utils import retry_with_backoff
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Documentation Scraper)'
+
+# Network errors worth retrying
+TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+# Response statuses worth retrying; the last response is returned if they persist
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Connection setup times of the request currently running on this thread
+_connection_timings = threading.local()
+
+
+@dataclass
+class RequestTiming:
+    """Timings of one HTTP request, in seconds."""
+    connect: float = 0.0  # TCP connect (0 if a pooled connection was reused)
+    tls: float = 0.0  # TLS handshake (0 for http:// or reused connections)
+    ttfb: float = 0.0  # Request start until response headers were received
+    total: float = 0.0  # Request start until the body was read (or headers, if streamed)
+    reused: bool = True  # Served over an already open keep-alive connection
+
+
+class _RetryableStatus(requests.HTTPError):
+    """Raised inside a request attempt to retry a response with a retryable status."""
+
+
+class _TimedConnectionMixin:
+    """Records TCP connect and TLS handshake durations of new connections."""
+
+    uses_tls = False
+
+    def _new_conn(self):  # type: ignore[no-untyped-def]
+        start = time.perf_counter()
+        sock = super()._new_conn()  # type: ignore[misc]
+        _connection_timings.connect = time.perf_counter() - start
+        return sock
+
+    def connect(self) -> None:
+        _connection_timings.connect = 0.0
+        start = time.perf_counter()
+        super().connect()  # type: ignore[misc]
+        elapsed = time.perf_counter() - start
+        if self.uses_tls:
+            _connection_timings.tls = max(0.0, elapsed - _connection_timings.connect)
+        _connection_timings.new = True
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    uses_tls = True
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools record connection setup timings."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool,
+        }
+
+
+class HTTPClient:
+    """Thread-safe HTTP client with per-host keep-alive pools, retries and timings."""
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        timeout: float = 30,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        user_agent: str = DEFAULT_USER_AGENT,
+        retry_statuses: Iterable[int] = RETRY_STATUS_CODES
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            pool_connections: Number of hosts to keep connection pools for
+            pool_maxsize: Keep-alive connections per host (use >= worker threads)
+            timeout: Default request timeout in seconds
+            max_retries: Attempts per request on connection errors/timeouts
+                and retryable statuses
+            retry_base_delay: First retry delay in seconds, doubles per retry
+            user_agent: Default User-Agent header
+            retry_statuses: Response statuses to retry (callers that handle
+                throttling themselves can leave out 429/503)
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_statuses = frozenset(retry_statuses)
+
+        adapter = _TimedAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['User-Agent'] = user_agent
+
+        self._lock = threading.Lock()
+        self._totals = {'requests': 0, 'new_connections': 0, 'connect': 0.0, 'tls': 0.0, 'ttfb': 0.0}
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        retries: Optional[int] = None,
+        **kwargs: Any
+    ) -> requests.Response:
+        """Send a request through the pooled session.
+
+        Args:
+            method: HTTP method
+            url: URL to request
+            retries: Attempts on connection errors/timeouts and retryable
+                statuses (default: max_retries)
+            **kwargs: Passed to requests.Session.request (headers, timeout, stream, ...)
+
+        Returns:
+            requests.Response with a ``timing`` attribute (RequestTiming).
+            Error statuses are not raised: if a retryable status persists
+            the last response is returned
+
+        Raises:
+            requests.RequestException: If the request still fails after all retries
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        attempts = retries if retries is not None else self.max_retries
+        made = 0
+
+        def attempt() -> Union[requests.Response, requests.RequestException]:
+            nonlocal made
+            made += 1
+            _connection_timings.connect = 0.0
+            _connection_timings.tls = 0.0
+            _connection_timings.new = False
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except TRANSIENT_ERRORS:
+                raise
+            except requests.RequestException as e:
+                # Not transient (invalid URL, too many redirects, ...): returned, so it is not retried
+                return e
+            response.timing = RequestTiming(  # type: ignore[attr-defined]
+                connect=_connection_timings.connect,
+                tls=_connection_timings.tls,
+                ttfb=response.elapsed.total_seconds(),
+                total=time.perf_counter() - start,
+                reused=not _connection_timings.new,
+            )
+            if response.status_code in self.retry_statuses and made < attempts:
+                # Release the connection of a streamed response before retrying
+                response.close()
+                raise _RetryableStatus(f"HTTP {response.status_code}", response=response)
+            return response
+
+        if attempts > 1:
+            result = retry_with_backoff(
+                attempt,
+                max_attempts=attempts,
+                base_delay=self.retry_base_delay,
+                operation_name=f"{method} {url}"
+            )
+        else:
+            result = attempt()
+
+        if isinstance(result, requests.RequestException):
+            raise result
+
+        self._record(result.timing)  # type: ignore[attr-defined]
+        return result
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request (see request())."""
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a HEAD request (see request())."""
+        return self.request('HEAD', url, **kwargs)
+
+    def _record(self, timing: RequestTiming) -> None:
+        with self._lock:
+            self._totals['requests'] += 1
+            self._totals['new_connections'] += 0 if timing.reused else 1
+            self._totals['connect'] += timing.connect
+            self._totals['tls'] += timing.tls
+            self._totals['ttfb'] += timing.ttfb
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request counts and average timings (milliseconds) so far."""
+        with self._lock:
+            totals = dict(self._totals)
+        requests_sent = totals['requests']
+        new_connections = totals['new_connections']
+        return {
+            'requests': requests_sent,
+            'new_connections': new_connections,
+            'reused_connections': requests_sent - new_connections,
+            'avg_connect_ms': round(1000 * totals['connect'] / new_connections, 2) if new_connections else 0.0,
+            'avg_tls_ms': round(1000 * totals['tls'] / new_connections, 2) if new_connections else 0.0,
+            'avg_ttfb_ms': round(1000 * totals['ttfb'] / requests_sent, 2) if requests_sent else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> 'HTTPClient':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+_default_client: Optional[HTTPClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> HTTPClient:
+    """Return the process-wide HTTPClient used when callers don't pass their own."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HTTPClient()
+        return _default_client
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Keyword categorization of pages in one pass over their text.
+
+Category definitions map a category name to keywords; a page scores one
+point (or a field weight) for every keyword of a category that occurs in
+its text. Checking ``keyword in text`` for every keyword of every category
+lowercases and rescans the text once per keyword, including keywords shared
+by several categories.
+
+Here each distinct keyword is looked up once per text and its hit credited
+to every category listing it. Small vocabularies use ``in`` checks, which
+are the fastest scan per keyword; from SCAN_MIN_KEYWORDS distinct keywords
+on, all keywords are compiled into one trie-shaped regular expression that
+finds the longest keyword starting at each match position in a single scan
+whose cost does not grow with the number of keywords. Keywords contained in
+a found keyword (``api`` in ``api reference``) are credited too, so results
+are exactly those of the substring checks.
+
+Usage:
+    from skill_seekers.cli.keyword_categorizer import get_categorizer
+
+    categorizer = get_categorizer({'api': ['api', 'reference'], 'guides': ['tutorial']})
+    categorizer.scores([(page_title, 2), (page_text, 1)])   # {'api': 3}
+    categorizer.best([(page_text, 1)])                      # 'api'
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+# Distinct keywords from which one regex scan beats an ``in`` check per keyword
+SCAN_MIN_KEYWORDS = 160
+
+# (text, weight) pairs scored together, e.g. [(url, 3), (title, 2), (content, 1)]
+WeightedTexts = Iterable[Tuple[str, int]]
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Regex source matching any of the keywords, longest first at each position."""
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}  # End of a keyword
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy: continue into longer keywords before ending here
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class KeywordCategorizer:
+    """Score texts against keyword categories, looking each distinct keyword up once per text."""
+
+    def __init__(self, categories: Mapping[str, Sequence[str]]) -> None:
+        """
+        Args:
+            categories: Category name -> keywords. Keywords are matched
+                case-insensitively as substrings; non-string keywords and
+                non-list definitions are ignored.
+        """
+        self.categories: List[str] = list(categories)
+        self._keyword_ids: Dict[str, int] = {}
+        # Keyword id -> category indexes, once per occurrence in a definition
+        self._keyword_categories: List[List[int]] = []
+
+        for index, keywords in enumerate(categories.values()):
+            if not isinstance(keywords, (list, tuple)):
+                continue
+            for keyword in keywords:
+                if not isinstance(keyword, str):
+                    continue
+                keyword = keyword.lower()
+                if keyword not in self._keyword_ids:
+                    self._keyword_ids[keyword] = len(self._keyword_categories)
+                    self._keyword_categories.append([])
+                self._keyword_categories[self._keyword_ids[keyword]].append(index)
+
+        keywords = self._keywords = list(self._keyword_ids)
+        self._pattern = None
+        if len(keywords) >= SCAN_MIN_KEYWORDS and any(keywords):
+            # Keyword id -> ids of all keywords it contains (itself included)
+            self._contained: List[Tuple[int, ...]] = [
+                tuple(self._keyword_ids[other] for other in keywords if other in keyword)
+                for keyword in keywords
+            ]
+            self._always: Set[int] = {self._keyword_ids['']} if '' in self._keyword_ids else set()
+            self._pattern = re.compile(_trie_pattern(keyword for keyword in keywords if keyword))
+
+    def find(self, text: str) -> Set[str]:
+        """Return the keywords that occur in a text (lowercased)."""
+        return {self._keywords[keyword_id] for keyword_id in self._find_ids(text)}
+
+    def _find_ids(self, text: str) -> Set[int]:
+        text = text.lower()
+        if self._pattern is None:
+            return {keyword_id for keyword_id, keyword in enumerate(self._keywords) if keyword in text}
+
+        found = set(self._always)
+        search = self._pattern.search
+        position = 0
+        # Restart one character after each match start so overlapping
+        # keywords ("class" and "sic" in "classic") are all found
+        while True:
+            match = search(text, position)
+            if match is None:
+                return found
+            found.update(self._contained[self._keyword_ids[match.group()]])
+            position = match.start() + 1
+
+    def scores(self, texts: WeightedTexts) -> Dict[str, int]:
+        """
+        Score every category against weighted texts.
+
+        Each keyword of a category found in a text adds the text's weight.
+
+        Returns:
+            Category -> score for categories scoring above zero, in
+            definition order
+        """
+        totals = [0] * len(self.categories)
+        for text, weight in texts:
+            for keyword_id in self._find_ids(text):
+                for index in self._keyword_categories[keyword_id]:
+                    totals[index] += weight
+        return {self.categories[index]: total for index, total in enumerate(totals) if total > 0}
+
+    def best(self, texts: WeightedTexts) -> Optional[str]:
+        """Highest scoring category (first defined on ties), or None if none scores."""
+        scores = self.scores(texts)
+        return max(scores, key=scores.get) if scores else None
+
+    def first(self, texts: WeightedTexts, threshold: int) -> Optional[str]:
+        """First category (in definition order) scoring at least threshold, or None."""
+        for category, score in self.scores(texts).items():
+            if score >= threshold:
+                return category
+        return None
+
+
+@lru_cache(maxsize=32)
+def _categorizer(definition: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> KeywordCategorizer:
+    return KeywordCategorizer(dict(definition))
+
+
+def get_categorizer(categories: Mapping[str, Sequence[str]]) -> KeywordCategorizer:
+    """
+    Return a categorizer for category definitions, compiled once per
+    distinct definition (callers may pass the same config for every page).
+    """
+    definition = tuple(
+        (name, tuple(k for k in keywords if isinstance(k, str)) if isinstance(keywords, (list, tuple)) else ())
+        for name, keywords in categories.items()
+    )
+    return _categorizer(definition)
@@ -8,8 +8,19 @@ Supports 20+ programming languages with weighted pattern matching.
 Author: Skill Seekers Project
 """
 
+import hashlib
+import json
+import logging
+import os
 import re
-from typing import Optional, Tuple, Dict, List
+import threading
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple, Dict, Iterable, List, Set, Union
+
+from skill_seekers.cli.keyword_categorizer import KeywordCategorizer
+
+logger = logging.getLogger(__name__)
 
 
 # Comprehensive language patterns with weighted confidence scoring
@@ -381,6 +392,219 @@ KNOWN_LANGUAGES = [
     "julia", "gdscript",
 ]
 
+# Pattern-based detections remembered per process (install commands,
+# import boilerplate and shared examples repeat across a docs site)
+DEFAULT_DETECTION_CACHE_SIZE = 8192
+
+# Bump when detection changes without LANGUAGE_PATTERNS changing, so
+# persisted detection caches are discarded
+DETECTION_CACHE_VERSION = 1
+
+
+class DetectionCache:
+    """
+    Thread-safe bounded LRU of pattern-based detection results.
+
+    Entries are keyed on a hash of the snippet with normalized line endings
+    and hold the best (language, confidence) before any min_confidence
+    threshold, so detectors with different thresholds can share one cache.
+    The cache can be saved to and loaded from a JSON file; files written
+    for other LANGUAGE_PATTERNS are ignored.
+
+    Example:
+        cache = DetectionCache(max_entries=4096)
+        cache.load('output/react_data/language_cache.json')
+        detector = LanguageDetector(cache=cache)
+        ...
+        cache.save('output/react_data/language_cache.json')
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_DETECTION_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # When set, every put (key, result) is appended too, e.g. so a pool
+        # worker can send the entries it added back to its parent process
+        self.journal: Optional[List[Tuple[str, Tuple[str, float]]]] = None
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(code: str, variant: str = '') -> str:
+        """
+        Return the cache key of a snippet (CRLF line endings count as LF).
+
+        Detectors whose results differ for the same snippet (e.g. bounded
+        mode) pass a variant naming their settings.
+        """
+        normalized = code.replace('\r\n', '\n')
+        if variant:
+            normalized = f"{variant}\x00{normalized}"
+        return hashlib.blake2b(normalized.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+    @staticmethod
+    def fingerprint() -> str:
+        """Hash of the detection rules persisted entries are valid for."""
+        rules = json.dumps([DETECTION_CACHE_VERSION, LANGUAGE_PATTERNS], sort_keys=True)
+        return hashlib.sha256(rules.encode('utf-8')).hexdigest()[:16]
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Return the cached result for a key (refreshing it), or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: str, result: Tuple[str, float]) -> None:
+        """Store a result, evicting the least recently used entries over max_entries."""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if self.journal is not None:
+                self.journal.append((key, result))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hits, misses and the number of entries."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+    def load(self, path: Union[str, Path]) -> int:
+        """
+        Add the entries of a saved cache (older than the ones in memory).
+
+        Missing, unreadable or outdated files are ignored.
+
+        Returns:
+            Number of entries loaded
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable language detection cache %s: %s", path, e)
+            return 0
+        if not isinstance(data, dict) or data.get('fingerprint') != self.fingerprint():
+            return 0
+
+        with self._lock:
+            loaded: "OrderedDict[str, Tuple[str, float]]" = OrderedDict(
+                (key, (lang, confidence)) for key, lang, confidence in data.get('entries', [])
+            )
+            count = len(loaded)
+            loaded.update(self._entries)  # In-memory entries are the most recent
+            self._entries = loaded
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return count
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the entries (least recently used first) to a JSON file atomically."""
+        with self._lock:
+            entries = [[key, lang, confidence] for key, (lang, confidence) in self._entries.items()]
+        data: Dict[str, Any] = {'fingerprint': self.fingerprint(), 'entries': entries}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+
+# Cache shared by all detectors of a process (doc scraper, PDF extractor, ...)
+shared_detection_cache = DetectionCache()
+
+
+# Characters that case-insensitive regex matching folds onto ASCII letters but
+# str.lower() does not (dotted/dotless i, long s, Kelvin sign)
+_ASCII_CASE_FOLDS = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+# {m,n} quantifier in a pattern (an unmatched "{" is a literal)
+_QUANTIFIER_RE = re.compile(r'\{(\d*)(?:,\d*)?\}[?+]?')
+
+
+def required_literal(pattern: str) -> Optional[str]:
+    """
+    Find a literal every match of a regex pattern must contain.
+
+    Literals are only taken from the top level of the pattern: groups,
+    character classes and escapes like \\s break a literal run, and a
+    character made optional by ?, * or {0,n} is dropped.
+
+    Args:
+        pattern: Regex source (matched case-insensitively)
+
+    Returns:
+        Longest required literal, lowercased, or None if there is none
+    """
+    runs = ['']
+    depth = 0
+    last_literal = False  # Previous atom was a literal appended to runs[-1]
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        literal = None
+        optional = False
+
+        if char == '\\':
+            escaped = pattern[i + 1]
+            i += 2
+            if not escaped.isalnum():
+                literal = escaped  # Escaped punctuation
+        elif char == '[':
+            i += 2 if pattern[i + 1] == '^' else 1
+            if pattern[i] == ']':
+                i += 1  # A leading "]" is a class member
+            while pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+            i += 1
+        elif char == '|':
+            return None  # Alternatives have no common required literal
+        elif char in '()':
+            depth += 1 if char == '(' else -1
+            i += 1
+        elif char in '*?+':
+            optional = char != '+'
+            i += 2 if pattern[i + 1:i + 2] in ('?', '+') else 1
+        elif char == '{' and _QUANTIFIER_RE.match(pattern, i):
+            quantifier = _QUANTIFIER_RE.match(pattern, i)
+            optional = not quantifier.group(1) or int(quantifier.group(1)) == 0
+            i = quantifier.end()
+        elif char in '.^$':
+            i += 1
+        else:
+            literal = char
+            i += 1
+
+        if literal is not None and depth == 0:
+            runs[-1] += literal.lower()
+            last_literal = True
+            continue
+        if optional and last_literal:
+            runs[-1] = runs[-1][:-1]
+        if runs[-1]:
+            runs.append('')
+        last_literal = False
+
+    return max(runs, key=len) or None
+
 
 class LanguageDetector:
     """
@@ -403,25 +627,64 @@ class LanguageDetector:
             print(f"Low confidence: {lang}")
     """
 
-    def __init__(self, min_confidence: float = 0.15):
+    def __init__(self, min_confidence: float = 0.15, cache: Optional[DetectionCache] = None,
+                 use_cache: bool = True, max_chars: Optional[int] = None):
         """
         Initialize language detector.
 
         Args:
             min_confidence: Minimum confidence threshold (0-1)
                           0.3 = low, 0.5 = medium, 0.7 = high
+            cache: Cache of pattern-based detections (default: shared_detection_cache)
+            use_cache: Set False to detect every snippet from scratch
+            max_chars: Bounded-work mode: detect from at most this many
+                       characters (head and tail of longer snippets) and try
+                       languages in order of the CSS classes seen so far
+                       (which only affects speed, not results)
         """
         self.min_confidence = min_confidence
+        self.cache = (cache if cache is not None else shared_detection_cache) if use_cache else None
+        self.max_chars = max_chars
+        # Languages named by CSS classes so far: priors for bounded mode (approximate under threads)
+        self.class_languages: Counter = Counter()
         self._pattern_cache: Dict[str, List[Tuple[re.Pattern, int]]] = {}
         self._compile_patterns()
 
     def _compile_patterns(self) -> None:
-        """Compile regex patterns and cache them for performance"""
+        """
+        Compile regex patterns and cache them for performance.
+
+        Patterns shared by several languages are compiled (and searched)
+        once. Each pattern is keyed on a literal all its matches contain, so
+        a single lookup over the code selects the few patterns worth
+        searching (see _matching_patterns).
+        """
+        pattern_ids: Dict[str, int] = {}
+        self._patterns: List[re.Pattern] = []
+        # Language -> (pattern id, weight) in LANGUAGE_PATTERNS order
+        self._language_patterns: Dict[str, List[Tuple[int, int]]] = {}
+        # Required literal -> ids of the patterns keyed on it
+        self._anchored: Dict[str, List[int]] = {}
+        self._unanchored: List[int] = []
+
         for lang, patterns in LANGUAGE_PATTERNS.items():
-            self._pattern_cache[lang] = [
-                (re.compile(pattern, re.IGNORECASE | re.MULTILINE), weight)
-                for pattern, weight in patterns
-            ]
+            self._pattern_cache[lang] = []
+            self._language_patterns[lang] = []
+            for pattern, weight in patterns:
+                if pattern not in pattern_ids:
+                    pattern_ids[pattern] = len(self._patterns)
+                    self._patterns.append(re.compile(pattern, re.IGNORECASE | re.MULTILINE))
+                    literal = required_literal(pattern)
+                    if literal is None:
+                        self._unanchored.append(pattern_ids[pattern])
+                    else:
+                        self._anchored.setdefault(literal, []).append(pattern_ids[pattern])
+                self._pattern_cache[lang].append((self._patterns[pattern_ids[pattern]], weight))
+                self._language_patterns[lang].append((pattern_ids[pattern], weight))
+
+        self._anchor_finder = KeywordCategorizer({'anchors': list(self._anchored)})
+        # Position in LANGUAGE_PATTERNS: breaks ties whatever order languages are scored in
+        self._language_rank: Dict[str, int] = {lang: rank for rank, lang in enumerate(self._language_patterns)}
 
     def detect_from_html(self, elem, code: str) -> Tuple[str, float]:
         """
@@ -438,6 +701,7 @@ class LanguageDetector:
         if elem:
             css_lang = self.extract_language_from_classes(elem.get('class', []))
             if css_lang:
+                self.class_languages[css_lang] += 1
                 return css_lang, 1.0
 
             # Check parent pre element
@@ -445,6 +709,7 @@ class LanguageDetector:
             if parent and parent.name == 'pre':
                 css_lang = self.extract_language_from_classes(parent.get('class', []))
                 if css_lang:
+                    self.class_languages[css_lang] += 1
                     return css_lang, 1.0
 
         # Tier 2: Pattern matching
@@ -464,15 +729,23 @@ class LanguageDetector:
         if len(code.strip()) < 10:
             return 'unknown', 0.0
 
-        # Calculate confidence scores for all languages
-        scores = self._calculate_confidence(code)
-
-        if not scores:
-            return 'unknown', 0.0
+        if self.max_chars is None:
+            sample, order, variant = code, self._language_patterns, ''
+        else:
+            # Bounded work: a window of the snippet, likely languages first
+            sample = self._sample(code)
+            order = sorted(self._language_patterns, key=lambda lang: -self.class_languages[lang])
+            variant = f"max_chars={self.max_chars}"
 
-        # Get language with highest score
-        best_lang = max(scores.items(), key=lambda x: x[1])
-        lang, confidence = best_lang
+        if self.cache is None:
+            lang, confidence = self._detect_best(sample, order)
+        else:
+            key = DetectionCache.key(sample, variant)
+            result = self.cache.get(key)
+            if result is None:
+                result = self._detect_best(sample, order)
+                self.cache.put(key, result)
+            lang, confidence = result
 
         # Apply minimum confidence threshold
         if confidence < self.min_confidence:
@@ -480,6 +753,58 @@ class LanguageDetector:
 
         return lang, confidence
 
+    def _sample(self, code: str) -> str:
+        """Return the head and tail of a snippet longer than max_chars, cut at line ends."""
+        if len(code) <= self.max_chars:
+            return code
+        half = self.max_chars // 2
+        head = code[:half]
+        tail = code[-half:]
+        # Whole lines only, so no pattern sees a line cut in half
+        head = head[:head.rfind('\n') + 1] or head
+        tail = tail[tail.find('\n') + 1:] or tail
+        return head + tail
+
+    def _detect_best(self, code: str, order: Iterable[str]) -> Tuple[str, float]:
+        """
+        Return the best scoring (language, confidence), or ('unknown', 0.0).
+
+        On equal confidence the language listed first in LANGUAGE_PATTERNS
+        wins, so the result does not depend on the order languages are
+        scored in; a good order (likely languages first) only saves work. A
+        language is only scored if the patterns whose required literal
+        occurs in the code could let it beat the best so far, so scoring
+        stops as soon as one language is decisively ahead (at the latest at
+        confidence 1.0).
+        """
+        candidates = self._candidate_patterns(code)
+        matched: Dict[int, bool] = {}  # Pattern id -> found (patterns shared by languages)
+        best_lang, best_score = 'unknown', 0
+        best_rank = len(self._language_rank)
+
+        for lang in order:
+            rank = self._language_rank[lang]
+            patterns = [(pattern_id, weight) for pattern_id, weight in self._language_patterns[lang]
+                        if pattern_id in candidates]
+            # Score of 10+ = 1.0 confidence
+            bound = min(sum(weight for _, weight in patterns), 10)
+            if bound < best_score or (bound == best_score and rank > best_rank) or bound == 0:
+                continue
+
+            total_score = 0
+            for pattern_id, weight in patterns:
+                found = matched.get(pattern_id)
+                if found is None:
+                    found = matched[pattern_id] = self._patterns[pattern_id].search(code) is not None
+                if found:
+                    total_score += weight
+
+            score = min(total_score, 10)
+            if score > best_score or (score == best_score and score > 0 and rank < best_rank):
+                best_lang, best_score, best_rank = lang, score, rank
+
+        return best_lang, best_score / 10.0
+
     def extract_language_from_classes(self, classes: List[str]) -> Optional[str]:
         """
         Extract language from CSS class list.
@@ -537,12 +862,13 @@ class LanguageDetector:
             Dictionary mapping language names to confidence scores (0.0-1.0)
         """
         scores: Dict[str, float] = {}
+        matched = self._matching_patterns(code)
 
-        for lang, compiled_patterns in self._pattern_cache.items():
+        for lang, patterns in self._language_patterns.items():
             total_score = 0
 
-            for pattern, weight in compiled_patterns:
-                if pattern.search(code):
+            for pattern_id, weight in patterns:
+                if pattern_id in matched:
                     total_score += weight
 
             if total_score > 0:
@@ -552,3 +878,21 @@ class LanguageDetector:
                 scores[lang] = confidence
 
         return scores
+
+    def _matching_patterns(self, code: str) -> Set[int]:
+        """Find the ids of all patterns that match somewhere in the code."""
+        return {pattern_id for pattern_id in self._candidate_patterns(code)
+                if self._patterns[pattern_id].search(code)}
+
+    def _candidate_patterns(self, code: str) -> Set[int]:
+        """
+        Find the ids of the patterns that can match the code.
+
+        These are the patterns whose required literal occurs in the code
+        (found in one lookup for all literals) and those without one.
+        """
+        text = code if code.isascii() else code.translate(_ASCII_CASE_FOLDS)
+        candidates = set(self._unanchored)
+        for literal in self._anchor_finder.find(text):
+            candidates.update(self._anchored[literal])
+        return candidates
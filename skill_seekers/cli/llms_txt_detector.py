@@ -1,10 +1,21 @@
 # ABOUTME: Detects and validates llms.txt file availability at documentation URLs
 # ABOUTME: Supports llms-full.txt, llms.txt, and llms-small.txt variants
 
+import json
+import os
+import threading
+import time
 import requests
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple
 from urllib.parse import urlparse
 
+from skill_seekers.cli.http_client import HTTPClient, get_default_client
+
+# How long a "no llms.txt here" result is trusted before probing again
+DEFAULT_NEGATIVE_TTL = 24 * 3600
+
+
 class LlmsTxtDetector:
     """Detect llms.txt files at documentation URLs"""
 
@@ -14,53 +25,147 @@ class LlmsTxtDetector:
         ('llms-small.txt', 'small')
     ]
 
-    def __init__(self, base_url: str):
+    # In-process negative results: lowercased prefix (scheme://host or
+    # scheme://host/path) -> expiry timestamp
+    _negative_cache: Dict[str, float] = {}
+    _negative_cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        base_url: str,
+        client: Optional[HTTPClient] = None,
+        negative_cache_file: Optional[str] = None,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL
+    ):
         self.base_url = base_url.rstrip('/')
+        # Pooled HTTP client (probes of the same host share keep-alive connections)
+        self.client = client or get_default_client()
+        # Optional on-disk copy of the negative cache, so re-runs skip probing too
+        self.negative_cache_file = negative_cache_file
+        self.negative_ttl = negative_ttl
 
-    def detect(self) -> Optional[Dict[str, str]]:
+    def candidates(self) -> List[Tuple[str, str]]:
         """
-        Detect available llms.txt variant.
+        List candidate (url, variant) pairs in order of preference.
 
-        Returns:
-            Dict with 'url' and 'variant' keys, or None if not found
+        Every variant is looked up at the site root and, if the base URL
+        has a path (e.g. /docs/), under that path as well.
         """
+        return [
+            (f"{prefix}/{filename}", variant)
+            for prefix in self._prefixes()
+            for filename, variant in self.VARIANTS
+        ]
+
+    def _prefixes(self) -> List[str]:
+        """Site root (scheme://host) and, if the base URL has a path, the base path."""
         parsed = urlparse(self.base_url)
         root_url = f"{parsed.scheme}://{parsed.netloc}"
+        prefixes = [root_url]
+        if parsed.path.strip('/'):
+            prefixes.append(f"{root_url}/{parsed.path.strip('/')}")
+        return prefixes
 
-        for filename, variant in self.VARIANTS:
-            url = f"{root_url}/{filename}"
-
-            if self._check_url_exists(url):
-                return {'url': url, 'variant': variant}
+    def detect(self) -> Optional[Dict[str, str]]:
+        """
+        Detect available llms.txt variant.
 
-        return None
+        Returns:
+            Dict with 'url' and 'variant' keys, or None if not found
+        """
+        variants = self.detect_all()
+        return variants[0] if variants else None
 
     def detect_all(self) -> List[Dict[str, str]]:
         """
         Detect all available llms.txt variants.
 
+        All candidate URLs are probed concurrently. A prefix where no
+        variant exists is remembered for negative_ttl seconds and not probed
+        again; the site root is keyed on scheme and host, so every base
+        path on the same host shares its result.
+
         Returns:
             List of dicts with 'url' and 'variant' keys for each found variant
         """
-        found_variants = []
+        prefixes = [prefix for prefix in self._prefixes() if not self._is_known_negative(prefix)]
+        if not prefixes:
+            return []
 
-        for filename, variant in self.VARIANTS:
-            parsed = urlparse(self.base_url)
-            root_url = f"{parsed.scheme}://{parsed.netloc}"
-            url = f"{root_url}/{filename}"
+        candidates = [
+            (f"{prefix}/{filename}", variant, prefix)
+            for prefix in prefixes
+            for filename, variant in self.VARIANTS
+        ]
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            results = list(executor.map(lambda candidate: self._probe(candidate[0]), candidates))
 
-            if self._check_url_exists(url):
+        found_variants = []
+        seen_variants = set()
+        for (url, variant, _), exists in zip(candidates, results):
+            if exists and variant not in seen_variants:
+                seen_variants.add(variant)
                 found_variants.append({
                     'url': url,
                     'variant': variant
                 })
 
-        return found_variants
+        # Only cache definite misses (no timeouts or connection errors)
+        negative = [
+            prefix for prefix in prefixes
+            if all(exists is False for (_, _, p), exists in zip(candidates, results) if p == prefix)
+        ]
+        if negative:
+            self._remember_negative(negative)
+
+        # Keep the documented variant order (full, standard, small)
+        order = {variant: i for i, (_, variant) in enumerate(self.VARIANTS)}
+        return sorted(found_variants, key=lambda v: order[v['variant']])
 
     def _check_url_exists(self, url: str) -> bool:
         """Check if URL returns 200 status"""
+        return bool(self._probe(url))
+
+    def _probe(self, url: str) -> Optional[bool]:
+        """Return True/False if the URL does/doesn't exist, None if the probe failed."""
         try:
-            response = requests.head(url, timeout=5, allow_redirects=True)
+            response = self.client.head(url, timeout=5, allow_redirects=True, retries=1)
             return response.status_code == 200
         except requests.RequestException:
-            return False
+            return None
+
+    def _is_known_negative(self, prefix: str) -> bool:
+        key = prefix.lower()
+        now = time.time()
+        with self._negative_cache_lock:
+            expires = self._negative_cache.get(key)
+            if expires is None:
+                expires = self._load_negative_cache().get(key)
+                if expires is not None:
+                    self._negative_cache[key] = expires
+        return expires is not None and expires > now
+
+    def _remember_negative(self, prefixes: List[str]) -> None:
+        if self.negative_ttl <= 0:
+            return
+        keys = [prefix.lower() for prefix in prefixes]
+        expires = time.time() + self.negative_ttl
+        with self._negative_cache_lock:
+            self._negative_cache.update((key, expires) for key in keys)
+            if self.negative_cache_file:
+                entries = {k: v for k, v in self._load_negative_cache().items() if v > time.time()}
+                entries.update((key, expires) for key in keys)
+                try:
+                    with open(self.negative_cache_file, 'w', encoding='utf-8') as f:
+                        json.dump(entries, f)
+                except OSError:
+                    pass  # Cache is an optimization only
+
+    def _load_negative_cache(self) -> Dict[str, float]:
+        if not self.negative_cache_file or not os.path.exists(self.negative_cache_file):
+            return {}
+        try:
+            with open(self.negative_cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
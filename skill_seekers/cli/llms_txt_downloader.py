@@ -2,16 +2,29 @@
 """ABOUTME: Validates markdown content and handles timeouts with exponential backoff"""
 
 import requests
-import time
 from typing import Optional
 
+from skill_seekers.cli.http_cache import HTTPCache
+from skill_seekers.cli.http_client import HTTPClient, get_default_client
+
 class LlmsTxtDownloader:
     """Download llms.txt content from URLs with retry logic"""
 
-    def __init__(self, url: str, timeout: int = 30, max_retries: int = 3):
+    def __init__(
+        self,
+        url: str,
+        timeout: int = 30,
+        max_retries: int = 3,
+        cache_dir: Optional[str] = None,
+        client: Optional[HTTPClient] = None
+    ):
         self.url = url
         self.timeout = timeout
         self.max_retries = max_retries
+        # Pooled HTTP client, retries connection errors and 5xx/429 with exponential backoff (1s, 2s, 4s, ...)
+        self.client = client or get_default_client()
+        # Optional conditional HTTP cache: unchanged files are served from disk on a 304
+        self.cache = HTTPCache(cache_dir) if cache_dir else None
 
     def get_proper_filename(self) -> str:
         """
@@ -57,38 +70,44 @@ class LlmsTxtDownloader:
             'User-Agent': 'Skill-Seekers-llms.txt-Reader/1.0'
         }
 
-        for attempt in range(self.max_retries):
-            try:
-                response = requests.get(
-                    self.url,
-                    headers=headers,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-
-                content = response.text
-
-                # Validate content is not empty
-                if len(content) < 100:
-                    print(f"⚠️  Content too short ({len(content)} chars), rejecting")
-                    return None
-
-                # Validate content looks like markdown
-                if not self._is_markdown(content):
-                    print(f"⚠️  Content doesn't look like markdown")
-                    return None
-
-                return content
-
-            except requests.RequestException as e:
-                if attempt < self.max_retries - 1:
-                    # Calculate exponential backoff delay: 1s, 2s, 4s, etc.
-                    delay = 2 ** attempt
-                    print(f"⚠️  Attempt {attempt + 1}/{self.max_retries} failed: {e}")
-                    print(f"   Retrying in {delay}s...")
-                    time.sleep(delay)
-                else:
-                    print(f"❌ Failed to download {self.url} after {self.max_retries} attempts: {e}")
-                    return None
-
-        return None
+        conditional_headers = self.cache.conditional_headers(self.url) if self.cache else {}
+
+        try:
+            response = self.client.get(
+                self.url,
+                headers={**headers, **conditional_headers},
+                timeout=self.timeout,
+                retries=self.max_retries
+            )
+
+            if self.cache and response.status_code == 304:
+                cached = self.cache.load_body(self.url)
+                if cached is not None:
+                    self.cache.record(unchanged=True)
+                    return cached.decode('utf-8')
+                # Cached body is gone, download it again without validators
+                response = self.client.get(self.url, headers=headers, timeout=self.timeout, retries=self.max_retries)
+
+            response.raise_for_status()
+
+        except requests.RequestException as e:
+            print(f"❌ Failed to download {self.url}: {e}")
+            return None
+
+        content = response.text
+
+        # Validate content is not empty
+        if len(content) < 100:
+            print(f"⚠️  Content too short ({len(content)} chars), rejecting")
+            return None
+
+        # Validate content looks like markdown
+        if not self._is_markdown(content):
+            print(f"⚠️  Content doesn't look like markdown")
+            return None
+
+        if self.cache:
+            self.cache.store(self.url, response.headers, response.content, keep_body=True)
+            self.cache.record(unchanged=False)
+
+        return content
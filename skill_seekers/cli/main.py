@@ -88,6 +88,7 @@ For more information: https://github.com/yusufkaraaslan/Skill_Seekers
     scrape_parser.add_argument("--dry-run", action="store_true", help="Dry run mode")
     scrape_parser.add_argument("--async", dest="async_mode", action="store_true", help="Use async scraping")
     scrape_parser.add_argument("--workers", type=int, help="Number of async workers")
+    scrape_parser.add_argument("--parse-workers", type=int, help="Processes for HTML parsing in async mode")
 
     # === github subcommand ===
     github_parser = subparsers.add_parser(
@@ -111,6 +112,9 @@ For more information: https://github.com/yusufkaraaslan/Skill_Seekers
     pdf_parser.add_argument("--name", help="Skill name")
     pdf_parser.add_argument("--description", help="Skill description")
     pdf_parser.add_argument("--from-json", help="Build from extracted JSON")
+    pdf_parser.add_argument("--pages", help="Extract only these pages, e.g. 1-500")
+    pdf_parser.add_argument("--incremental", action="store_true",
+                            help="Only re-extract pages that changed since the last extraction")
 
     # === unified subcommand ===
     unified_parser = subparsers.add_parser(
@@ -261,6 +265,8 @@ def main(argv: Optional[List[str]] = None) -> int:
                 sys.argv.append("--async")
             if args.workers:
                 sys.argv.extend(["--workers", str(args.workers)])
+            if args.parse_workers is not None:
+                sys.argv.extend(["--parse-workers", str(args.parse_workers)])
             return scrape_main() or 0
 
         elif args.command == "github":
@@ -289,6 +295,10 @@ def main(argv: Optional[List[str]] = None) -> int:
                 sys.argv.extend(["--description", args.description])
             if args.from_json:
                 sys.argv.extend(["--from-json", args.from_json])
+            if args.pages:
+                sys.argv.extend(["--pages", args.pages])
+            if args.incremental:
+                sys.argv.append("--incremental")
             return pdf_main() or 0
 
         elif args.command == "unified":
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+Page storage backends for scraped documentation.
+
+Scraped pages used to be written as one pretty-printed JSON file per page
+under ``output/{name}_data/pages/``. At tens of thousands of pages that
+means huge inode counts and slow globbing, so pages can now live in a
+single store:
+
+    - jsonl:     append-only ``pages.jsonl`` plus an offset index (default)
+    - sqlite:    ``pages.db`` with one row per URL
+    - directory: the original one-JSON-file-per-page layout
+
+Every backend supports streaming iteration (``iter_pages``), random access
+by URL (``get``) and cheap change detection (``iter_hashes``). Opening a
+jsonl or sqlite store over a data directory that still has the old
+``pages/`` layout imports those pages automatically.
+
+Usage:
+    from skill_seekers.cli.page_store import open_page_store
+
+    store = open_page_store('output/react_data', 'jsonl')
+    store.save(page)
+    page = store.get('https://react.dev/learn')
+    for page in store.iter_pages():
+        ...
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PAGE_STORE_BACKENDS = ('jsonl', 'sqlite', 'directory')
+
+
+def _content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class PageStore:
+    """Base class for page stores. Pages are keyed by their 'url' field."""
+
+    backend = ''
+
+    def save(self, page: Dict[str, Any]) -> None:
+        """Insert or replace a page."""
+        raise NotImplementedError
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the page stored for a URL, or None."""
+        raise NotImplementedError
+
+    def iter_pages(self) -> Iterator[Dict[str, Any]]:
+        """Stream all pages in store order without loading them all at once."""
+        raise NotImplementedError
+
+    def iter_hashes(self) -> Iterator[Tuple[str, str]]:
+        """Yield (url, content_hash) for every page in store order."""
+        raise NotImplementedError
+
+    def urls(self) -> List[str]:
+        """Return all stored URLs in store order."""
+        return [url for url, _ in self.iter_hashes()]
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __contains__(self, url: object) -> bool:
+        return isinstance(url, str) and self.get(url) is not None
+
+    def flush(self) -> None:
+        """Make pending writes durable."""
+
+    def close(self) -> None:
+        """Flush and release resources."""
+        self.flush()
+
+
+class DirectoryPageStore(PageStore):
+    """Original layout: one pretty-printed JSON file per page in pages/."""
+
+    backend = 'directory'
+
+    def __init__(self, pages_dir: Union[str, Path]) -> None:
+        self.pages_dir = Path(pages_dir)
+        self.pages_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._by_hash: Optional[Dict[str, Path]] = None  # url hash -> file, built lazily
+
+    @staticmethod
+    def url_hash(url: str) -> str:
+        return hashlib.md5(url.encode()).hexdigest()[:10]
+
+    @classmethod
+    def filename_for(cls, page: Dict[str, Any]) -> str:
+        safe_title = re.sub(r'[^\w\s-]', '', page['title'])[:50]
+        safe_title = re.sub(r'[-\s]+', '_', safe_title)
+        return f"{safe_title}_{cls.url_hash(page['url'])}.json"
+
+    def _index(self) -> Dict[str, Path]:
+        if self._by_hash is None:
+            self._by_hash = {}
+            for json_file in self.pages_dir.glob("*.json"):
+                self._by_hash[json_file.stem.rsplit('_', 1)[-1]] = json_file
+        return self._by_hash
+
+    def _files(self) -> List[Path]:
+        return sorted(self.pages_dir.glob("*.json"))
+
+    def save(self, page: Dict[str, Any]) -> None:
+        filepath = self.pages_dir / self.filename_for(page)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(page, f, indent=2, ensure_ascii=False)
+        with self._lock:
+            index = self._index()
+            old = index.get(self.url_hash(page['url']))
+            if old is not None and old != filepath and old.exists():
+                old.unlink()  # Title changed, drop the stale file
+            index[self.url_hash(page['url'])] = filepath
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            filepath = self._index().get(self.url_hash(url))
+        if filepath is None:
+            return None
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                page = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return page if page.get('url') == url else None
+
+    def iter_pages(self) -> Iterator[Dict[str, Any]]:
+        for json_file in self._files():
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    yield json.load(f)
+            except Exception as e:
+                logger.error("⚠️  Error loading scraped data file %s: %s: %s", json_file, type(e).__name__, e)
+                logger.error("   Suggestion: File may be corrupted, consider re-scraping with --fresh")
+
+    def iter_hashes(self) -> Iterator[Tuple[str, str]]:
+        for json_file in self._files():
+            try:
+                raw = json_file.read_bytes()
+                yield json.loads(raw)['url'], _content_hash(raw)
+            except Exception as e:
+                logger.error("⚠️  Error loading scraped data file %s: %s: %s", json_file, type(e).__name__, e)
+
+    def __len__(self) -> int:
+        return len(self._files())
+
+
+class JSONLPageStore(PageStore):
+    """
+    Append-only JSON Lines store with an offset index.
+
+    ``pages.jsonl`` holds one compact JSON record per line. ``pages.idx``
+    is an append-only JSONL index of {url, offset, length, hash}; the last
+    entry for a URL wins, so re-saving a page appends a new record and the
+    old one becomes garbage until the next compaction. If the index is
+    missing or out of date it is rebuilt by scanning the data file.
+    """
+
+    backend = 'jsonl'
+    DATA_FILE = 'pages.jsonl'
+    INDEX_FILE = 'pages.idx'
+
+    def __init__(self, data_dir: Union[str, Path]) -> None:
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.data_path = self.data_dir / self.DATA_FILE
+        self.index_path = self.data_dir / self.INDEX_FILE
+        self._lock = threading.RLock()
+        # url -> (offset, length, hash), in write order of each URL's latest record
+        self._index: Dict[str, Tuple[int, int, str]] = {}
+        self._records = 0
+
+        self.data_path.touch(exist_ok=True)
+        if not self._load_index():
+            self._rebuild_index()
+
+        # Reclaim space once most records are superseded
+        if self._records > 2 * len(self._index) and self._records > 100:
+            self.compact()
+
+        self._data_file = open(self.data_path, 'ab')
+        self._index_file = open(self.index_path, 'a', encoding='utf-8')
+        self._reader = open(self.data_path, 'rb')
+
+    def _load_index(self) -> bool:
+        """Load pages.idx; return False if it is missing or does not match the data file."""
+        if not self.index_path.exists():
+            return self.data_path.stat().st_size == 0
+
+        end = 0
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    entry = json.loads(line)
+                    self._index.pop(entry['url'], None)
+                    self._index[entry['url']] = (entry['offset'], entry['length'], entry['hash'])
+                    self._records += 1
+                    end = max(end, entry['offset'] + entry['length'])
+        except (OSError, ValueError, KeyError):
+            self._index.clear()
+            self._records = 0
+            return False
+
+        if end != self.data_path.stat().st_size:
+            self._index.clear()
+            self._records = 0
+            return False
+        return True
+
+    def _rebuild_index(self) -> None:
+        """Rebuild pages.idx by scanning pages.jsonl (drops a truncated trailing record)."""
+        logger.info("  Rebuilding page index for %s", self.data_path)
+        self._index.clear()
+        self._records = 0
+        entries = []
+        offset = 0
+        with open(self.data_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    url = json.loads(line)['url']
+                except (ValueError, KeyError):
+                    offset += len(line)
+                    continue
+                record_hash = _content_hash(line[:-1])
+                self._index.pop(url, None)
+                self._index[url] = (offset, len(line), record_hash)
+                entries.append({'url': url, 'offset': offset, 'length': len(line), 'hash': record_hash})
+                self._records += 1
+                offset += len(line)
+
+        if offset != self.data_path.stat().st_size:
+            with open(self.data_path, 'r+b') as f:
+                f.truncate(offset)
+
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def compact(self) -> None:
+        """Rewrite the store keeping only the latest record of each URL."""
+        with self._lock:
+            reopen = hasattr(self, '_data_file')
+            if reopen:
+                self._close_files()
+
+            tmp_data = self.data_path.with_suffix('.jsonl.tmp')
+            tmp_index = self.index_path.with_suffix('.idx.tmp')
+            new_index: Dict[str, Tuple[int, int, str]] = {}
+            offset = 0
+            with open(self.data_path, 'rb') as src, open(tmp_data, 'wb') as dst, \
+                    open(tmp_index, 'w', encoding='utf-8') as idx:
+                for url, (old_offset, length, record_hash) in sorted(self._index.items(), key=lambda x: x[1][0]):
+                    src.seek(old_offset)
+                    dst.write(src.read(length))
+                    new_index[url] = (offset, length, record_hash)
+                    idx.write(json.dumps({'url': url, 'offset': offset, 'length': length, 'hash': record_hash},
+                                         ensure_ascii=False) + '\n')
+                    offset += length
+            os.replace(tmp_data, self.data_path)
+            os.replace(tmp_index, self.index_path)
+            self._index = new_index
+            self._records = len(new_index)
+
+            if reopen:
+                self._data_file = open(self.data_path, 'ab')
+                self._index_file = open(self.index_path, 'a', encoding='utf-8')
+                self._reader = open(self.data_path, 'rb')
+
+    def save(self, page: Dict[str, Any]) -> None:
+        record = json.dumps(page, ensure_ascii=False).encode('utf-8')
+        record_hash = _content_hash(record)
+        with self._lock:
+            offset = self._data_file.tell()
+            self._data_file.write(record + b'\n')
+            self._data_file.flush()
+            entry = (offset, len(record) + 1, record_hash)
+            self._index.pop(page['url'], None)
+            self._index[page['url']] = entry
+            self._records += 1
+            self._index_file.write(json.dumps(
+                {'url': page['url'], 'offset': offset, 'length': entry[1], 'hash': record_hash},
+                ensure_ascii=False
+            ) + '\n')
+            self._index_file.flush()
+
+    def _read(self, offset: int, length: int) -> Dict[str, Any]:
+        self._reader.seek(offset)
+        return json.loads(self._reader.read(length))
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return None
+            return self._read(entry[0], entry[1])
+
+    def iter_pages(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            locations = sorted((offset, length) for offset, length, _ in self._index.values())
+        # Separate handle so iteration can interleave with get()/save()
+        with open(self.data_path, 'rb') as f:
+            for offset, length in locations:
+                f.seek(offset)
+                yield json.loads(f.read(length))
+
+    def iter_hashes(self) -> Iterator[Tuple[str, str]]:
+        with self._lock:
+            items = sorted(self._index.items(), key=lambda x: x[1][0])
+        for url, (_, _, record_hash) in items:
+            yield url, record_hash
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._index
+
+    def flush(self) -> None:
+        with self._lock:
+            self._data_file.flush()
+            self._index_file.flush()
+
+    def _close_files(self) -> None:
+        self._data_file.close()
+        self._index_file.close()
+        self._reader.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_files()
+
+
+class SQLitePageStore(PageStore):
+    """SQLite store: one row per URL in pages.db, ordered by first insertion."""
+
+    backend = 'sqlite'
+    DB_FILE = 'pages.db'
+    COMMIT_EVERY = 200
+
+    def __init__(self, data_dir: Union[str, Path]) -> None:
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.data_dir / self.DB_FILE
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " url TEXT UNIQUE NOT NULL,"
+            " hash TEXT NOT NULL,"
+            " data TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        self._uncommitted = 0
+
+    def save(self, page: Dict[str, Any]) -> None:
+        record = json.dumps(page, ensure_ascii=False)
+        record_hash = _content_hash(record.encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO pages (url, hash, data) VALUES (?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET hash = excluded.hash, data = excluded.data",
+                (page['url'], record_hash, record)
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= self.COMMIT_EVERY:
+                self._conn.commit()
+                self._uncommitted = 0
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM pages WHERE url = ?", (url,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_pages(self) -> Iterator[Dict[str, Any]]:
+        self.flush()
+        # Separate read-only connection so iteration can interleave with writes
+        conn = sqlite3.connect(str(self.path))
+        try:
+            for (data,) in conn.execute("SELECT data FROM pages ORDER BY seq"):
+                yield json.loads(data)
+        finally:
+            conn.close()
+
+    def iter_hashes(self) -> Iterator[Tuple[str, str]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT url, hash FROM pages ORDER BY seq").fetchall()
+        return iter(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def __contains__(self, url: object) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM pages WHERE url = ?", (url,)).fetchone() is not None
+
+    def flush(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._uncommitted = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+
+def migrate_directory_store(pages_dir: Union[str, Path], store: PageStore) -> int:
+    """Import pages from the legacy one-file-per-page layout into another store.
+
+    Args:
+        pages_dir: Legacy ``pages/`` directory
+        store: Destination store
+
+    Returns:
+        Number of pages imported
+    """
+    count = 0
+    for page in DirectoryPageStore(pages_dir).iter_pages():
+        store.save(page)
+        count += 1
+    store.flush()
+    return count
+
+
+def open_page_store(data_dir: Union[str, Path], backend: str = 'jsonl') -> PageStore:
+    """Open the page store of a scrape data directory.
+
+    For the jsonl and sqlite backends, pages found in a legacy ``pages/``
+    directory are imported the first time the store is opened.
+
+    Args:
+        data_dir: Scrape data directory (e.g. output/react_data)
+        backend: 'jsonl', 'sqlite' or 'directory'
+
+    Returns:
+        PageStore instance
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    data_dir = Path(data_dir)
+    pages_dir = data_dir / "pages"
+
+    if backend == 'directory':
+        return DirectoryPageStore(pages_dir)
+
+    store: PageStore
+    if backend == 'jsonl':
+        store = JSONLPageStore(data_dir)
+    elif backend == 'sqlite':
+        store = SQLitePageStore(data_dir)
+    else:
+        raise ValueError(f"Unknown page store backend: {backend!r} (use one of {', '.join(PAGE_STORE_BACKENDS)})")
+
+    if len(store) == 0 and pages_dir.is_dir() and any(pages_dir.glob("*.json")):
+        logger.info("📦 Migrating pages/ to the %s page store...", backend)
+        count = migrate_directory_store(pages_dir, store)
+        logger.info("  ✓ Migrated %d pages (the old pages/ directory can be deleted)", count)
+
+    return store
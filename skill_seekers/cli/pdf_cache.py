@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Persistent cache of extracted PDF pages.
+
+Entries are content-addressed: the key combines a hash of the PDF file,
+the page number and the extraction options that change a page's output
+(OCR, tables, quality filter, ...). Editing the PDF or changing an option
+therefore misses the cache, while re-running with the same file and
+options (e.g. after only changing categories) turns page extraction into
+a JSON read.
+
+The cache directory is bounded in size: reads refresh an entry's mtime,
+and when the total size grows past the limit the least recently used
+entries are deleted.
+
+Usage:
+    from skill_seekers.cli.pdf_cache import PageExtractionCache
+
+    cache = PageExtractionCache('output/.pdf_cache', max_size_mb=512)
+    key = cache.make_key(cache.file_hash('manual.pdf'), 'page_0', {'use_ocr': False})
+    page = cache.get(key)
+    if page is None:
+        page = extract(...)
+        cache.put(key, page)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+from skill_seekers.cli.constants import DEFAULT_PDF_CACHE_SIZE_MB
+
+logger = logging.getLogger(__name__)
+
+
+class PageExtractionCache:
+    """Size-bounded LRU cache of extracted pages on disk, keyed by content hash."""
+
+    def __init__(self, cache_dir: Union[str, Path], max_size_mb: float = DEFAULT_PDF_CACHE_SIZE_MB) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries (created if missing)
+            max_size_mb: Total size of all entries before LRU eviction starts
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+        self._size = sum(size for _, _, size in self._entries())
+        if self._size > self.max_size:
+            self.evict()
+
+    @staticmethod
+    def file_hash(path: Union[str, Path]) -> str:
+        """Return the SHA-256 hex digest of a file's content."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(file_hash: str, item: str, options: Mapping[str, Any]) -> str:
+        """Build the cache key of one item (e.g. 'page_12') of a file under given options."""
+        payload = json.dumps([file_hash, item, dict(options)], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def contains(self, key: str) -> bool:
+        """Return True if an entry exists for the key (does not count as a hit)."""
+        return self._entry_path(key).exists()
+
+    def get(
+        self,
+        key: str,
+        validate: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached value for a key and mark it recently used, or None.
+
+        Args:
+            key: Cache key (see make_key)
+            validate: Optional check of the value; if it returns False the
+                entry counts as a miss (e.g. files it refers to are gone)
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            value = None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable PDF cache entry %s: %s", path, e)
+            value = None
+        if value is not None and validate is not None and not validate(value):
+            value = None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a JSON-serializable value, evicting old entries if the cache is full."""
+        path = self._entry_path(key)
+        path.parent.mkdir(exist_ok=True)
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+        try:
+            previous = path.stat().st_size
+        except OSError:
+            previous = 0
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._size += len(data) - previous
+            over_limit = self._size > self.max_size
+        if over_limit:
+            self.evict()
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache is below 90% of its limit.
+
+        Returns:
+            int: Number of entries deleted
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        size = sum(entry_size for _, _, entry_size in entries)
+        target = self.max_size * 0.9
+        deleted = 0
+
+        for path, _, entry_size in entries:
+            if size <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            size -= entry_size
+            deleted += 1
+
+        with self._lock:
+            self._size = size
+            self.evicted += deleted
+        if deleted:
+            logger.debug("Evicted %d PDF cache entries from %s", deleted, self.cache_dir)
+        return deleted
+
+    def _entries(self):
+        """Yield (path, mtime, size) of every entry (rescanned, other processes may write too)."""
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                yield Path(entry.path), stat.st_mtime, stat.st_size
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counts and the current size in MB."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evicted': self.evicted,
+                'size_mb': round(self._size / (1024 * 1024), 2),
+            }
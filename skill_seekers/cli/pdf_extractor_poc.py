@@ -6,13 +6,14 @@ Extracts text, code blocks, and images from PDF documentation files.
 Uses PyMuPDF (fitz) for fast, high-quality extraction.
 
 Features:
-    - Text and markdown extraction
+    - Text and markdown extraction from a single layout pass per page
     - Code block detection (font, indent, pattern)
     - Language detection with confidence scoring (19+ languages) (B1.4)
     - Syntax validation and quality scoring (B1.4)
     - Quality statistics and filtering (B1.4)
     - Image extraction to files (B1.5)
     - Image filtering by size (B1.5)
+    - Image deduplication, background writes, thumbnails and manifest
     - Page chunking and chapter detection (B1.3)
     - Code block merging across pages (B1.3)
 
@@ -20,14 +21,16 @@ Advanced Features (Priority 2 & 3):
     - OCR support for scanned PDFs (requires pytesseract) (Priority 2)
     - Password-protected PDF support (Priority 2)
     - Table extraction (Priority 2)
-    - Parallel page processing (Priority 3)
-    - Caching of expensive operations (Priority 3)
+    - Parallel page processing in worker processes (Priority 3)
+    - Caching of expensive operations, optionally on disk across runs (Priority 3)
+    - Page ranges, shard merging and re-extraction of changed pages only (Priority 3)
 
 Usage:
     # Basic extraction
     python3 pdf_extractor_poc.py input.pdf
     python3 pdf_extractor_poc.py input.pdf --output output.json
     python3 pdf_extractor_poc.py input.pdf --verbose
+    python3 pdf_extractor_poc.py input.pdf -o summary.json --pages-file pages.jsonl
 
     # Quality filtering
     python3 pdf_extractor_poc.py input.pdf --min-quality 5.0
@@ -35,12 +38,18 @@ Usage:
     # Image extraction
     python3 pdf_extractor_poc.py input.pdf --extract-images
     python3 pdf_extractor_poc.py input.pdf --extract-images --image-dir images/
+    python3 pdf_extractor_poc.py input.pdf --extract-images --thumbnails webp --thumbnail-size 320
 
     # Advanced features
     python3 pdf_extractor_poc.py scanned.pdf --ocr
+    python3 pdf_extractor_poc.py scanned.pdf --ocr --ocr-dpi 200 --ocr-workers 4
     python3 pdf_extractor_poc.py encrypted.pdf --password mypassword
     python3 pdf_extractor_poc.py input.pdf --extract-tables
     python3 pdf_extractor_poc.py large.pdf --parallel --workers 8
+    python3 pdf_extractor_poc.py large.pdf --cache-dir output/.pdf_cache
+    python3 pdf_extractor_poc.py large.pdf --pages 1-500 -o part1.json
+    python3 pdf_extractor_poc.py --merge-shards part1.json part2.json -o large.json
+    python3 pdf_extractor_poc.py large_v2.pdf --previous large.json -o large_v2.json
 
 Example:
     python3 pdf_extractor_poc.py docs/manual.pdf -o output.json -v \
@@ -52,11 +61,19 @@ import os
 import sys
 import json
 import re
+import time
+import heapq
+import hashlib
 import argparse
+import queue
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 # Import unified language detector
 from skill_seekers.cli.language_detector import LanguageDetector
+from skill_seekers.cli.constants import DEFAULT_PDF_CACHE_SIZE_MB
+from skill_seekers.cli.pdf_cache import PageExtractionCache
 
 # Check if PyMuPDF is installed
 try:
@@ -74,20 +91,222 @@ try:
 except ImportError:
     TESSERACT_AVAILABLE = False
 
+
+
+def webp_supported():
+    """Return True if Pillow with WebP support is installed (needed for WebP thumbnails)."""
+    try:
+        from PIL import features
+    except ImportError:
+        return False
+    return bool(features.check('webp'))
+
+
 try:
     import concurrent.futures
     CONCURRENT_AVAILABLE = True
 except ImportError:
     CONCURRENT_AVAILABLE = False
 
+# Bump when extract_page() output changes, so on-disk cache entries are rebuilt
+PAGE_CACHE_VERSION = 4
+
+# Scored code blocks remembered per extractor (repeated headers, footers, snippets)
+CODE_SCORE_CACHE_SIZE = 4096
+
+# OCR defaults (Priority 2)
+DEFAULT_OCR_DPI = 150  # Render resolution for OCR (tesseract works best at 150-300)
+DEFAULT_OCR_MIN_TEXT = 50  # Pages with at least this much text layer are not OCRed
+DEFAULT_OCR_MIN_IMAGE_COVERAGE = 0.5  # OCR only pages mostly covered by images (scans)
+
+# Longest side of image thumbnails in pixels (NEW in B1.5)
+DEFAULT_THUMBNAIL_SIZE = 256
+THUMBNAIL_FORMATS = ('png', 'webp')
+
+
+class ImageWriter:
+    """
+    Write files on a background thread.
+
+    Page extraction hands encoded images over and moves on. The queue is
+    bounded, so memory stays flat if the disk is slower than extraction.
+    Files are written atomically and skipped if they already exist with
+    the same size (image file names are content hashes).
+    """
+
+    def __init__(self, max_pending=64):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = None
+        self.written = 0
+        self.skipped = 0
+        self.errors = []
+
+    def write(self, path, data):
+        """Queue bytes to be written to path (blocks while the queue is full)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='pdf-image-writer', daemon=True)
+            self._thread.start()
+        self._queue.put((Path(path), data))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                path, data = item
+                if path.exists() and path.stat().st_size == len(data):
+                    self.skipped += 1
+                    continue
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+                self.written += 1
+            except OSError as e:
+                self.errors.append(f"{item[0]}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Wait until every queued file is written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """Flush and stop the writer thread (restarted by the next write)."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+
+class ExtractionStats:
+    """
+    Running totals over extracted pages.
+
+    Pages are added one at a time, so summaries of streamed extractions
+    don't need all pages in memory.
+    """
+
+    def __init__(self, slowest=5):
+        self.total_pages = 0
+        self.total_chars = 0
+        self.total_code_blocks = 0
+        self.total_headings = 0
+        self.total_images = 0
+        self.total_tables = 0
+        self.languages = {}
+
+        # Code quality sums (NEW in B1.4)
+        self._code_count = 0
+        self._quality_sum = 0.0
+        self._confidence_sum = 0.0
+        self._valid = 0
+        self._high = 0
+        self._medium = 0
+        self._low = 0
+
+        # Per-stage timings
+        self.slowest = slowest
+        self._timed_pages = 0
+        self._total_ms = 0.0
+        self._stage_ms = {}
+        self._slowest_pages = []  # Min-heap of (ms, page_number)
+
+    def add(self, page):
+        """Add one (finalized) page to the totals."""
+        self.total_pages += 1
+        self.total_chars += page['char_count']
+        self.total_code_blocks += page['code_blocks_count']
+        self.total_headings += len(page['headings'])
+        self.total_images += page['images_count']
+        self.total_tables += page['tables_count']
+
+        for code in page['code_samples']:
+            lang = code['language']
+            self.languages[lang] = self.languages.get(lang, 0) + 1
+            score = code['quality_score']
+            self._code_count += 1
+            self._quality_sum += score
+            self._confidence_sum += code['confidence']
+            self._valid += 1 if code['is_valid'] else 0
+            if score >= 7.0:
+                self._high += 1
+            elif score >= 4.0:
+                self._medium += 1
+            else:
+                self._low += 1
+
+        timings = page.get('timings')
+        if timings:
+            self._timed_pages += 1
+            self._total_ms += timings['total']
+            for stage, ms in timings.items():
+                if stage != 'total':
+                    self._stage_ms[stage] = self._stage_ms.get(stage, 0.0) + ms
+            heapq.heappush(self._slowest_pages, (timings['total'], page['page_number']))
+            if len(self._slowest_pages) > self.slowest:
+                heapq.heappop(self._slowest_pages)
+
+    def quality_statistics(self):
+        """Code quality summary (NEW in B1.4), or {} if no code blocks were found."""
+        if not self._code_count:
+            return {}
+        return {
+            'average_quality': self._quality_sum / self._code_count,
+            'average_confidence': self._confidence_sum / self._code_count,
+            'valid_code_blocks': self._valid,
+            'invalid_code_blocks': self.total_code_blocks - self._valid,
+            'validation_rate': self._valid / self.total_code_blocks if self.total_code_blocks > 0 else 0,
+            'high_quality_blocks': self._high,
+            'medium_quality_blocks': self._medium,
+            'low_quality_blocks': self._low,
+        }
+
+    def timing_statistics(self):
+        """
+        Sum of the per-page stage timings recorded by extract_page().
+
+        Pages read from the on-disk cache carry the timings of the run that
+        extracted them.
+
+        Returns dict with total/average milliseconds, milliseconds per stage
+        and the slowest pages, or {} if no page has timings.
+        """
+        if not self._timed_pages:
+            return {}
+        return {
+            'total_ms': round(self._total_ms, 2),
+            'average_page_ms': round(self._total_ms / self._timed_pages, 2),
+            'stage_ms': {stage: round(ms, 2) for stage, ms in self._stage_ms.items()},
+            'slowest_pages': [
+                {'page_number': page_number, 'ms': ms}
+                for ms, page_number in sorted(self._slowest_pages, reverse=True)
+            ],
+        }
+
 
 class PDFExtractor:
     """Extract text and code from PDF documentation"""
 
+    # Font name fragments that indicate a monospace (code) font
+    MONOSPACE_FONTS = ('courier', 'mono', 'consolas', 'menlo', 'monaco', 'dejavu')
+
+    # Lines this much larger than the body text size are headings
+    HEADING_SIZE_RATIO = 1.15
+
     def __init__(self, pdf_path, verbose=False, chunk_size=10, min_quality=0.0,
                  extract_images=False, image_dir=None, min_image_size=100,
                  use_ocr=False, password=None, extract_tables=False,
-                 parallel=False, max_workers=None, use_cache=True):
+                 parallel=False, max_workers=None, use_cache=True,
+                 cache_dir=None, cache_size_mb=DEFAULT_PDF_CACHE_SIZE_MB,
+                 ocr_dpi=DEFAULT_OCR_DPI, ocr_grayscale=True, ocr_workers=None,
+                 ocr_min_text=DEFAULT_OCR_MIN_TEXT,
+                 ocr_min_image_coverage=DEFAULT_OCR_MIN_IMAGE_COVERAGE,
+                 thumbnail_format=None, thumbnail_size=DEFAULT_THUMBNAIL_SIZE,
+                 page_range=None, previous=None):
         self.pdf_path = pdf_path
         self.verbose = verbose
         self.chunk_size = chunk_size  # Pages per chunk (0 = no chunking)
@@ -95,66 +314,192 @@ class PDFExtractor:
         self.extract_images = extract_images  # Extract images to files (NEW in B1.5)
         self.image_dir = image_dir  # Directory to save images (NEW in B1.5)
         self.min_image_size = min_image_size  # Minimum image dimension (NEW in B1.5)
+        self.thumbnail_format = thumbnail_format  # 'png', 'webp' or None (no thumbnails)
+        self.thumbnail_size = thumbnail_size  # Longest thumbnail side in pixels
+        if thumbnail_format == 'webp' and not webp_supported():
+            # Resolved once, so cache keys and recorded options are the same for every page
+            self.log("⚠️  WebP thumbnails need Pillow with WebP support (pip install Pillow), using PNG")
+            self.thumbnail_format = 'png'
 
         # Advanced features (Priority 2 & 3)
         self.use_ocr = use_ocr  # OCR for scanned PDFs (Priority 2)
+        self.ocr_dpi = ocr_dpi  # Render resolution of OCRed pages
+        self.ocr_grayscale = ocr_grayscale  # Render OCRed pages in grayscale (smaller, same accuracy)
+        self.ocr_workers = ocr_workers if ocr_workers is not None else (os.cpu_count() or 1)  # 0 = OCR inline
+        self.ocr_min_text = ocr_min_text  # Skip OCR if the text layer has this many chars
+        self.ocr_min_image_coverage = ocr_min_image_coverage  # Skip OCR if images cover less of the page
         self.password = password  # Password for encrypted PDFs (Priority 2)
         self.extract_tables = extract_tables  # Extract tables (Priority 2)
         self.parallel = parallel  # Parallel processing (Priority 3)
-        self.max_workers = max_workers or os.cpu_count()  # Worker threads (Priority 3)
+        self.max_workers = max_workers or os.cpu_count()  # Worker processes (Priority 3)
         self.use_cache = use_cache  # Cache expensive operations (Priority 3)
+        self.page_range = page_range  # (first, last) 1-based pages to extract, last None = to the end
+        self.previous_file = previous  # Summary JSON of a previous extraction to diff against
 
         self.doc = None
         self.pages = []
+        self.pages_file = None  # JSONL file pages are streamed to (extract_all(pages_file=...))
         self.chapters = []  # Detected chapters/sections
-        self.extracted_images = []  # List of extracted image info (NEW in B1.5)
+        self.previous = None  # PreviousExtraction loaded from previous_file (diff mode)
+        self.diff = None  # Changed/unchanged pages found in diff mode
+        self.extracted_images = []  # Unique extracted images with their pages (NEW in B1.5)
+        self.image_manifest = None  # Path of the per-document image manifest
+        self.image_writer = ImageWriter()  # Saves images off the extraction thread
+        self._images_by_xref = {}  # xref -> image info or None (skipped), per document handle
+        self._images_by_hash = {}  # Content hash -> image info saved by this process
+        self._manifest_entries = {}  # Content hash -> entry of extracted_images
         self._cache = {}  # Cache for expensive operations (Priority 3)
-
-        # Language detection
-        self.language_detector = LanguageDetector(min_confidence=0.15)
+        self.memory_cache = True  # Keep pages in _cache (off in pool workers, which never revisit a page)
+        # Persistent page cache shared across runs (None = in-memory only)
+        self.page_cache = PageExtractionCache(cache_dir, cache_size_mb) if (use_cache and cache_dir) else None
+        self.file_hash = None  # Content hash of the PDF, set by extract_all() when page_cache is used
+        self._code_scores = OrderedDict()  # LRU memo of score_code() results
+        self._ocr_pool = None  # Thread pool running tesseract processes
+        self._ocr_pending = {}  # page_num -> OCR text, Future or None (skipped)
+        self._ocr_texts = {}  # Page image hash -> OCR text or running Future (duplicate scans)
+
+        # Language detection (memoized per process, and across runs next to the page cache)
+        self.language_detector = LanguageDetector(min_confidence=0.15, use_cache=use_cache)
+        self.language_cache_file = (os.path.join(cache_dir, 'language_cache.json')
+                                    if self.page_cache is not None else None)
 
     def log(self, message):
         """Print message if verbose mode enabled"""
         if self.verbose:
             print(message)
 
-    def extract_text_with_ocr(self, page):
+    def extract_text_with_ocr(self, page, text=None):
         """
         Extract text from scanned PDF page using OCR (Priority 2).
         Falls back to regular text extraction if OCR is not available.
 
+        Pages are only OCRed if needs_ocr() says so. The OCR itself may
+        already be running in the OCR pool (see schedule_ocr()).
+
         Args:
             page: PyMuPDF page object
+            text: Text already extracted from the page (skips another text pass)
 
         Returns:
             str: Extracted text
         """
         # Try regular text extraction first
-        text = page.get_text("text").strip()
+        if text is None:
+            text = page.get_text("text")
+        text = text.strip()
 
-        # If page has very little text, it might be scanned
-        if len(text) < 50 and self.use_ocr:
-            if not TESSERACT_AVAILABLE:
-                self.log("⚠️  OCR requested but pytesseract not installed")
-                self.log("   Install with: pip install pytesseract Pillow")
-                return text
+        if not self.use_ocr:
+            return text
+        if not TESSERACT_AVAILABLE:
+            self.log("⚠️  OCR requested but pytesseract not installed")
+            self.log("   Install with: pip install pytesseract Pillow")
+            return text
 
-            try:
-                # Render page as image
-                pix = page.get_pixmap()
-                img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+        if page.number not in self._ocr_pending:
+            self.schedule_ocr(page, text)
+        pending = self._ocr_pending.pop(page.number, None)
+        if pending is None:
+            return text
 
-                # Run OCR
-                ocr_text = pytesseract.image_to_string(img)
-                self.log(f"   OCR extracted {len(ocr_text)} chars (was {len(text)})")
-                return ocr_text if len(ocr_text) > len(text) else text
+        try:
+            image_hash, result = pending
+            ocr_text = result.result() if isinstance(result, concurrent.futures.Future) else result
+        except Exception as e:
+            self.log(f"   OCR failed: {e}")
+            return text
+
+        self._remember_ocr(image_hash, ocr_text)
+        self.log(f"   OCR extracted {len(ocr_text)} chars (was {len(text)})")
+        return ocr_text if len(ocr_text) > len(text) else text
+
+    def image_coverage(self, page):
+        """Return the fraction of the page area covered by images (0-1)."""
+        page_rect = page.rect
+        page_area = page_rect.width * page_rect.height
+        if not page_area:
+            return 0.0
+        covered = 0.0
+        for info in page.get_image_info():
+            bbox = fitz.Rect(info['bbox']) & page_rect
+            if not bbox.is_empty:
+                covered += bbox.width * bbox.height
+        return min(1.0, covered / page_area)
+
+    def needs_ocr(self, page, text=None):
+        """
+        Decide whether a page should be OCRed.
 
-            except Exception as e:
-                self.log(f"   OCR failed: {e}")
-                return text
+        Pages are OCRed when images cover at least ocr_min_image_coverage
+        of the page (as scans do) and the text layer is shorter than
+        ocr_min_text characters. The cheap image check runs first, so
+        ordinary pages don't need their text extracted here.
+        """
+        if self.ocr_min_image_coverage > 0 and self.image_coverage(page) < self.ocr_min_image_coverage:
+            return False
+        if text is None:
+            text = page.get_text("text")
+        return len(text.strip()) < self.ocr_min_text
+
+    def schedule_ocr(self, page, text=None):
+        """
+        Start OCR of a page if it needs it, without waiting for the result.
+
+        The page is rendered here (PyMuPDF documents must stay on one
+        thread) and recognized in the OCR pool. Results are looked up by
+        image hash first, so duplicate scanned pages and re-runs with a
+        page cache are not OCRed again.
+        """
+        if not (self.use_ocr and TESSERACT_AVAILABLE) or page.number in self._ocr_pending:
+            return
+        if not self.needs_ocr(page, text):
+            self._ocr_pending[page.number] = None
+            return
 
+        colorspace = fitz.csGRAY if self.ocr_grayscale else fitz.csRGB
+        pix = page.get_pixmap(dpi=self.ocr_dpi, colorspace=colorspace, alpha=False)
+        image_hash = hashlib.sha256(pix.samples).hexdigest()
+
+        cached = self._cached_ocr(image_hash)
+        if cached is not None:
+            self._ocr_pending[page.number] = (image_hash, cached)
+            return
+
+        img = Image.frombytes("L" if self.ocr_grayscale else "RGB", [pix.width, pix.height], pix.samples)
+        if self.ocr_workers > 0:
+            if self._ocr_pool is None:
+                self._ocr_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.ocr_workers)
+            # tesseract runs as a separate process, so threads OCR pages in parallel
+            result = self._ocr_pool.submit(pytesseract.image_to_string, img)
+        else:
+            result = pytesseract.image_to_string(img)
+        # Identical pages scheduled before this one finishes share the result
+        self._ocr_texts[image_hash] = result
+        self._ocr_pending[page.number] = (image_hash, result)
+
+    def _cached_ocr(self, image_hash):
+        """OCR text (or running Future) for a page image hash, or None."""
+        text = self._ocr_texts.get(image_hash)
+        if text is None and self.page_cache is not None:
+            # The image hash already covers DPI and color mode
+            entry = self.page_cache.get(self.page_cache.make_key(image_hash, 'ocr', {}))
+            if entry is not None:
+                text = self._ocr_texts[image_hash] = entry['text']
         return text
 
+    def _remember_ocr(self, image_hash, text):
+        if isinstance(self._ocr_texts.get(image_hash), str):
+            return
+        self._ocr_texts[image_hash] = text
+        if self.page_cache is not None:
+            self.page_cache.put(self.page_cache.make_key(image_hash, 'ocr', {}), {'text': text})
+
+    def close_ocr_pool(self):
+        """Shut down the OCR pool (started on demand by schedule_ocr())."""
+        if self._ocr_pool is not None:
+            self._ocr_pool.shutdown(wait=True)
+            self._ocr_pool = None
+        self._ocr_pending.clear()
+
     def extract_tables_from_page(self, page):
         """
         Extract tables from PDF page (Priority 2).
@@ -189,9 +534,32 @@ class PDFExtractor:
 
         return tables
 
+    def cache_options(self):
+        """
+        Extraction options that change extracted page content.
+        Part of every on-disk cache key, so changing one misses the cache.
+        """
+        return {
+            'version': PAGE_CACHE_VERSION,
+            'use_ocr': self.use_ocr and TESSERACT_AVAILABLE,
+            'ocr': [self.ocr_dpi, self.ocr_grayscale, self.ocr_min_text, self.ocr_min_image_coverage] if self.use_ocr else None,
+            'extract_tables': self.extract_tables,
+            'min_quality': self.min_quality,
+            'extract_images': self.extract_images,
+            'image_dir': self.image_dir,
+            'min_image_size': self.min_image_size,
+            'thumbnails': [self.thumbnail_format, self.thumbnail_size] if self.thumbnail_format else None,
+        }
+
+    def _disk_key(self, key):
+        if self.page_cache is None or self.file_hash is None:
+            return None
+        return self.page_cache.make_key(self.file_hash, key, self.cache_options())
+
     def get_cached(self, key):
         """
         Get cached value (Priority 3).
+        Falls back to the on-disk cache when cache_dir is set.
 
         Args:
             key: Cache key
@@ -201,18 +569,51 @@ class PDFExtractor:
         """
         if not self.use_cache:
             return None
-        return self._cache.get(key)
+        value = self._cache.get(key)
+        if value is None:
+            disk_key = self._disk_key(key)
+            if disk_key is not None:
+                value = self.page_cache.get(disk_key)
+        return value
 
     def set_cached(self, key, value):
         """
         Set cached value (Priority 3).
+        Also written to the on-disk cache when cache_dir is set.
 
         Args:
             key: Cache key
             value: Value to cache
         """
         if self.use_cache:
-            self._cache[key] = value
+            if self.pages_file is None and self.memory_cache:
+                # Streamed extractions must not keep every page in memory
+                self._cache[key] = value
+            disk_key = self._disk_key(key)
+            if disk_key is not None:
+                self.page_cache.put(disk_key, value)
+
+    def load_cached_page(self, page_num):
+        """
+        Return a page from the on-disk cache, or None.
+
+        A cached page whose extracted image files no longer exist counts as
+        a miss, so the images are written again.
+        """
+        disk_key = self._disk_key(f"page_{page_num}")
+        if disk_key is None:
+            return None
+        page_data = self.page_cache.get(
+            disk_key,
+            validate=lambda page: all(
+                os.path.exists(img['path']) and (not img['thumbnail'] or os.path.exists(img['thumbnail']))
+                for img in page['extracted_images']
+            )
+        )
+        if page_data is None:
+            return None
+        self.log(f"  Page {page_num + 1}: Using cached data")
+        return page_data
 
     def detect_language_from_code(self, code):
         """
@@ -287,11 +688,15 @@ class PDFExtractor:
 
         return len(issues) == 0, issues
 
-    def score_code_quality(self, code, language, confidence):
+    def score_code_quality(self, code, language, confidence, validation=None):
         """
         Score the quality/usefulness of detected code block.
         New in B1.4.
 
+        Args:
+            validation: (is_valid, issues) from validate_code_syntax(), if
+                already known
+
         Returns quality score (0-10)
         """
         score = 5.0  # Start with neutral score
@@ -325,7 +730,7 @@ class PDFExtractor:
             score += 1.0
 
         # Factor 6: Syntax validation
-        is_valid, issues = self.validate_code_syntax(code, language)
+        is_valid, issues = validation or self.validate_code_syntax(code, language)
         if is_valid:
             score += 1.0
         else:
@@ -334,147 +739,142 @@ class PDFExtractor:
         # Clamp score to 0-10 range
         return max(0, min(10, score))
 
-    def detect_code_blocks_by_font(self, page):
+    def is_monospace_font(self, font):
+        """Return True if a font name looks like a monospace (code) font."""
+        font = font.lower()
+        return any(mf in font for mf in self.MONOSPACE_FONTS)
+
+    def score_code(self, code):
         """
-        Detect code blocks by analyzing font properties.
-        Monospace fonts typically indicate code.
+        Detect language, validate and score one code block.
 
-        Returns list of detected code blocks with metadata.
+        Results are memoized (LRU, CODE_SCORE_CACHE_SIZE entries), since
+        running headers, footers and repeated snippets recur across pages.
+
+        Returns (language, confidence, quality_score, is_valid, issues) tuple
+        """
+        scores = self._code_scores.get(code)
+        if scores is not None:
+            self._code_scores.move_to_end(code)
+            return scores
+
+        lang, confidence = self.detect_language_from_code(code)
+        is_valid, issues = self.validate_code_syntax(code, lang)
+        quality = self.score_code_quality(code, lang, confidence, (is_valid, issues))
+        scores = (lang, confidence, quality, is_valid, tuple(issues))
+
+        self._code_scores[code] = scores
+        if len(self._code_scores) > CODE_SCORE_CACHE_SIZE:
+            self._code_scores.popitem(last=False)
+        return scores
+
+    def score_code_blocks(self, candidates):
+        """
+        Deduplicate candidate code blocks and score the unique ones.
+
+        Candidates come from the collect_code_blocks_* methods. Scores only
+        depend on the code, so for duplicates the first candidate is kept
+        (detectors run in order font, indent, pattern).
+
+        Returns list of scored code blocks.
         """
+        unique = {}
+        for candidate in candidates:
+            unique.setdefault(candidate['code'], candidate)
+
         code_blocks = []
-        blocks = page.get_text("dict")["blocks"]
+        for code, candidate in unique.items():
+            lang, confidence, quality, is_valid, issues = self.score_code(code)
+            block = {
+                'code': code,
+                'language': lang,
+                'confidence': confidence,
+                'quality_score': quality,
+                'is_valid': is_valid,
+                'validation_issues': list(issues) if not is_valid else [],
+            }
+            block.update((key, value) for key, value in candidate.items() if key != 'code')
+            code_blocks.append(block)
+        return code_blocks
 
-        monospace_fonts = ['courier', 'mono', 'consolas', 'menlo', 'monaco', 'dejavu']
+    def collect_code_blocks_by_font(self, blocks):
+        """
+        Collect unscored code block candidates set in a monospace font.
+
+        Args:
+            blocks: Text blocks of page.get_text("dict") (see extract_layout())
 
+        Returns list of dicts with 'code', 'font' and 'detection_method'.
+        """
+        candidates = []
         current_code = []
         current_font = None
 
+        def flush():
+            code_text = ''.join(current_code).strip()
+            if len(code_text) > 10:  # Minimum code length
+                candidates.append({'code': code_text, 'font': current_font, 'detection_method': 'font'})
+
         for block in blocks:
             if 'lines' not in block:
                 continue
 
             for line in block['lines']:
                 for span in line['spans']:
-                    font = span['font'].lower()
-                    text = span['text']
-
                     # Check if font is monospace
-                    is_monospace = any(mf in font for mf in monospace_fonts)
-
-                    if is_monospace:
+                    if self.is_monospace_font(span['font']):
                         # Accumulate code text
-                        current_code.append(text)
+                        current_code.append(span['text'])
                         current_font = span['font']
-                    else:
+                    elif current_code:
                         # End of code block
-                        if current_code:
-                            code_text = ''.join(current_code).strip()
-                            if len(code_text) > 10:  # Minimum code length
-                                lang, confidence = self.detect_language_from_code(code_text)
-                                quality = self.score_code_quality(code_text, lang, confidence)
-                                is_valid, issues = self.validate_code_syntax(code_text, lang)
-
-                                code_blocks.append({
-                                    'code': code_text,
-                                    'language': lang,
-                                    'confidence': confidence,
-                                    'quality_score': quality,
-                                    'is_valid': is_valid,
-                                    'validation_issues': issues if not is_valid else [],
-                                    'font': current_font,
-                                    'detection_method': 'font'
-                                })
-                            current_code = []
-                            current_font = None
+                        flush()
+                        current_code = []
+                        current_font = None
 
         # Handle final code block
         if current_code:
-            code_text = ''.join(current_code).strip()
-            if len(code_text) > 10:
-                lang, confidence = self.detect_language_from_code(code_text)
-                quality = self.score_code_quality(code_text, lang, confidence)
-                is_valid, issues = self.validate_code_syntax(code_text, lang)
-
-                code_blocks.append({
-                    'code': code_text,
-                    'language': lang,
-                    'confidence': confidence,
-                    'quality_score': quality,
-                    'is_valid': is_valid,
-                    'validation_issues': issues if not is_valid else [],
-                    'font': current_font,
-                    'detection_method': 'font'
-                })
+            flush()
 
-        return code_blocks
+        return candidates
 
-    def detect_code_blocks_by_indent(self, text):
+    def collect_code_blocks_by_indent(self, text):
         """
-        Detect code blocks by indentation patterns.
-        Code often has consistent indentation.
+        Collect unscored code block candidates from indented line runs.
 
-        Returns list of detected code blocks.
+        Returns list of dicts with 'code' and 'detection_method'.
         """
-        code_blocks = []
-        lines = text.split('\n')
+        candidates = []
         current_block = []
-        indent_pattern = None
 
-        for line in lines:
+        def flush():
+            if len(current_block) >= 2:  # At least 2 lines
+                code_text = '\n'.join(current_block).strip()
+                if len(code_text) > 20:  # Minimum code length
+                    candidates.append({'code': code_text, 'detection_method': 'indent'})
+
+        for line in text.split('\n'):
             # Check for indentation (4 spaces or tab)
             if line.startswith('    ') or line.startswith('\t'):
                 # Start or continue code block
-                if not indent_pattern:
-                    indent_pattern = line[:4] if line.startswith('    ') else '\t'
                 current_block.append(line)
             else:
                 # End of code block
-                if current_block and len(current_block) >= 2:  # At least 2 lines
-                    code_text = '\n'.join(current_block).strip()
-                    if len(code_text) > 20:  # Minimum code length
-                        lang, confidence = self.detect_language_from_code(code_text)
-                        quality = self.score_code_quality(code_text, lang, confidence)
-                        is_valid, issues = self.validate_code_syntax(code_text, lang)
-
-                        code_blocks.append({
-                            'code': code_text,
-                            'language': lang,
-                            'confidence': confidence,
-                            'quality_score': quality,
-                            'is_valid': is_valid,
-                            'validation_issues': issues if not is_valid else [],
-                            'detection_method': 'indent'
-                        })
+                flush()
                 current_block = []
-                indent_pattern = None
 
         # Handle final block
-        if current_block and len(current_block) >= 2:
-            code_text = '\n'.join(current_block).strip()
-            if len(code_text) > 20:
-                lang, confidence = self.detect_language_from_code(code_text)
-                quality = self.score_code_quality(code_text, lang, confidence)
-                is_valid, issues = self.validate_code_syntax(code_text, lang)
-
-                code_blocks.append({
-                    'code': code_text,
-                    'language': lang,
-                    'confidence': confidence,
-                    'quality_score': quality,
-                    'is_valid': is_valid,
-                    'validation_issues': issues if not is_valid else [],
-                    'detection_method': 'indent'
-                })
+        flush()
 
-        return code_blocks
+        return candidates
 
-    def detect_code_blocks_by_pattern(self, text):
+    def collect_code_blocks_by_pattern(self, text):
         """
-        Detect code blocks by common code patterns (keywords, syntax).
+        Collect unscored code snippet candidates matching common code patterns.
 
-        Returns list of detected code snippets.
+        Returns list of dicts with 'code', 'detection_method' and 'pattern_type'.
         """
-        code_blocks = []
+        candidates = []
 
         # Common code patterns that span multiple lines
         patterns = [
@@ -487,26 +887,44 @@ class PDFExtractor:
         ]
 
         for pattern, block_type in patterns:
-            matches = re.finditer(pattern, text, re.MULTILINE | re.DOTALL)
-            for match in matches:
+            for match in re.finditer(pattern, text, re.MULTILINE | re.DOTALL):
                 code_text = match.group(1).strip()
                 if len(code_text) > 15:
-                    lang, confidence = self.detect_language_from_code(code_text)
-                    quality = self.score_code_quality(code_text, lang, confidence)
-                    is_valid, issues = self.validate_code_syntax(code_text, lang)
-
-                    code_blocks.append({
-                        'code': code_text,
-                        'language': lang,
-                        'confidence': confidence,
-                        'quality_score': quality,
-                        'is_valid': is_valid,
-                        'validation_issues': issues if not is_valid else [],
-                        'detection_method': 'pattern',
-                        'pattern_type': block_type
-                    })
+                    candidates.append({'code': code_text, 'detection_method': 'pattern', 'pattern_type': block_type})
 
-        return code_blocks
+        return candidates
+
+    def detect_code_blocks_by_font(self, page, blocks=None):
+        """
+        Detect code blocks by analyzing font properties.
+        Monospace fonts typically indicate code.
+
+        Args:
+            page: PyMuPDF page object
+            blocks: Text blocks from extract_layout() (skips another layout pass)
+
+        Returns list of detected code blocks with metadata.
+        """
+        if blocks is None:
+            blocks = page.get_text("dict")["blocks"]
+        return self.score_code_blocks(self.collect_code_blocks_by_font(blocks))
+
+    def detect_code_blocks_by_indent(self, text):
+        """
+        Detect code blocks by indentation patterns.
+        Code often has consistent indentation.
+
+        Returns list of detected code blocks.
+        """
+        return self.score_code_blocks(self.collect_code_blocks_by_indent(text))
+
+    def detect_code_blocks_by_pattern(self, text):
+        """
+        Detect code blocks by common code patterns (keywords, syntax).
+
+        Returns list of detected code snippets.
+        """
+        return self.score_code_blocks(self.collect_code_blocks_by_pattern(text))
 
     def detect_chapter_start(self, page_data):
         """
@@ -545,128 +963,277 @@ class PDFExtractor:
         Merge code blocks that are split across pages.
 
         Detects when a code block at the end of one page continues
-        on the next page.
+        on the next page. List version of iter_merged_pages().
         """
-        for i in range(len(pages) - 1):
-            current_page = pages[i]
-            next_page = pages[i + 1]
+        return list(self.iter_merged_pages(pages))
 
-            # Check if current page has code blocks
-            if not current_page['code_samples']:
-                continue
+    def iter_merged_pages(self, pages):
+        """
+        Streaming stage: merge code blocks continued on the next page.
 
-            # Get last code block of current page
-            last_code = current_page['code_samples'][-1]
+        Holds one page of lookahead. A page is yielded as soon as the page
+        after it has been merged into it, so finalized pages flow on while
+        later pages are still being extracted.
 
-            # Check if next page starts with code
-            if not next_page['code_samples']:
-                continue
+        Args:
+            pages: Page dicts in page order (any iterable, consumed once)
+        """
+        previous = None
+        for page in pages:
+            if previous is not None:
+                self.merge_code_block_pair(previous, page)
+                yield previous
+            previous = page
+        if previous is not None:
+            yield previous
+
+    def merge_code_block_pair(self, current_page, next_page):
+        """
+        Merge the first code block of a page into the last code block of
+        the page before it, if it looks like a continuation.
 
-            first_next_code = next_page['code_samples'][0]
+        The absorbed block is kept in 'merged_block', so
+        unmerge_code_blocks() can restore the extracted pages.
 
-            # Same language and detection method = likely continuation
-            if (last_code['language'] == first_next_code['language'] and
-                last_code['detection_method'] == first_next_code['detection_method']):
+        Returns True if the blocks were merged.
+        """
+        # Check if current page has code blocks
+        if not current_page['code_samples']:
+            return False
+
+        # Get last code block of current page
+        last_code = current_page['code_samples'][-1]
+
+        # Check if next page starts with code
+        if not next_page['code_samples']:
+            return False
+
+        first_next_code = next_page['code_samples'][0]
+
+        # Same language and detection method = likely continuation
+        if (last_code['language'] != first_next_code['language'] or
+                last_code['detection_method'] != first_next_code['detection_method']):
+            return False
+
+        # Check if last code block looks incomplete (doesn't end with closing brace/etc)
+        last_code_text = last_code['code'].rstrip()
+        continuation_indicators = [
+            not last_code_text.endswith('}'),
+            not last_code_text.endswith(';'),
+            last_code_text.endswith(','),
+            last_code_text.endswith('\\'),
+        ]
+        if not any(continuation_indicators):
+            return False
 
-                # Check if last code block looks incomplete (doesn't end with closing brace/etc)
-                last_code_text = last_code['code'].rstrip()
-                continuation_indicators = [
-                    not last_code_text.endswith('}'),
-                    not last_code_text.endswith(';'),
-                    last_code_text.endswith(','),
-                    last_code_text.endswith('\\'),
-                ]
+        # Merge the code blocks
+        merged_code = last_code['code'] + '\n' + first_next_code['code']
+        last_code['code'] = merged_code
+        last_code['merged_from_next_page'] = True
+        last_code['merged_block'] = first_next_code
 
-                if any(continuation_indicators):
-                    # Merge the code blocks
-                    merged_code = last_code['code'] + '\n' + first_next_code['code']
-                    last_code['code'] = merged_code
-                    last_code['merged_from_next_page'] = True
+        # Remove the first code block from next page
+        next_page['code_samples'].pop(0)
+        next_page['code_blocks_count'] -= 1
 
-                    # Remove the first code block from next page
-                    next_page['code_samples'].pop(0)
-                    next_page['code_blocks_count'] -= 1
+        self.log(f"  Merged code block from page {current_page['page_number']} to {next_page['page_number']}")
+        return True
 
-                    self.log(f"  Merged code block from page {i+1} to {i+2}")
+    def unmerge_code_blocks(self, page, previous_page=None):
+        """
+        Undo merge_continued_code_blocks() on a page (in place).
 
-        return pages
+        Args:
+            page: Page as written by a previous extraction
+            previous_page: The page before it in that extraction, whose
+                last code block may have absorbed this page's first one
 
-    def create_chunks(self, pages):
+        Returns the page as it was extracted, before merging.
+        """
+        if previous_page and previous_page['code_samples']:
+            absorbed = previous_page['code_samples'][-1].get('merged_block')
+            if absorbed is not None:
+                page['code_samples'].insert(0, absorbed)
+                page['code_blocks_count'] += 1
+
+        if page['code_samples']:
+            last_code = page['code_samples'][-1]
+            merged = last_code.pop('merged_block', None)
+            if merged is not None:
+                last_code['code'] = last_code['code'][:-(len(merged['code']) + 1)]
+                del last_code['merged_from_next_page']
+        return page
+
+    def create_chunks(self, pages, include_pages=True):
         """
         Create chunks of pages for better organization.
 
+        Args:
+            pages: Page dicts in page order (any iterable, consumed once)
+            include_pages: Embed the page dicts in each chunk. Without it,
+                chunks are page ranges only (used for streamed extraction)
+
         Returns array of chunks, each containing:
         - chunk_number
         - start_page, end_page
-        - pages (array)
+        - pages (array, only with include_pages)
         - chapter_title (if detected)
         """
+        return list(self.iter_chunks(pages, include_pages))
+
+    def iter_chunks(self, pages, include_pages=True):
+        """
+        Streaming stage: yield chunks (see create_chunks()) as pages arrive.
+
+        A chunk is yielded as soon as its last page is known: when it
+        reaches chunk_size pages, or when the next page starts a chapter.
+        Chunks are numbered by page number, so extractions of a page range
+        (shards) get the same chunk pages as a full extraction.
+        """
+        chunk_number = 0
+
+        def make_chunk(start_page, end_page, chunk_pages, chapter_title):
+            nonlocal chunk_number
+            chunk_number += 1
+            chunk = {
+                'chunk_number': chunk_number,
+                'start_page': start_page,
+                'end_page': end_page,
+                'chapter_title': chapter_title
+            }
+            if include_pages:
+                chunk['pages'] = chunk_pages
+            return chunk
+
         if self.chunk_size == 0:
             # No chunking - return all pages as one chunk
-            return [{
-                'chunk_number': 1,
-                'start_page': 1,
-                'end_page': len(pages),
-                'pages': pages,
-                'chapter_title': None
-            }]
-
-        chunks = []
+            all_pages = list(pages) if include_pages else None
+            page_numbers = [page['page_number'] for page in (all_pages if include_pages else pages)]
+            if page_numbers:
+                yield make_chunk(page_numbers[0], page_numbers[-1], all_pages, None)
+            return
+
         current_chunk = []
-        chunk_start = 0
+        chunk_length = 0
+        chunk_start = None
         current_chapter = None
+        last_page = None
+
+        for page in pages:
+            page_number = page['page_number']
 
-        for i, page in enumerate(pages):
             # Check if this page starts a new chapter
             is_chapter, chapter_title = self.detect_chapter_start(page)
 
-            if is_chapter and current_chunk:
+            if is_chapter and chunk_length:
                 # Save current chunk before starting new one
-                chunks.append({
-                    'chunk_number': len(chunks) + 1,
-                    'start_page': chunk_start + 1,
-                    'end_page': i,
-                    'pages': current_chunk,
-                    'chapter_title': current_chapter
-                })
+                yield make_chunk(chunk_start, last_page, current_chunk, current_chapter)
                 current_chunk = []
-                chunk_start = i
+                chunk_length = 0
                 current_chapter = chapter_title
 
             if not current_chapter and is_chapter:
                 current_chapter = chapter_title
 
-            current_chunk.append(page)
+            if not chunk_length:
+                chunk_start = page_number
+            if include_pages:
+                current_chunk.append(page)
+            chunk_length += 1
+            last_page = page_number
 
             # Check if chunk size reached (but don't break chapters)
-            if not is_chapter and len(current_chunk) >= self.chunk_size:
-                chunks.append({
-                    'chunk_number': len(chunks) + 1,
-                    'start_page': chunk_start + 1,
-                    'end_page': i + 1,
-                    'pages': current_chunk,
-                    'chapter_title': current_chapter
-                })
+            if not is_chapter and chunk_length >= self.chunk_size:
+                yield make_chunk(chunk_start, page_number, current_chunk, current_chapter)
                 current_chunk = []
-                chunk_start = i + 1
+                chunk_length = 0
                 current_chapter = None
 
         # Add remaining pages as final chunk
-        if current_chunk:
-            chunks.append({
-                'chunk_number': len(chunks) + 1,
-                'start_page': chunk_start + 1,
-                'end_page': len(pages),
-                'pages': current_chunk,
-                'chapter_title': current_chapter
-            })
+        if chunk_length:
+            yield make_chunk(chunk_start, last_page, current_chunk, current_chapter)
 
-        return chunks
+    def extract_layout(self, page):
+        """
+        Run one structured text pass over a page and derive plain text,
+        markdown and headings from it.
 
-    def extract_images_from_page(self, page, page_num):
+        The plain text is identical to page.get_text("text"). Headings are
+        lines set in a larger font than the body text (largest size = h1);
+        blocks set entirely in a monospace font become fenced code in the
+        markdown. The text blocks are returned too, for
+        detect_code_blocks_by_font().
+
+        Returns:
+            tuple: (text, markdown, headings, blocks)
+        """
+        blocks = [
+            block for block in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)["blocks"]
+            if block.get('type') == 0
+        ]
+
+        # One entry per line: (text, font size, all-monospace)
+        block_lines = []
+        chars_by_size = {}
+        for block in blocks:
+            lines = []
+            for line in block['lines']:
+                spans = line['spans']
+                line_text = ''.join(span['text'] for span in spans)
+                size = round(max((span['size'] for span in spans), default=0.0), 1)
+                monospace = any(span['text'].strip() for span in spans) and all(
+                    self.is_monospace_font(span['font']) for span in spans if span['text'].strip()
+                )
+                chars_by_size[size] = chars_by_size.get(size, 0) + len(line_text.strip())
+                lines.append((line_text, size, monospace))
+            block_lines.append(lines)
+
+        text = ''.join(line_text + '\n' for lines in block_lines for line_text, _, _ in lines)
+
+        # Body size = size used by most characters; bigger sizes rank as h1, h2, ...
+        body_size = max(chars_by_size, key=chars_by_size.get) if chars_by_size else 0.0
+        heading_sizes = sorted(
+            (size for size in chars_by_size if size >= body_size * self.HEADING_SIZE_RATIO),
+            reverse=True
+        )
+        heading_levels = {size: min(level, 6) for level, size in enumerate(heading_sizes, 1)}
+
+        headings = []
+        markdown_blocks = []
+        for lines in block_lines:
+            if lines and all(monospace for _, _, monospace in lines):
+                code = '\n'.join(line_text for line_text, _, _ in lines)
+                markdown_blocks.append(f"```\n{code}\n```")
+                continue
+
+            markdown_lines = []
+            for line_text, size, _ in lines:
+                stripped = line_text.strip()
+                level = heading_levels.get(size)
+                if level and stripped:
+                    headings.append({'level': f'h{level}', 'text': stripped})
+                    markdown_lines.append(f"{'#' * level} {stripped}")
+                else:
+                    markdown_lines.append(line_text)
+            markdown_blocks.append('\n'.join(markdown_lines))
+
+        markdown = '\n\n'.join(markdown_blocks)
+        return text, markdown, headings, blocks
+
+    def extract_images_from_page(self, page, page_num, image_list=None):
         """
         Extract images from a PDF page and save to disk (NEW in B1.5).
 
+        Images are deduplicated: an xref (logo, header graphic) is decoded
+        once per document, and images with identical bytes are saved once
+        under a name derived from their content hash. Files are written by
+        the background image writer.
+
+        Args:
+            page: PyMuPDF page object
+            page_num: 0-based page number
+            image_list: Result of page.get_images(), if already known
+
         Returns list of extracted image metadata.
         """
         if not self.extract_images:
@@ -674,58 +1241,132 @@ class PDFExtractor:
             return []
 
         extracted = []
-        image_list = page.get_images()
+        if image_list is None:
+            image_list = page.get_images()
 
         for img_index, img in enumerate(image_list):
+            xref = img[0]  # Image XREF number
             try:
-                xref = img[0]  # Image XREF number
-                base_image = self.doc.extract_image(xref)
+                if xref not in self._images_by_xref:
+                    self._images_by_xref[xref] = self.save_image(xref, img[2], img[3])
+            except Exception as e:
+                self.log(f"    Error extracting image {img_index}: {e}")
+                continue
 
-                if not base_image:
-                    continue
+            image_info = self._images_by_xref[xref]
+            if image_info is None or any(other['sha256'] == image_info['sha256'] for other in extracted):
+                continue
+            extracted.append(dict(image_info, page_number=page_num + 1))
 
-                image_bytes = base_image["image"]
-                image_ext = base_image["ext"]  # png, jpeg, etc.
-                width = base_image.get("width", 0)
-                height = base_image.get("height", 0)
+        return extracted
 
-                # Filter out small images (icons, bullets, etc.)
-                if width < self.min_image_size or height < self.min_image_size:
-                    self.log(f"    Skipping small image: {width}x{height}")
-                    continue
+    def save_image(self, xref, width, height):
+        """
+        Decode an image xref and queue it (and its thumbnail) for writing.
 
-                # Generate filename
-                pdf_basename = Path(self.pdf_path).stem
-                image_filename = f"{pdf_basename}_page{page_num+1}_img{img_index+1}.{image_ext}"
-
-                # Save image
-                image_path = Path(self.image_dir) / image_filename
-                image_path.parent.mkdir(parents=True, exist_ok=True)
-
-                with open(image_path, "wb") as f:
-                    f.write(image_bytes)
-
-                # Store metadata
-                image_info = {
-                    'filename': image_filename,
-                    'path': str(image_path),
-                    'page_number': page_num + 1,
-                    'width': width,
-                    'height': height,
-                    'format': image_ext,
-                    'size_bytes': len(image_bytes),
-                    'xref': xref
-                }
+        Returns image metadata, or None for images below min_image_size.
+        """
+        # Filter out small images (icons, bullets, etc.) before decoding them
+        if width < self.min_image_size or height < self.min_image_size:
+            self.log(f"    Skipping small image: {width}x{height}")
+            return None
 
-                extracted.append(image_info)
-                self.extracted_images.append(image_info)
-                self.log(f"    Extracted image: {image_filename} ({width}x{height})")
+        base_image = self.doc.extract_image(xref)
+        if not base_image:
+            return None
 
-            except Exception as e:
-                self.log(f"    Error extracting image {img_index}: {e}")
-                continue
+        image_bytes = base_image["image"]
+        image_ext = base_image["ext"]  # png, jpeg, etc.
+        image_hash = hashlib.sha256(image_bytes).hexdigest()
+        if image_hash in self._images_by_hash:
+            # Same picture stored under another xref
+            return self._images_by_hash[image_hash]
+
+        # Content-addressed name: duplicates from other workers or runs
+        # map to the same file
+        pdf_basename = Path(self.pdf_path).stem
+        image_filename = f"{pdf_basename}_{image_hash[:16]}.{image_ext}"
+        image_path = Path(self.image_dir) / image_filename
+        self.image_writer.write(image_path, image_bytes)
+
+        image_info = {
+            'filename': image_filename,
+            'path': str(image_path),
+            'width': base_image.get("width", width),
+            'height': base_image.get("height", height),
+            'format': image_ext,
+            'size_bytes': len(image_bytes),
+            'xref': xref,
+            'sha256': image_hash,
+            'thumbnail': self.save_thumbnail(image_bytes, image_path) if self.thumbnail_format else None,
+        }
+        self._images_by_hash[image_hash] = image_info
+        self.log(f"    Extracted image: {image_filename} ({image_info['width']}x{image_info['height']})")
+        return image_info
 
-        return extracted
+    def save_thumbnail(self, image_bytes, image_path):
+        """
+        Queue a downscaled copy of an image for writing.
+
+        Images no larger than thumbnail_size are their own thumbnail.
+
+        Returns the thumbnail path, or None if the image can't be rendered.
+        """
+        try:
+            pix = fitz.Pixmap(image_bytes)
+            if pix.colorspace is None:
+                return None  # Stencil masks have no colors to show
+            if pix.colorspace.n > 3:
+                pix = fitz.Pixmap(fitz.csRGB, pix)  # CMYK
+            scale = self.thumbnail_size / max(pix.width, pix.height)
+            if scale >= 1:
+                return str(image_path)
+            pix = fitz.Pixmap(pix, max(1, round(pix.width * scale)), max(1, round(pix.height * scale)), None)
+
+            if self.thumbnail_format == 'webp':
+                data = pix.pil_tobytes(format='WEBP')
+            else:
+                data = pix.tobytes('png')
+        except Exception as e:
+            self.log(f"    Error creating thumbnail for {image_path.name}: {e}")
+            return None
+
+        thumbnail_path = image_path.parent / 'thumbnails' / f"{image_path.stem}.{self.thumbnail_format}"
+        self.image_writer.write(thumbnail_path, data)
+        return str(thumbnail_path)
+
+    def record_page_images(self, page_data):
+        """
+        Add a page's images to the document image manifest.
+
+        Each unique image gets one entry in extracted_images, listing every
+        page it appears on.
+        """
+        for img in page_data['extracted_images']:
+            entry = self._manifest_entries.get(img['sha256'])
+            if entry is None:
+                entry = self._manifest_entries[img['sha256']] = dict(img, pages=[])
+                self.extracted_images.append(entry)
+            entry['pages'].append(page_data['page_number'])
+
+    def write_image_manifest(self):
+        """
+        Write the image manifest of the document next to its images.
+
+        Returns the manifest path.
+        """
+        manifest_path = Path(self.image_dir) / f"{Path(self.pdf_path).stem}_images.json"
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            'source_file': self.pdf_path,
+            'image_directory': self.image_dir,
+            'total_images': len(self.extracted_images),
+            'total_references': sum(len(img['pages']) for img in self.extracted_images),
+            'images': self.extracted_images,
+        }
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        return str(manifest_path)
 
     def extract_page(self, page_num):
         """
@@ -735,51 +1376,54 @@ class PDFExtractor:
         """
         # Check cache first (Priority 3)
         cache_key = f"page_{page_num}"
-        cached = self.get_cached(cache_key)
+        cached = self._cache.get(cache_key) if self.use_cache else None
         if cached is not None:
             self.log(f"  Page {page_num + 1}: Using cached data")
             return cached
+        cached = self.load_cached_page(page_num)
+        if cached is not None:
+            return cached
+
+        timings = {}  # Milliseconds per extraction stage
+        page_start = stage_start = time.perf_counter()
+
+        def lap(stage):
+            nonlocal stage_start
+            now = time.perf_counter()
+            timings[stage] = round((now - stage_start) * 1000, 2)
+            stage_start = now
 
         page = self.doc.load_page(page_num)
 
-        # Extract plain text (with OCR if enabled - Priority 2)
-        if self.use_ocr:
-            text = self.extract_text_with_ocr(page)
-        else:
-            text = page.get_text("text")
+        # One layout pass gives plain text, markdown, headings and font info
+        text, markdown, headings, blocks = self.extract_layout(page)
+        content_hash = self.content_hash(page, text)
+        lap('layout')
 
-        # Extract markdown (better structure preservation)
-        markdown = page.get_text("markdown")
+        # OCR pages with (almost) no text layer (Priority 2)
+        if self.use_ocr:
+            text = self.extract_text_with_ocr(page, text)
+            lap('ocr')
 
         # Extract tables (Priority 2)
         tables = self.extract_tables_from_page(page)
+        lap('tables')
 
         # Get page images (for diagrams)
         images = page.get_images()
 
         # Extract images to files (NEW in B1.5)
-        extracted_images = self.extract_images_from_page(page, page_num)
-
-        # Detect code blocks using multiple methods
-        font_code_blocks = self.detect_code_blocks_by_font(page)
-        indent_code_blocks = self.detect_code_blocks_by_indent(text)
-        pattern_code_blocks = self.detect_code_blocks_by_pattern(text)
-
-        # Merge and deduplicate code blocks
-        all_code_blocks = font_code_blocks + indent_code_blocks + pattern_code_blocks
-
-        # Simple deduplication by code content
-        unique_code = {}
-        for block in all_code_blocks:
-            code_hash = hash(block['code'])
-            if code_hash not in unique_code:
-                unique_code[code_hash] = block
-            else:
-                # Keep the one with higher quality score
-                if block['quality_score'] > unique_code[code_hash]['quality_score']:
-                    unique_code[code_hash] = block
-
-        code_samples = list(unique_code.values())
+        extracted_images = self.extract_images_from_page(page, page_num, images)
+        lap('images')
+
+        # Collect code block candidates using multiple methods, then
+        # deduplicate and score each unique block once
+        candidates = (
+            self.collect_code_blocks_by_font(blocks)
+            + self.collect_code_blocks_by_indent(text)
+            + self.collect_code_blocks_by_pattern(text)
+        )
+        code_samples = self.score_code_blocks(candidates)
 
         # Filter by minimum quality (NEW in B1.4)
         if self.min_quality > 0:
@@ -791,18 +1435,8 @@ class PDFExtractor:
 
         # Sort by quality score (highest first)
         code_samples.sort(key=lambda x: x['quality_score'], reverse=True)
-
-        # Extract headings from markdown
-        headings = []
-        for line in markdown.split('\n'):
-            if line.startswith('#'):
-                level = len(line) - len(line.lstrip('#'))
-                text = line.lstrip('#').strip()
-                if text:
-                    headings.append({
-                        'level': f'h{level}',
-                        'text': text
-                    })
+        lap('code_detection')
+        timings['total'] = round((time.perf_counter() - page_start) * 1000, 2)
 
         page_data = {
             'page_number': page_num + 1,  # 1-indexed for humans
@@ -815,7 +1449,9 @@ class PDFExtractor:
             'tables': tables,  # NEW in Priority 2
             'char_count': len(text),
             'code_blocks_count': len(code_samples),
-            'tables_count': len(tables)  # NEW in Priority 2
+            'tables_count': len(tables),  # NEW in Priority 2
+            'content_hash': content_hash,  # Text and image content (diff mode)
+            'timings': timings  # Milliseconds per extraction stage
         }
 
         # Cache the result (Priority 3)
@@ -825,16 +1461,206 @@ class PDFExtractor:
 
         return page_data
 
-    def extract_all(self):
+    def worker_options(self):
         """
-        Extract content from all pages of the PDF.
-        Enhanced with password support and parallel processing.
+        Constructor options that worker processes need to extract pages
+        exactly like this extractor.
+        """
+        return {
+            'verbose': self.verbose,
+            'chunk_size': self.chunk_size,
+            'min_quality': self.min_quality,
+            'extract_images': self.extract_images,
+            'image_dir': self.image_dir,
+            'min_image_size': self.min_image_size,
+            'thumbnail_format': self.thumbnail_format,
+            'thumbnail_size': self.thumbnail_size,
+            'use_ocr': self.use_ocr,
+            'ocr_dpi': self.ocr_dpi,
+            'ocr_grayscale': self.ocr_grayscale,
+            'ocr_workers': 0,  # Page workers already run in parallel, OCR inline
+            'ocr_min_text': self.ocr_min_text,
+            'ocr_min_image_coverage': self.ocr_min_image_coverage,
+            'password': self.password,
+            'extract_tables': self.extract_tables,
+            'use_cache': self.use_cache,
+        }
 
-        Returns dict with metadata and pages array.
+    def page_ranges(self, page_numbers):
         """
-        print(f"\n📄 Extracting from: {self.pdf_path}")
+        Split sorted page numbers into contiguous ranges for the worker pool.
+
+        Ranges are small enough to balance load (about 4 per worker) and
+        large enough to amortize task overhead.
+
+        Returns list of (start, end) tuples, end exclusive.
+        """
+        range_size = max(1, min(25, -(-len(page_numbers) // (self.max_workers * 4))))
+        ranges = []
+        for page_num in page_numbers:
+            if ranges and ranges[-1][1] == page_num and page_num - ranges[-1][0] < range_size:
+                ranges[-1] = (ranges[-1][0], page_num + 1)
+            else:
+                ranges.append((page_num, page_num + 1))
+        return ranges
+
+    def selected_pages(self):
+        """0-based numbers of the pages to extract (page_range, clamped to the document)."""
+        page_count = len(self.doc)
+        if not self.page_range:
+            return range(page_count)
+        first, last = self.page_range
+        return range(max(first or 1, 1) - 1, min(last or page_count, page_count))
+
+    def content_hash(self, page, text=None):
+        """
+        Hash of a page's text layer and image content (diff mode).
+
+        Images are included so scanned pages and replaced diagrams are not
+        taken for unchanged pages.
+
+        Args:
+            page: PyMuPDF page object
+            text: page.get_text() result, if already known
+        """
+        digest = hashlib.sha256((page.get_text() if text is None else text).encode('utf-8'))
+        for image in page.get_image_info(hashes=True):
+            digest.update(image['digest'])
+        return digest.hexdigest()
+
+    def find_unchanged_pages(self, page_numbers):
+        """
+        Compare page content hashes with the previous extraction (diff mode).
+
+        Pages are matched by content, not position, so pages moved by
+        inserted or deleted pages are recognized too.
+
+        Returns dict of 0-based page number -> page number in the previous
+        extraction, for pages whose content is unchanged.
+        """
+        unchanged = {}
+        for page_num in page_numbers:
+            previous_number = self.previous.find(self.content_hash(self.doc.load_page(page_num)))
+            if previous_number is not None:
+                unchanged[page_num] = previous_number
+
+        changed = [page_num + 1 for page_num in page_numbers if page_num not in unchanged]
+        self.diff = {
+            'previous': self.previous.summary_file,
+            'unchanged_pages': len(unchanged),
+            'changed_pages': changed,
+        }
+        print(f"🔍 Diff against {self.previous.summary_file}: "
+              f"{len(changed)} changed pages, {len(unchanged)} unchanged")
+        return unchanged
+
+    def load_previous_page(self, page_num, previous_number):
+        """
+        Reuse an unchanged page of the previous extraction (diff mode).
+
+        Code blocks merged across pages are split again, so the page is
+        merged with its new neighbours like a freshly extracted one.
 
-        # Open PDF (with password support - Priority 2)
+        Returns the page renumbered to page_num, or None if its image
+        files no longer exist.
+        """
+        page_data = self.previous.read(previous_number)
+        if previous_number > 1:
+            self.unmerge_code_blocks(page_data, self.previous.read(previous_number - 1))
+        else:
+            self.unmerge_code_blocks(page_data)
+        if not all(os.path.exists(img['path']) for img in page_data['extracted_images']):
+            return None
+
+        page_data['page_number'] = page_num + 1
+        for img in page_data['extracted_images']:
+            img['page_number'] = page_num + 1
+        self.set_cached(f"page_{page_num}", page_data)
+        self.log(f"  Page {page_num + 1}: Unchanged (page {previous_number} of {self.previous.summary_file})")
+        return page_data
+
+    def iter_pages(self):
+        """
+        Yield extracted pages of page_range in page order.
+
+        With parallel=True, page ranges are extracted in worker processes,
+        each holding its own document handle (PyMuPDF documents must not
+        be shared between threads). Ranges are yielded as soon as they and
+        all ranges before them are done. Pages already in the on-disk
+        cache, or unchanged since the previous extraction (diff mode), are
+        read here and never sent to a worker.
+
+        Every page's images are added to the image manifest, and all image
+        files are written when the generator finishes.
+        """
+        selected = self.selected_pages()
+        unchanged = self.find_unchanged_pages(selected) if self.previous is not None else {}
+        missing = [
+            page_num for page_num in selected
+            if page_num not in unchanged and (
+                self._disk_key(f"page_{page_num}") is None
+                or not self.page_cache.contains(self._disk_key(f"page_{page_num}"))
+            )
+        ]
+
+        def reused_page(page_num):
+            page_data = None
+            if page_num in unchanged:
+                page_data = self.load_previous_page(page_num, unchanged[page_num])
+            return page_data or self.extract_page(page_num)
+
+        if not (self.parallel and CONCURRENT_AVAILABLE and len(missing) > 5):
+            # Sequential extraction; OCR of the next few uncached pages
+            # runs in the OCR pool meanwhile
+            ocr_window = 2 * self.ocr_workers if (self.use_ocr and TESSERACT_AVAILABLE) else 0
+            missing = set(missing)
+            try:
+                for page_num in selected:
+                    for ahead in range(page_num, min(page_num + ocr_window, selected.stop)):
+                        if ahead in missing and ahead not in self._ocr_pending:
+                            self.schedule_ocr(self.doc.load_page(ahead))
+                    page_data = reused_page(page_num)
+                    self.record_page_images(page_data)
+                    yield page_data
+            finally:
+                self.close_ocr_pool()
+                self.image_writer.close()
+            return
+
+        ranges = self.page_ranges(missing)
+        workers = min(self.max_workers, len(ranges))
+        print(f"🚀 Extracting {len(missing)} pages in parallel ({workers} worker processes)...")
+
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_extract_worker,
+                initargs=(self.pdf_path, self.worker_options())
+            ) as executor:
+                extracted = (
+                    page_data
+                    for range_pages in executor.map(_extract_page_range, ranges)
+                    for page_data in range_pages
+                )
+                missing = set(missing)
+                for page_num in selected:
+                    if page_num in missing:
+                        # Images were saved by the worker, keep the metadata here
+                        page_data = next(extracted)
+                        self.set_cached(f"page_{page_num}", page_data)
+                    else:
+                        page_data = reused_page(page_num)  # Cache hit or unchanged page
+                    self.record_page_images(page_data)
+                    yield page_data
+        finally:
+            self.image_writer.close()
+
+    def open_document(self):
+        """
+        Open the PDF (with password support - Priority 2).
+
+        Returns True if the document is open and readable.
+        """
         try:
             self.doc = fitz.open(self.pdf_path)
 
@@ -846,17 +1672,44 @@ class PDFExtractor:
                         print(f"   ✅ Password accepted")
                     else:
                         print(f"   ❌ Invalid password")
-                        return None
+                        return False
                 else:
                     print(f"   ❌ PDF is encrypted but no password provided")
                     print(f"   Use --password option to provide password")
-                    return None
+                    return False
 
         except Exception as e:
             print(f"❌ Error opening PDF: {e}")
+            return False
+
+        return True
+
+    def extract_all(self, pages_file=None):
+        """
+        Extract content from all pages of the PDF (or of page_range).
+        Enhanced with password support and parallel processing.
+
+        Args:
+            pages_file: Stream pages to this JSONL file (one page per line)
+                instead of keeping them in memory. The result then has a
+                'pages_file' entry instead of 'pages', and its chunks are
+                page ranges without embedded pages.
+
+        Returns dict with metadata and pages array.
+        """
+        print(f"\n📄 Extracting from: {self.pdf_path}")
+
+        if not self.open_document():
+            return None
+
+        pages = self.selected_pages()
+        if not pages:
+            print(f"❌ Page range {self.page_range} is outside the document ({len(self.doc)} pages)")
             return None
 
         print(f"   Pages: {len(self.doc)}")
+        if len(pages) != len(self.doc):
+            print(f"   Page range: {pages.start + 1}-{pages.stop}")
         print(f"   Metadata: {self.doc.metadata}")
 
         # Set up image directory (NEW in B1.5)
@@ -868,71 +1721,71 @@ class PDFExtractor:
         # Show feature status
         if self.use_ocr:
             status = "✅ enabled" if TESSERACT_AVAILABLE else "⚠️  not available (install pytesseract)"
-            print(f"   OCR: {status}")
+            print(f"   OCR: {status} ({self.ocr_dpi} dpi, {self.ocr_workers} workers)")
         if self.extract_tables:
             print(f"   Table extraction: ✅ enabled")
         if self.parallel:
             status = "✅ enabled" if CONCURRENT_AVAILABLE else "⚠️  not available"
-            print(f"   Parallel processing: {status} ({self.max_workers} workers)")
+            print(f"   Parallel processing: {status} ({self.max_workers} worker processes)")
         if self.use_cache:
             print(f"   Caching: ✅ enabled")
+        if self.page_cache is not None:
+            self.file_hash = self.page_cache.file_hash(self.pdf_path)
+            print(f"   Page cache: {self.page_cache.cache_dir}")
+            self.language_detector.cache.load(self.language_cache_file)
+        if self.previous_file:
+            self.open_previous()
 
         print("")
 
-        # Extract each page (with parallel processing - Priority 3)
-        if self.parallel and CONCURRENT_AVAILABLE and len(self.doc) > 5:
-            print(f"🚀 Extracting {len(self.doc)} pages in parallel ({self.max_workers} workers)...")
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                page_numbers = list(range(len(self.doc)))
-                self.pages = list(executor.map(self.extract_page, page_numbers))
+        # Extract pages (with parallel processing - Priority 3), merge code
+        # blocks that span across pages and create chunks in one pipeline:
+        # pages are finalized as soon as the next page has been extracted
+        self.log(f"🔗 Merging code blocks and creating chunks (chunk_size={self.chunk_size}) as pages arrive")
+        stats = ExtractionStats()
+        chunks = self._finish_pages(self.iter_merged_pages(self.iter_pages()), stats, pages_file)
+
+        if self.extract_images:
+            for error in self.image_writer.errors:
+                print(f"⚠️  Failed to write image {error}")
+            self.image_manifest = self.write_image_manifest()
+
+        result = self.build_result(stats, chunks, self.doc.metadata, len(self.doc), pages_file)
+        result['page_range'] = [pages.start + 1, pages.stop]
+        if self.diff is not None:
+            result['diff'] = self.diff
+
+        # Close document
+        self.doc.close()
+
+        if self.language_cache_file:
+            self.language_detector.cache.save(self.language_cache_file)
+
+        self.print_summary(result)
+        return result
+
+    def open_previous(self):
+        """
+        Load the previous extraction for diff mode.
+
+        It is only used if it was extracted with the same options. Its
+        pages file may be the one this extraction writes: the new pages
+        file replaces it only when extraction is done.
+        """
+        self.previous = PreviousExtraction(self.previous_file)
+        if self.previous.options != self.cache_options():
+            print(f"   ⚠️  {self.previous_file} was extracted with other options, extracting all pages")
+            self.previous = None
         else:
-            # Sequential extraction
-            for page_num in range(len(self.doc)):
-                page_data = self.extract_page(page_num)
-                self.pages.append(page_data)
-
-        # Merge code blocks that span across pages
-        self.log("\n🔗 Merging code blocks across pages...")
-        self.pages = self.merge_continued_code_blocks(self.pages)
-
-        # Create chunks
-        self.log(f"\n📦 Creating chunks (chunk_size={self.chunk_size})...")
-        chunks = self.create_chunks(self.pages)
-
-        # Build summary
-        total_chars = sum(p['char_count'] for p in self.pages)
-        total_code_blocks = sum(p['code_blocks_count'] for p in self.pages)
-        total_headings = sum(len(p['headings']) for p in self.pages)
-        total_images = sum(p['images_count'] for p in self.pages)
-        total_tables = sum(p['tables_count'] for p in self.pages)  # NEW in Priority 2
-
-        # Detect languages used
-        languages = {}
-        all_code_blocks_list = []
-        for page in self.pages:
-            for code in page['code_samples']:
-                lang = code['language']
-                languages[lang] = languages.get(lang, 0) + 1
-                all_code_blocks_list.append(code)
-
-        # Calculate quality statistics (NEW in B1.4)
-        quality_stats = {}
-        if all_code_blocks_list:
-            quality_scores = [c['quality_score'] for c in all_code_blocks_list]
-            confidences = [c['confidence'] for c in all_code_blocks_list]
-            valid_count = sum(1 for c in all_code_blocks_list if c['is_valid'])
-
-            quality_stats = {
-                'average_quality': sum(quality_scores) / len(quality_scores),
-                'average_confidence': sum(confidences) / len(confidences),
-                'valid_code_blocks': valid_count,
-                'invalid_code_blocks': total_code_blocks - valid_count,
-                'validation_rate': valid_count / total_code_blocks if total_code_blocks > 0 else 0,
-                'high_quality_blocks': sum(1 for s in quality_scores if s >= 7.0),
-                'medium_quality_blocks': sum(1 for s in quality_scores if 4.0 <= s < 7.0),
-                'low_quality_blocks': sum(1 for s in quality_scores if s < 4.0),
-            }
+            print(f"   Diff against: {self.previous_file}")
+
+    def build_result(self, stats, chunks, metadata, total_pages, pages_file=None):
+        """
+        Build the extraction summary from page statistics and chunks.
 
+        Returns dict with metadata, statistics, chunks and chapters, plus
+        'pages' (in-memory extraction) or 'pages_file' (streamed).
+        """
         # Extract chapter information
         chapters = []
         for chunk in chunks:
@@ -945,54 +1798,334 @@ class PDFExtractor:
 
         result = {
             'source_file': self.pdf_path,
-            'metadata': self.doc.metadata,
-            'total_pages': len(self.doc),
-            'total_chars': total_chars,
-            'total_code_blocks': total_code_blocks,
-            'total_headings': total_headings,
-            'total_images': total_images,
+            'metadata': metadata,
+            'total_pages': total_pages,
+            'total_chars': stats.total_chars,
+            'total_code_blocks': stats.total_code_blocks,
+            'total_headings': stats.total_headings,
+            'total_images': stats.total_images,
             'total_extracted_images': len(self.extracted_images),  # NEW in B1.5
-            'total_tables': total_tables,  # NEW in Priority 2
+            'total_tables': stats.total_tables,  # NEW in Priority 2
             'image_directory': self.image_dir if self.extract_images else None,  # NEW in B1.5
             'extracted_images': self.extracted_images,  # NEW in B1.5
+            'image_manifest': self.image_manifest,
             'total_chunks': len(chunks),
             'chapters': chapters,
-            'languages_detected': languages,
-            'quality_statistics': quality_stats,  # NEW in B1.4
+            'languages_detected': stats.languages,
+            'quality_statistics': stats.quality_statistics(),  # NEW in B1.4
+            'timing_statistics': stats.timing_statistics(),
+            'extraction_options': self.cache_options(),  # Compared by diff mode
             'chunks': chunks,
-            'pages': self.pages  # Still include all pages for compatibility
         }
+        if pages_file:
+            result['pages_file'] = pages_file
+        else:
+            result['pages'] = self.pages  # Still include all pages for compatibility
+        return result
 
-        # Close document
-        self.doc.close()
+    def print_summary(self, result):
+        """Print the totals and statistics of an extraction result."""
+        quality_stats = result['quality_statistics']
+        timing_stats = result['timing_statistics']
 
         print(f"\n✅ Extraction complete:")
-        print(f"   Total characters: {total_chars:,}")
-        print(f"   Code blocks found: {total_code_blocks}")
-        print(f"   Headings found: {total_headings}")
-        print(f"   Images found: {total_images}")
+        print(f"   Total characters: {result['total_chars']:,}")
+        print(f"   Code blocks found: {result['total_code_blocks']}")
+        print(f"   Headings found: {result['total_headings']}")
+        print(f"   Images found: {result['total_images']}")
         if self.extract_images:
-            print(f"   Images extracted: {len(self.extracted_images)}")
+            references = sum(len(img['pages']) for img in self.extracted_images)
+            print(f"   Images extracted: {len(self.extracted_images)} unique ({references} on pages)")
             if self.image_dir:
                 print(f"   Image directory: {self.image_dir}")
+                print(f"   Image manifest: {self.image_manifest}")
         if self.extract_tables:
-            print(f"   Tables found: {total_tables}")
-        print(f"   Chunks created: {len(chunks)}")
-        print(f"   Chapters detected: {len(chapters)}")
-        print(f"   Languages detected: {', '.join(languages.keys())}")
+            print(f"   Tables found: {result['total_tables']}")
+        if result.get('pages_file'):
+            print(f"   Pages written to: {result['pages_file']}")
+        if result.get('diff'):
+            print(f"   Pages re-extracted: {len(result['diff']['changed_pages'])} "
+                  f"({result['diff']['unchanged_pages']} unchanged)")
+        print(f"   Chunks created: {result['total_chunks']}")
+        print(f"   Chapters detected: {len(result['chapters'])}")
+        print(f"   Languages detected: {', '.join(result['languages_detected'].keys())}")
+        if self.page_cache is not None:
+            cache_stats = self.page_cache.stats()
+            print(f"   Page cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                  f"{cache_stats['size_mb']} MB")
+        language_cache = self.language_detector.cache
+        if language_cache is not None and (language_cache.hits or language_cache.misses):
+            print(f"   Language detection cache: {language_cache.hits} hits, {language_cache.misses} misses")
 
         # Print quality statistics (NEW in B1.4)
         if quality_stats:
             print(f"\n📊 Code Quality Statistics:")
             print(f"   Average quality: {quality_stats['average_quality']:.1f}/10")
             print(f"   Average confidence: {quality_stats['average_confidence']:.1%}")
-            print(f"   Valid code blocks: {quality_stats['valid_code_blocks']}/{total_code_blocks} ({quality_stats['validation_rate']:.1%})")
+            print(f"   Valid code blocks: {quality_stats['valid_code_blocks']}/{result['total_code_blocks']} ({quality_stats['validation_rate']:.1%})")
             print(f"   High quality (7+): {quality_stats['high_quality_blocks']}")
             print(f"   Medium quality (4-7): {quality_stats['medium_quality_blocks']}")
             print(f"   Low quality (<4): {quality_stats['low_quality_blocks']}")
 
+        # Print where extraction time went
+        if timing_stats:
+            print(f"\n⏱️  Extraction Time:")
+            print(f"   Average per page: {timing_stats['average_page_ms']:.1f} ms")
+            for stage, ms in timing_stats['stage_ms'].items():
+                print(f"   {stage}: {ms / 1000:.2f}s ({ms / timing_stats['total_ms']:.0%})")
+            slowest = ', '.join(f"p{p['page_number']} ({p['ms']:.0f} ms)" for p in timing_stats['slowest_pages'])
+            print(f"   Slowest pages: {slowest}")
+
+    def merge_shards(self, shard_files, pages_file=None):
+        """
+        Merge extractions of page ranges (shards) of one PDF into one result.
+
+        Shards may be extracted by different processes or machines (e.g.
+        --pages 1-1000, --pages 1001-2000, ...). Code blocks continued
+        across shard boundaries are merged, and chunks, chapters and
+        statistics are rebuilt over all pages.
+
+        Args:
+            shard_files: Summary JSON files of the shards, in any order
+            pages_file: Stream merged pages to this JSONL file instead of
+                keeping them in memory
+
+        Returns dict like extract_all().
+        """
+        shards = []
+        for shard_file in shard_files:
+            with open(shard_file, 'r', encoding='utf-8') as f:
+                shard = json.load(f)
+            shard['summary_file'] = shard_file
+            shard.setdefault('page_range', [1, shard['total_pages']])
+            shards.append(shard)
+        shards.sort(key=lambda shard: shard['page_range'][0])
+        self.pdf_path = self.pdf_path or shards[0]['source_file']
+
+        print(f"\n🧩 Merging {len(shards)} shards of: {self.pdf_path}")
+        for shard, next_shard in zip(shards, shards[1:]):
+            if next_shard['page_range'][0] <= shard['page_range'][1]:
+                raise ValueError(f"Shards {shard['summary_file']} and {next_shard['summary_file']} overlap")
+            if next_shard['page_range'][0] > shard['page_range'][1] + 1:
+                print(f"   ⚠️  Pages {shard['page_range'][1] + 1}-{next_shard['page_range'][0] - 1} "
+                      f"are in no shard")
+            if next_shard.get('extraction_options') != shards[0].get('extraction_options'):
+                print(f"   ⚠️  {next_shard['summary_file']} was extracted with other options")
+
+        for shard in shards:
+            print(f"   Pages {shard['page_range'][0]}-{shard['page_range'][1]}: {shard['summary_file']}")
+            for image in shard.get('extracted_images', []):
+                for page_number in image['pages']:
+                    self.record_page_images({'page_number': page_number, 'extracted_images': [image]})
+
+        def extracted_pages():
+            # Split merged code blocks again, so pages are merged across shard
+            # boundaries exactly like in one extraction of all pages (a merge
+            # at a boundary can change which blocks merge further on)
+            for shard in shards:
+                previous = None
+                for page in iter_summary_pages(shard['summary_file'], shard):
+                    # unmerge_code_blocks() needs the last block as stored
+                    stored = {'code_samples': [dict(code) for code in page['code_samples'][-1:]]}
+                    yield self.unmerge_code_blocks(page, previous)
+                    previous = stored
+
+        stats = ExtractionStats()
+        chunks = self._finish_pages(self.iter_merged_pages(extracted_pages()), stats, pages_file)
+
+        first_shard = shards[0]
+        self.image_dir = first_shard.get('image_directory')
+        self.extract_images = bool(self.image_dir)
+        if self.extract_images:
+            self.image_manifest = self.write_image_manifest()
+
+        result = self.build_result(stats, chunks, first_shard['metadata'], first_shard['total_pages'], pages_file)
+        result['page_range'] = [first_shard['page_range'][0], shards[-1]['page_range'][1]]
+        result['extraction_options'] = first_shard.get('extraction_options')
+        result['shards'] = [shard['summary_file'] for shard in shards]
+
+        self.print_summary(result)
         return result
 
+    def _finish_pages(self, pages, stats, pages_file=None):
+        """
+        Last pipeline stage: store finalized pages, add them to the
+        statistics and create chunks, one page at a time.
+
+        Args:
+            pages: Finalized pages in page order (any iterable, consumed once)
+            stats: ExtractionStats to add the pages to
+            pages_file: Write the pages to this JSONL file (replaced
+                atomically when done) instead of keeping them in self.pages
+
+        Returns list of chunks (without embedded pages if pages_file is set).
+        """
+        if not pages_file:
+            self.pages = []
+
+            def kept():
+                for page in pages:
+                    self.pages.append(page)
+                    stats.add(page)
+                    yield page
+
+            return self.create_chunks(kept())
+
+        # Set before pages are extracted: streamed pages are not kept in memory
+        self.pages_file = pages_file
+        Path(pages_file).parent.mkdir(parents=True, exist_ok=True)
+        partial_file = f"{pages_file}.partial"
+
+        def written(out):
+            for page in pages:
+                out.write(json.dumps(page, ensure_ascii=False) + '\n')
+                stats.add(page)
+                yield page
+
+        try:
+            with open(partial_file, 'w', encoding='utf-8') as out:
+                chunks = self.create_chunks(written(out), include_pages=False)
+        except BaseException:
+            if os.path.exists(partial_file):
+                os.remove(partial_file)
+            raise
+        os.replace(partial_file, pages_file)
+        return chunks
+
+
+class PreviousExtraction:
+    """
+    Pages of an earlier extraction, looked up by content hash (diff mode).
+
+    Only the content hash and file offset of each page are kept in
+    memory; pages are read from the pages file when they are reused.
+    """
+
+    def __init__(self, summary_file, pages_file=None):
+        """
+        Args:
+            summary_file: Summary JSON written by the previous extraction
+            pages_file: Its JSONL pages file, if moved since (default: the
+                'pages_file' entry of the summary)
+        """
+        self.summary_file = summary_file
+        with open(summary_file, 'r', encoding='utf-8') as f:
+            summary = json.load(f)
+        self.options = summary.get('extraction_options')
+        self.pages_file = None
+        self._pages = {}  # Page number -> page (summaries with embedded pages)
+        self._offsets = {}  # Page number -> offset in the pages file
+        self._by_hash = {}  # Content hash -> first page number with it
+
+        if pages_file is None and 'pages' in summary:
+            self._pages = {page['page_number']: page for page in summary['pages']}
+            pages = self._pages.values()
+        else:
+            self.pages_file = pages_file or resolve_pages_file(summary_file, summary['pages_file'])
+            pages = self._index_pages_file()
+
+        for page in pages:
+            if 'content_hash' in page:
+                self._by_hash.setdefault(page['content_hash'], page['page_number'])
+
+    def _index_pages_file(self):
+        with open(self.pages_file, 'rb') as f:
+            offset = 0
+            for line in f:
+                if line.strip():
+                    page = json.loads(line)
+                    self._offsets[page['page_number']] = offset
+                    yield page
+                offset += len(line)
+
+    def find(self, content_hash):
+        """Page number of the previous page with this content hash, or None."""
+        return self._by_hash.get(content_hash)
+
+    def read(self, page_number):
+        """Return a fresh copy of a previous page, or None if there is none."""
+        if self.pages_file is None:
+            page = self._pages.get(page_number)
+            return json.loads(json.dumps(page)) if page is not None else None
+        offset = self._offsets.get(page_number)
+        if offset is None:
+            return None
+        with open(self.pages_file, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+
+def parse_page_range(spec):
+    """
+    Parse a 1-based, inclusive page range: '10-20', '10-' (to the end),
+    '-20' (from the start) or '7' (one page).
+
+    Returns (first, last) tuple, last None for "to the end".
+    """
+    first, sep, last = spec.strip().partition('-')
+    try:
+        first = int(first) if first else 1
+        last = (int(last) if last else None) if sep else first
+    except ValueError:
+        raise ValueError(f"Invalid page range: {spec!r} (expected e.g. 10-20)")
+    if first < 1 or (last is not None and last < first):
+        raise ValueError(f"Invalid page range: {spec!r}")
+    return first, last
+
+
+def resolve_pages_file(summary_file, pages_file):
+    """
+    Locate the pages file named in a summary JSON.
+
+    Relative paths are resolved against the summary's directory, falling
+    back to the working directory.
+    """
+    if pages_file and not os.path.isabs(pages_file):
+        relative = os.path.join(os.path.dirname(summary_file), pages_file)
+        if os.path.exists(relative):
+            return relative
+    return pages_file
+
+
+def iter_summary_pages(summary_file, summary):
+    """Yield the pages of an extraction summary, embedded or from its pages file."""
+    if 'pages' in summary:
+        yield from summary['pages']
+    else:
+        yield from iter_pages_file(resolve_pages_file(summary_file, summary['pages_file']))
+
+
+def iter_pages_file(pages_file):
+    """Yield the pages of a JSONL pages file written by extract_all(pages_file=...)."""
+    with open(pages_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+# Per-process extractor used by the parallel extraction pool (see iter_pages)
+_worker_extractor = None
+
+
+def _init_extract_worker(pdf_path, options):
+    """Process pool initializer: open a private document handle in each worker."""
+    global _worker_extractor
+    _worker_extractor = PDFExtractor(pdf_path, **options)
+    # Pages go back to the parent (which writes the disk cache), a worker never extracts one twice
+    _worker_extractor.memory_cache = False
+    _worker_extractor.doc = fitz.open(pdf_path)
+    if _worker_extractor.doc.is_encrypted and options.get('password'):
+        _worker_extractor.doc.authenticate(options['password'])
+
+
+def _extract_page_range(page_range):
+    """Extract pages [start, end) in a pool worker and return them in order."""
+    start, end = page_range
+    pages = [_worker_extractor.extract_page(page_num) for page_num in range(start, end)]
+    # The parent may read the images as soon as the range is returned
+    _worker_extractor.image_writer.flush()
+    return pages
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -1011,13 +2144,29 @@ Examples:
 
   # Extract and save
   python3 pdf_extractor_poc.py docs/python.pdf -o python_extracted.json -v
+
+  # Extract in shards, then merge them
+  python3 pdf_extractor_poc.py big.pdf --pages 1-1500 -o part1.json --pages-file part1.jsonl
+  python3 pdf_extractor_poc.py big.pdf --pages 1501- -o part2.json --pages-file part2.jsonl
+  python3 pdf_extractor_poc.py --merge-shards part1.json part2.json -o big.json --pages-file big.jsonl
+
+  # Re-extract only the pages that changed since a previous extraction
+  python3 pdf_extractor_poc.py big_v2.pdf --previous big.json -o big_v2.json --pages-file big_v2.jsonl
         """
     )
 
-    parser.add_argument('pdf_file', help='Path to PDF file to extract')
+    parser.add_argument('pdf_file', nargs='?', help='Path to PDF file to extract')
     parser.add_argument('-o', '--output', help='Output JSON file path (default: print to stdout)')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
     parser.add_argument('--pretty', action='store_true', help='Pretty-print JSON output')
+    parser.add_argument('--pages-file', type=str, default=None,
+                        help='Stream pages to this JSONL file (output JSON then holds only the summary)')
+    parser.add_argument('--pages', type=parse_page_range, default=None, metavar='RANGE',
+                        help='Extract only these pages, e.g. 1-500, 501- (1-based, inclusive)')
+    parser.add_argument('--previous', type=str, default=None, metavar='JSON',
+                        help='Output JSON of a previous extraction; only changed pages are re-extracted')
+    parser.add_argument('--merge-shards', nargs='+', default=None, metavar='JSON',
+                        help='Merge the output JSON of page-range extractions instead of extracting')
     parser.add_argument('--chunk-size', type=int, default=10,
                         help='Pages per chunk (0 = no chunking, default: 10)')
     parser.add_argument('--no-merge', action='store_true',
@@ -1030,49 +2179,80 @@ Examples:
                         help='Directory to save extracted images (default: output/{pdf_name}_images)')
     parser.add_argument('--min-image-size', type=int, default=100,
                         help='Minimum image dimension in pixels (filters icons, default: 100)')
+    parser.add_argument('--thumbnails', choices=THUMBNAIL_FORMATS, default=None,
+                        help='Also save downscaled thumbnails of extracted images (webp needs Pillow)')
+    parser.add_argument('--thumbnail-size', type=int, default=DEFAULT_THUMBNAIL_SIZE,
+                        help=f'Longest thumbnail side in pixels (default: {DEFAULT_THUMBNAIL_SIZE})')
 
     # Advanced features (Priority 2 & 3)
     parser.add_argument('--ocr', action='store_true',
                         help='Use OCR for scanned PDFs (requires pytesseract)')
+    parser.add_argument('--ocr-dpi', type=int, default=DEFAULT_OCR_DPI,
+                        help=f'Render resolution for OCR (default: {DEFAULT_OCR_DPI})')
+    parser.add_argument('--ocr-color', action='store_true',
+                        help='Render pages in color for OCR (default: grayscale)')
+    parser.add_argument('--ocr-workers', type=int, default=None,
+                        help='Parallel OCR processes (default: CPU count, 0 = inline)')
     parser.add_argument('--password', type=str, default=None,
                         help='Password for encrypted PDF')
     parser.add_argument('--extract-tables', action='store_true',
                         help='Extract tables from PDF (Priority 2)')
     parser.add_argument('--parallel', action='store_true',
-                        help='Process pages in parallel (Priority 3)')
+                        help='Process pages in parallel worker processes (Priority 3)')
     parser.add_argument('--workers', type=int, default=None,
-                        help='Number of parallel workers (default: CPU count)')
+                        help='Number of worker processes (default: CPU count)')
     parser.add_argument('--no-cache', action='store_true',
                         help='Disable caching of expensive operations')
+    parser.add_argument('--cache-dir', type=str, default=None,
+                        help='Keep extracted pages in this directory across runs')
+    parser.add_argument('--cache-size', type=float, default=DEFAULT_PDF_CACHE_SIZE_MB,
+                        help=f'Size limit of --cache-dir in MB (default: {DEFAULT_PDF_CACHE_SIZE_MB})')
 
     args = parser.parse_args()
 
-    # Validate input file
-    if not os.path.exists(args.pdf_file):
-        print(f"❌ Error: File not found: {args.pdf_file}")
-        sys.exit(1)
-
-    if not args.pdf_file.lower().endswith('.pdf'):
-        print(f"⚠️  Warning: File does not have .pdf extension")
-
-    # Extract
-    extractor = PDFExtractor(
-        args.pdf_file,
-        verbose=args.verbose,
-        chunk_size=args.chunk_size,
-        min_quality=args.min_quality,
-        extract_images=args.extract_images,
-        image_dir=args.image_dir,
-        min_image_size=args.min_image_size,
-        # Advanced features (Priority 2 & 3)
-        use_ocr=args.ocr,
-        password=args.password,
-        extract_tables=args.extract_tables,
-        parallel=args.parallel,
-        max_workers=args.workers,
-        use_cache=not args.no_cache
-    )
-    result = extractor.extract_all()
+    if args.merge_shards:
+        # Merge page-range extractions (the PDF itself is not needed)
+        extractor = PDFExtractor(args.pdf_file, verbose=args.verbose, chunk_size=args.chunk_size)
+        result = extractor.merge_shards(args.merge_shards, pages_file=args.pages_file)
+    else:
+        if not args.pdf_file:
+            parser.error("the following arguments are required: pdf_file")
+
+        # Validate input file
+        if not os.path.exists(args.pdf_file):
+            print(f"❌ Error: File not found: {args.pdf_file}")
+            sys.exit(1)
+
+        if not args.pdf_file.lower().endswith('.pdf'):
+            print(f"⚠️  Warning: File does not have .pdf extension")
+
+        # Extract
+        extractor = PDFExtractor(
+            args.pdf_file,
+            verbose=args.verbose,
+            chunk_size=args.chunk_size,
+            min_quality=args.min_quality,
+            extract_images=args.extract_images,
+            image_dir=args.image_dir,
+            min_image_size=args.min_image_size,
+            thumbnail_format=args.thumbnails,
+            thumbnail_size=args.thumbnail_size,
+            # Advanced features (Priority 2 & 3)
+            use_ocr=args.ocr,
+            ocr_dpi=args.ocr_dpi,
+            ocr_grayscale=not args.ocr_color,
+            ocr_workers=args.ocr_workers,
+            password=args.password,
+            extract_tables=args.extract_tables,
+            parallel=args.parallel,
+            max_workers=args.workers,
+            use_cache=not args.no_cache,
+            cache_dir=args.cache_dir,
+            cache_size_mb=args.cache_size,
+            page_range=args.pages,
+            previous=args.previous
+        )
+        result = extractor.extract_all(pages_file=args.pages_file)
 
     if result is None:
         sys.exit(1)
@@ -9,17 +9,31 @@ Usage:
     python3 pdf_scraper.py --config configs/manual_pdf.json
     python3 pdf_scraper.py --pdf manual.pdf --name myskill
     python3 pdf_scraper.py --from-json manual_extracted.json
+    python3 pdf_scraper.py --pdf manual_v2.pdf --name myskill --incremental
 """
 
 import os
 import sys
 import json
 import re
+import heapq
+import hashlib
 import argparse
+from bisect import bisect_right
+from collections import OrderedDict
 from pathlib import Path
 
 # Import the PDF extractor
-from .pdf_extractor_poc import PDFExtractor
+from .pdf_extractor_poc import (
+    PDFExtractor, iter_pages_file, parse_page_range, resolve_pages_file,
+    DEFAULT_OCR_DPI, DEFAULT_THUMBNAIL_SIZE
+)
+from .constants import DEFAULT_PDF_CACHE_SIZE_MB
+from .keyword_categorizer import get_categorizer
+
+# Reference files kept open at once while pages are streamed into them
+# (chapter-based categories can number in the thousands)
+MAX_OPEN_REFERENCE_FILES = 64
 
 
 def infer_description_from_pdf(pdf_metadata: dict = None, name: str = '') -> str:
@@ -70,6 +84,7 @@ class PDFToSkillConverter:
         # Paths
         self.skill_dir = f"output/{self.name}"
         self.data_file = f"output/{self.name}_extracted.json"
+        self.pages_file = f"output/{self.name}_extracted.jsonl"  # One page per line
 
         # Extraction options
         self.extract_options = config.get('extract_options', {})
@@ -80,10 +95,25 @@ class PDFToSkillConverter:
         # Extracted data
         self.extracted_data = None
 
+        # Images already referenced by a reference page (each is shown once)
+        self._referenced_images = set()
+
     def extract_pdf(self):
-        """Extract content from PDF using pdf_extractor_poc.py"""
+        """
+        Extract content from PDF using pdf_extractor_poc.py
+
+        With the 'incremental' extract option, only pages that changed
+        since the last extraction into data_file are extracted again.
+        """
         print(f"\n🔍 Extracting from PDF: {self.pdf_path}")
 
+        page_range = self.extract_options.get('pages')
+        if isinstance(page_range, str):
+            page_range = parse_page_range(page_range)
+        previous = None
+        if self.extract_options.get('incremental') and os.path.exists(self.data_file):
+            previous = self.data_file
+
         # Create extractor with options
         extractor = PDFExtractor(
             self.pdf_path,
@@ -92,36 +122,71 @@ class PDFToSkillConverter:
             min_quality=self.extract_options.get('min_quality', 5.0),
             extract_images=self.extract_options.get('extract_images', True),
             image_dir=f"{self.skill_dir}/assets/images",
-            min_image_size=self.extract_options.get('min_image_size', 100)
+            min_image_size=self.extract_options.get('min_image_size', 100),
+            thumbnail_format=self.extract_options.get('thumbnails'),
+            thumbnail_size=self.extract_options.get('thumbnail_size', DEFAULT_THUMBNAIL_SIZE),
+            use_ocr=self.extract_options.get('ocr', False),
+            ocr_dpi=self.extract_options.get('ocr_dpi', DEFAULT_OCR_DPI),
+            ocr_workers=self.extract_options.get('ocr_workers'),
+            parallel=self.extract_options.get('parallel', False),
+            max_workers=self.extract_options.get('workers'),
+            cache_dir=self.extract_options.get('cache_dir', 'output/.pdf_cache'),
+            cache_size_mb=self.extract_options.get('cache_size_mb', DEFAULT_PDF_CACHE_SIZE_MB),
+            page_range=page_range,
+            previous=previous
         )
 
-        # Extract
-        result = extractor.extract_all()
+        # Extract (pages are streamed to the JSONL pages file)
+        result = extractor.extract_all(pages_file=self.pages_file)
 
         if not result:
             print("❌ Extraction failed")
             raise RuntimeError(f"Failed to extract PDF: {self.pdf_path}")
 
-        # Save extracted data
+        # Save summary; the pages file is referenced relative to it
+        result['pages_file'] = os.path.relpath(self.pages_file, os.path.dirname(self.data_file) or '.')
         with open(self.data_file, 'w', encoding='utf-8') as f:
             json.dump(result, f, indent=2, ensure_ascii=False)
 
-        print(f"\n💾 Saved extracted data to: {self.data_file}")
+        print(f"\n💾 Saved extracted data to: {self.data_file} (pages: {self.pages_file})")
         self.extracted_data = result
         return True
 
     def load_extracted_data(self, json_path):
-        """Load previously extracted data from JSON"""
+        """
+        Load previously extracted data from JSON.
+
+        Summaries written with a JSONL pages file are loaded without their
+        pages; iter_pages() streams those from disk when needed.
+        """
         print(f"\n📂 Loading extracted data from: {json_path}")
 
         with open(json_path, 'r', encoding='utf-8') as f:
             self.extracted_data = json.load(f)
 
+        pages_file = self.extracted_data.get('pages_file')
+        if pages_file and 'pages' not in self.extracted_data:
+            # Relative to the summary file (falls back to the working directory)
+            self.pages_file = resolve_pages_file(json_path, pages_file)
+
         print(f"✅ Loaded {self.extracted_data['total_pages']} pages")
         return True
 
+    def iter_pages(self):
+        """Yield extracted pages in order, streaming them from the pages file if needed."""
+        if 'pages' in self.extracted_data:
+            yield from self.extracted_data['pages']
+        else:
+            yield from iter_pages_file(self.pages_file)
+
     def categorize_content(self):
-        """Categorize pages based on chapters or keywords"""
+        """
+        Categorize pages based on chapters or keywords.
+
+        Categories hold 'page_numbers' rather than the pages themselves, so
+        large PDFs are categorized in one streaming pass (pre-categorized
+        configs keep their 'pages').
+        """
         print(f"\n📋 Categorizing content...")
 
         categorized = {}
@@ -132,19 +197,19 @@ class PDFToSkillConverter:
                 category_key = self._sanitize_filename(chapter['title'])
                 categorized[category_key] = {
                     'title': chapter['title'],
-                    'pages': []
+                    'page_numbers': []
                 }
 
-            # Assign pages to chapters
-            for page in self.extracted_data['pages']:
+            # Assign pages to chapters: the last chapter starting at or
+            # before the page, if the page is within its range
+            chapters = sorted(self.extracted_data['chapters'], key=lambda c: c['start_page'])
+            starts = [chapter['start_page'] for chapter in chapters]
+            for page in self.iter_pages():
                 page_num = page['page_number']
-
-                # Find which chapter this page belongs to
-                for chapter in self.extracted_data['chapters']:
-                    if chapter['start_page'] <= page_num <= chapter['end_page']:
-                        category_key = self._sanitize_filename(chapter['title'])
-                        categorized[category_key]['pages'].append(page)
-                        break
+                index = bisect_right(starts, page_num) - 1
+                if index >= 0 and page_num <= chapters[index]['end_page']:
+                    category_key = self._sanitize_filename(chapters[index]['title'])
+                    categorized[category_key]['page_numbers'].append(page_num)
 
         # Fall back to keyword-based categorization
         elif self.categories:
@@ -164,46 +229,36 @@ class PDFToSkillConverter:
                 for cat_key, keywords in self.categories.items():
                     categorized[cat_key] = {
                         'title': cat_key.replace('_', ' ').title(),
-                        'pages': []
+                        'page_numbers': []
                     }
 
-                # Categorize by keywords
-                for page in self.extracted_data['pages']:
-                    text = page.get('text', '').lower()
-                    headings_text = ' '.join([h['text'] for h in page.get('headings', [])]).lower()
-
-                    # Score against each category
-                    scores = {}
-                    for cat_key, keywords in self.categories.items():
-                        # Handle both string keywords and dict keywords (shouldn't happen, but be safe)
-                        if isinstance(keywords, list):
-                            score = sum(1 for kw in keywords
-                                      if isinstance(kw, str) and (kw.lower() in text or kw.lower() in headings_text))
-                        else:
-                            score = 0
-                        if score > 0:
-                            scores[cat_key] = score
+                # Categorize by keywords (all categories scored in one scan)
+                categorizer = get_categorizer(self.categories)
+                for page in self.iter_pages():
+                    headings_text = ' '.join([h['text'] for h in page.get('headings', [])])
+                    # A keyword counts once whether it is in the text or the
+                    # headings; the separator keeps matches within one of them
+                    best_cat = categorizer.best([(page.get('text', '') + '\x00' + headings_text, 1)])
 
                     # Assign to highest scoring category
-                    if scores:
-                        best_cat = max(scores, key=scores.get)
-                        categorized[best_cat]['pages'].append(page)
+                    if best_cat is not None:
+                        categorized[best_cat]['page_numbers'].append(page['page_number'])
                     else:
                         # Default category
                         if 'other' not in categorized:
-                            categorized['other'] = {'title': 'Other', 'pages': []}
-                        categorized['other']['pages'].append(page)
+                            categorized['other'] = {'title': 'Other', 'page_numbers': []}
+                        categorized['other']['page_numbers'].append(page['page_number'])
 
         else:
             # No categorization - use single category
             categorized['content'] = {
                 'title': 'Content',
-                'pages': self.extracted_data['pages']
+                'page_numbers': [page['page_number'] for page in self.iter_pages()]
             }
 
         print(f"✅ Created {len(categorized)} categories")
         for cat_key, cat_data in categorized.items():
-            print(f"   - {cat_data['title']}: {len(cat_data['pages'])} pages")
+            print(f"   - {cat_data['title']}: {self._page_count(cat_data)} pages")
 
         return categorized
 
@@ -221,8 +276,7 @@ class PDFToSkillConverter:
 
         # Generate reference files
         print(f"\n📝 Generating reference files...")
-        for cat_key, cat_data in categorized.items():
-            self._generate_reference_file(cat_key, cat_data)
+        self._generate_reference_files(categorized)
 
         # Generate index
         self._generate_index(categorized)
@@ -233,53 +287,123 @@ class PDFToSkillConverter:
         print(f"\n✅ Skill built successfully: {self.skill_dir}/")
         print(f"\n📦 Next step: Package with: skill-seekers package {self.skill_dir}/")
 
+    @staticmethod
+    def _page_count(cat_data):
+        """Number of pages in a category (page numbers or pre-categorized pages)."""
+        return len(cat_data.get('page_numbers', cat_data.get('pages', [])))
+
+    def _generate_reference_files(self, categorized):
+        """
+        Generate the reference markdown files of all categories.
+
+        Pages are streamed once and written to the file of their category,
+        so only one page is in memory at a time. Files are appended to
+        through a small LRU of open handles (MAX_OPEN_REFERENCE_FILES), so
+        the number of categories is not bounded by the open file limit.
+        Images repeated on many pages are shown on the first of them only.
+        """
+        self._referenced_images = set()
+        page_categories = {}
+        for cat_key, cat_data in categorized.items():
+            with open(self._reference_path(cat_key), 'w', encoding='utf-8') as f:
+                f.write(f"# {cat_data['title']}\n\n")
+
+                # Pre-categorized pages are written directly
+                for page in cat_data.get('pages', []):
+                    self._write_reference_page(f, page)
+            for page_num in cat_data.get('page_numbers', []):
+                page_categories[page_num] = cat_key
+
+        if page_categories:
+            files = OrderedDict()  # Category -> open file, least recently used first
+            try:
+                for page in self.iter_pages():
+                    cat_key = page_categories.get(page['page_number'])
+                    if cat_key is None:
+                        continue
+                    f = files.pop(cat_key, None)
+                    if f is None:
+                        if len(files) >= MAX_OPEN_REFERENCE_FILES:
+                            files.popitem(last=False)[1].close()
+                        f = open(self._reference_path(cat_key), 'a', encoding='utf-8')
+                    files[cat_key] = f
+                    self._write_reference_page(f, page)
+            finally:
+                for f in files.values():
+                    f.close()
+
+        for cat_key in categorized:
+            print(f"   Generated: {self.skill_dir}/references/{cat_key}.md")
+
+    def _reference_path(self, cat_key):
+        return f"{self.skill_dir}/references/{cat_key}.md"
+
     def _generate_reference_file(self, cat_key, cat_data):
         """Generate a reference markdown file for a category"""
-        filename = f"{self.skill_dir}/references/{cat_key}.md"
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"# {cat_data['title']}\n\n")
-
-            for page in cat_data['pages']:
-                # Add headings as section markers
-                if page.get('headings'):
-                    f.write(f"## {page['headings'][0]['text']}\n\n")
-
-                # Add text content
-                if page.get('text'):
-                    # Limit to first 1000 chars per page to avoid huge files
-                    text = page['text'][:1000]
-                    f.write(f"{text}\n\n")
-
-                # Add code samples (check both 'code_samples' and 'code_blocks' for compatibility)
-                code_list = page.get('code_samples') or page.get('code_blocks')
-                if code_list:
-                    f.write("### Code Examples\n\n")
-                    for code in code_list[:3]:  # Limit to top 3
-                        lang = code.get('language', '')
-                        f.write(f"```{lang}\n{code['code']}\n```\n\n")
-
-                # Add images
-                if page.get('images'):
-                    # Create assets directory if needed
-                    assets_dir = os.path.join(self.skill_dir, 'assets')
-                    os.makedirs(assets_dir, exist_ok=True)
-
-                    f.write("### Images\n\n")
-                    for img in page['images']:
-                        # Save image to assets
-                        img_filename = f"page_{page['page_number']}_img_{img['index']}.png"
-                        img_path = os.path.join(assets_dir, img_filename)
-
-                        with open(img_path, 'wb') as img_file:
-                            img_file.write(img['data'])
-
-                        # Add markdown image reference
-                        f.write(f"![Image {img['index']}](../assets/{img_filename})\n\n")
-
-                f.write("---\n\n")
-
-        print(f"   Generated: {filename}")
+        self._generate_reference_files({cat_key: cat_data})
+
+    def _write_reference_page(self, f, page):
+        """Write one page to an open reference file."""
+        # Add headings as section markers
+        if page.get('headings'):
+            f.write(f"## {page['headings'][0]['text']}\n\n")
+
+        # Add text content
+        if page.get('text'):
+            # Limit to first 1000 chars per page to avoid huge files
+            text = page['text'][:1000]
+            f.write(f"{text}\n\n")
+
+        # Add code samples (check both 'code_samples' and 'code_blocks' for compatibility)
+        code_list = page.get('code_samples') or page.get('code_blocks')
+        if code_list:
+            f.write("### Code Examples\n\n")
+            for code in code_list[:3]:  # Limit to top 3
+                lang = code.get('language', '')
+                f.write(f"```{lang}\n{code['code']}\n```\n\n")
+
+        # Add images extracted to files, each unique image only once
+        new_images = [
+            img for img in page.get('extracted_images', [])
+            if img.get('sha256', img['path']) not in self._referenced_images
+        ]
+        if new_images:
+            f.write("### Images\n\n")
+            references_dir = os.path.join(self.skill_dir, 'references')
+            for img in new_images:
+                self._referenced_images.add(img.get('sha256', img['path']))
+                img_link = os.path.relpath(img['path'], references_dir).replace(os.sep, '/')
+                if img.get('thumbnail') and img['thumbnail'] != img['path']:
+                    thumb_link = os.path.relpath(img['thumbnail'], references_dir).replace(os.sep, '/')
+                    f.write(f"[![{img['filename']}]({thumb_link})]({img_link})\n\n")
+                else:
+                    f.write(f"![{img['filename']}]({img_link})\n\n")
+
+        # Add embedded images (older extraction format)
+        embedded_images = []
+        for img in page.get('images', []):
+            image_hash = hashlib.sha256(img['data']).hexdigest()
+            if image_hash not in self._referenced_images:
+                self._referenced_images.add(image_hash)
+                embedded_images.append(img)
+        if embedded_images:
+            # Create assets directory if needed
+            assets_dir = os.path.join(self.skill_dir, 'assets')
+            os.makedirs(assets_dir, exist_ok=True)
+
+            f.write("### Images\n\n")
+            for img in embedded_images:
+                # Save image to assets
+                img_filename = f"page_{page['page_number']}_img_{img['index']}.png"
+                img_path = os.path.join(assets_dir, img_filename)
+
+                with open(img_path, 'wb') as img_file:
+                    img_file.write(img['data'])
+
+                # Add markdown image reference
+                f.write(f"![Image {img['index']}](../assets/{img_filename})\n\n")
+
+        f.write("---\n\n")
 
     def _generate_index(self, categorized):
         """Generate reference index"""
@@ -290,7 +414,7 @@ class PDFToSkillConverter:
             f.write("## Categories\n\n")
 
             for cat_key, cat_data in categorized.items():
-                page_count = len(cat_data['pages'])
+                page_count = self._page_count(cat_data)
                 f.write(f"- [{cat_data['title']}]({cat_key}.md) ({page_count} pages)\n")
 
             f.write("\n## Statistics\n\n")
@@ -298,6 +422,8 @@ class PDFToSkillConverter:
             f.write(f"- Total pages: {self.extracted_data.get('total_pages', 0)}\n")
             f.write(f"- Code blocks: {self.extracted_data.get('total_code_blocks', 0)}\n")
             f.write(f"- Images: {self.extracted_data.get('total_images', 0)}\n")
+            if self.extracted_data.get('total_extracted_images'):
+                f.write(f"- Unique images extracted: {self.extracted_data['total_extracted_images']}\n")
             if stats:
                 f.write(f"- Average code quality: {stats.get('average_quality', 0):.1f}/10\n")
                 f.write(f"- Valid code blocks: {stats.get('valid_code_blocks', 0)}\n")
@@ -331,18 +457,13 @@ class PDFToSkillConverter:
             f.write("## What's included\n\n")
             f.write("This skill contains:\n\n")
             for cat_key, cat_data in categorized.items():
-                f.write(f"- **{cat_data['title']}**: {len(cat_data['pages'])} pages\n")
+                f.write(f"- **{cat_data['title']}**: {self._page_count(cat_data)} pages\n")
 
             f.write("\n## Quick Reference\n\n")
 
-            # Get high-quality code samples
-            all_code = []
-            for page in self.extracted_data['pages']:
-                all_code.extend(page.get('code_samples', []))
-
-            # Sort by quality and get top 5
-            all_code.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
-            top_code = all_code[:5]
+            # Get the top 5 code samples by quality (pages are streamed)
+            all_code = (code for page in self.iter_pages() for code in page.get('code_samples', []))
+            top_code = heapq.nlargest(5, all_code, key=lambda x: x.get('quality_score', 0))
 
             if top_code:
                 f.write("### Top Code Examples\n\n")
@@ -383,6 +504,9 @@ def main():
     parser.add_argument('--name', help='Skill name (with --pdf)')
     parser.add_argument('--from-json', help='Build skill from extracted JSON')
     parser.add_argument('--description', help='Skill description')
+    parser.add_argument('--pages', help='Extract only these pages, e.g. 1-500 (1-based, inclusive)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only re-extract pages that changed since the last extraction')
 
     args = parser.parse_args()
 
@@ -421,6 +545,13 @@ def main():
             }
         }
 
+    # Command line extraction options override the config
+    extract_options = config.setdefault('extract_options', {})
+    if args.pages:
+        extract_options['pages'] = args.pages
+    if args.incremental:
+        extract_options['incremental'] = True
+
     # Create converter
     converter = PDFToSkillConverter(config)
 
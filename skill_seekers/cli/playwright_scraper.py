@@ -27,12 +27,12 @@ class PlaywrightScraper:
     Supports:
     - JavaScript rendering via headless Chromium
     - Configurable wait strategies (networkidle, load, domcontentloaded)
-    - Rate limiting between requests
+    - Rate limiting between requests (optionally via a shared HostRateLimiter)
     - Retry mechanism with exponential backoff
     - Progress logging
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], rate_limiter: Optional[Any] = None):
         """
         Initialize the Playwright scraper.
 
@@ -45,9 +45,13 @@ class PlaywrightScraper:
                     - extra_wait: Additional wait after load in ms (default: 2000)
                     - headless: Run browser headless (default: True)
                     - max_retries: Max retry attempts (default: 3)
+            rate_limiter: Optional HostRateLimiter shared with other scrapers.
+                When given, it paces requests per host (and backs off on
+                429/503) instead of the fixed rate_limit sleep.
         """
         self.config = config
         self.rate_limit = config.get('rate_limit', 0.5)
+        self.rate_limiter = rate_limiter
 
         # Playwright-specific config
         pw_config = config.get('playwright_config', {})
@@ -76,12 +80,19 @@ class PlaywrightScraper:
             try:
                 logger.info("  %s", url)
 
-                await page.goto(
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(url)
+
+                response = await page.goto(
                     url,
                     wait_until=self.wait_until,
                     timeout=self.timeout
                 )
 
+                if self.rate_limiter is not None and response is not None:
+                    if self.rate_limiter.observe(url, response.status, response.headers):
+                        raise RuntimeError(f"Throttled (HTTP {response.status})")
+
                 # Extra wait for dynamic content (crucial for SPAs)
                 await page.wait_for_timeout(self.extra_wait)
 
@@ -174,8 +185,8 @@ class PlaywrightScraper:
                 else:
                     failed.append(url)
 
-                # Rate limiting
-                if idx < len(urls):
+                # Rate limiting (the shared limiter already paced the request)
+                if self.rate_limiter is None and idx < len(urls):
                     await asyncio.sleep(self.rate_limit)
 
             await browser.close()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Per-host adaptive rate limiter shared by all scraping workers.
+
+Every host gets one token bucket, shared by all threads/coroutines of a
+scrape, so ``rate_limit`` is the real minimum interval between requests to
+a host no matter how many workers run. The interval adapts to the server:
+
+- robots.txt ``Crawl-delay`` raises the interval for that host
+- 429/503 responses pause the host (``Retry-After`` if given, otherwise an
+  exponentially growing backoff) and slow it down
+- successful responses gradually remove the extra delay again
+
+Usage:
+    from skill_seekers.cli.rate_limiter import HostRateLimiter
+
+    limiter = HostRateLimiter(rate_limit=0.5, client=http_client)
+    limiter.acquire(url)                  # or: await limiter.acquire_async(url)
+    response = http_client.get(url)
+    limiter.observe(url, response.status_code, response.headers)
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Mapping, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from skill_seekers.cli.http_client import HTTPClient, get_default_client
+
+logger = logging.getLogger(__name__)
+
+# Status codes that mean "slow down"
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+
+@dataclass
+class _HostState:
+    """Token bucket and backoff state of one host."""
+    next_slot: float = 0.0  # Earliest time the next request may start (bucket empty before this)
+    paused_until: float = 0.0  # Server-requested pause (Retry-After / backoff)
+    adaptive_delay: float = 0.0  # Interval learned from throttling responses (decays on success)
+    crawl_delay: Optional[float] = None  # robots.txt Crawl-delay (None until fetched)
+
+
+class HostRateLimiter:
+    """Thread- and asyncio-safe per-host token bucket with adaptive backoff."""
+
+    def __init__(
+        self,
+        rate_limit: float = 0.5,
+        burst: int = 1,
+        max_delay: float = 60.0,
+        respect_crawl_delay: bool = True,
+        user_agent: str = '*',
+        client: Optional[HTTPClient] = None
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            rate_limit: Minimum seconds between requests to the same host (0 = no fixed limit)
+            burst: Requests a host may receive back to back before the interval applies
+            max_delay: Upper bound for adaptive backoff and Retry-After pauses (seconds)
+            respect_crawl_delay: Read robots.txt Crawl-delay for each host
+            user_agent: User agent matched against robots.txt rules
+            client: Pooled client robots.txt is fetched with (default: the shared client)
+        """
+        self.rate_limit = max(0.0, float(rate_limit or 0))
+        self.burst = max(1, int(burst))
+        self.max_delay = max_delay
+        self.respect_crawl_delay = respect_crawl_delay
+        self.user_agent = user_agent
+        self.client = client
+        self.throttled = 0  # 429/503 responses seen
+        self.waited = 0.0  # Total seconds callers were told to wait
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+        self._robots_locks: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def _host(url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState()
+        return state
+
+    def interval(self, url: str) -> float:
+        """Return the current minimum interval between requests to the URL's host."""
+        with self._lock:
+            state = self._state(self._host(url))
+            return self._interval(state)
+
+    def _interval(self, state: _HostState) -> float:
+        return min(self.max_delay, max(self.rate_limit, state.crawl_delay or 0.0, state.adaptive_delay))
+
+    def reserve(self, url: str) -> float:
+        """Take a token for the URL's host and return how long to wait before requesting.
+
+        The slot is reserved immediately, so concurrent callers are spread
+        out instead of all waking up at the same time.
+        """
+        host = self._host(url)
+        if self.respect_crawl_delay:
+            self._ensure_crawl_delay(host)
+
+        with self._lock:
+            state = self._state(host)
+            interval = self._interval(state)
+            now = time.monotonic()
+
+            # GCRA form of a token bucket: up to `burst` requests may start
+            # before next_slot, each one pushes it forward by one interval
+            start = max(now, state.next_slot - (self.burst - 1) * interval, state.paused_until)
+            state.next_slot = max(state.next_slot, start) + interval
+            wait = start - now
+            self.waited += wait
+            return wait
+
+    def _paused(self, url: str) -> bool:
+        with self._lock:
+            return self._state(self._host(url)).paused_until > time.monotonic()
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to the URL's host is allowed.
+
+        If the host got paused (429/503) while waiting, a new slot after
+        the pause is reserved instead of firing into it.
+        """
+        while True:
+            wait = self.reserve(url)
+            if wait > 0:
+                time.sleep(wait)
+            if not self._paused(url):
+                return
+
+    async def acquire_async(self, url: str) -> None:
+        """Wait (without blocking the event loop) until a request to the URL's host is allowed."""
+        host = self._host(url)
+        if self.respect_crawl_delay:
+            with self._lock:
+                known = self._state(host).crawl_delay is not None
+            if not known:
+                # robots.txt is fetched once per host, keep that off the event loop
+                await asyncio.to_thread(self._ensure_crawl_delay, host)
+        while True:
+            wait = self.reserve(url)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if not self._paused(url):
+                return
+
+    def observe(self, url: str, status_code: int, headers: Optional[Mapping[str, str]] = None) -> bool:
+        """Feed a response back into the limiter.
+
+        Args:
+            url: Requested URL
+            status_code: HTTP status of the response
+            headers: Response headers (used for Retry-After)
+
+        Returns:
+            bool: True if the response was a throttling response (429/503),
+                  i.e. the request should be retried after acquire()
+        """
+        with self._lock:
+            state = self._state(self._host(url))
+            now = time.monotonic()
+
+            if status_code not in THROTTLE_STATUS_CODES:
+                # Recover gradually: drop 20% of the learned delay per success
+                if state.adaptive_delay:
+                    state.adaptive_delay = state.adaptive_delay * 0.8 if state.adaptive_delay > 0.05 else 0.0
+                return False
+
+            # Slow down: at least double the current interval
+            self.throttled += 1
+            state.adaptive_delay = min(self.max_delay, max(0.5, 2 * self._interval(state)))
+            retry_after = parse_retry_after(_header(headers, 'Retry-After'))
+            pause = min(self.max_delay, retry_after if retry_after is not None else state.adaptive_delay)
+            state.paused_until = max(state.paused_until, now + pause)
+            state.next_slot = max(state.next_slot, state.paused_until)
+
+        logger.warning("  ⏳ %s returned %d, pausing host for %.1fs", url, status_code, pause)
+        return True
+
+    def _ensure_crawl_delay(self, host: str) -> None:
+        """Fetch robots.txt for a host once and record its Crawl-delay."""
+        with self._lock:
+            if self._state(host).crawl_delay is not None:
+                return
+            host_lock = self._robots_locks.setdefault(host, threading.Lock())
+
+        with host_lock:
+            with self._lock:
+                if self._hosts[host].crawl_delay is not None:
+                    return
+
+            delay = fetch_crawl_delay(host, self.user_agent, client=self.client)
+            with self._lock:
+                self._hosts[host].crawl_delay = delay
+
+        if delay:
+            logger.info("  🤖 robots.txt Crawl-delay for %s: %ss", host, delay)
+
+
+def fetch_crawl_delay(
+    host: str,
+    user_agent: str = '*',
+    timeout: float = 10.0,
+    client: Optional[HTTPClient] = None
+) -> float:
+    """Return the robots.txt Crawl-delay of a host (0 if absent or unreachable).
+
+    Args:
+        host: Scheme and netloc, e.g. 'https://docs.example.com'
+        user_agent: User agent matched against robots.txt groups
+        timeout: Request timeout in seconds
+        client: Pooled client to fetch with (default: the shared client)
+    """
+    client = client or get_default_client()
+    try:
+        response = client.get(f"{host}/robots.txt", timeout=timeout, retries=1)
+    except requests.RequestException as e:
+        logger.debug("Could not fetch robots.txt for %s: %s", host, e)
+        return 0.0
+    if response.status_code != 200:
+        return 0.0
+
+    return parse_crawl_delay(response.text, user_agent)
+
+
+def parse_crawl_delay(robots_txt: str, user_agent: str = '*') -> float:
+    """Return the Crawl-delay that applies to a user agent in a robots.txt body.
+
+    The group naming the user agent wins over the '*' group. Fractional
+    delays are accepted (urllib.robotparser only understands integers).
+    """
+    delays: Dict[str, float] = {}
+    agents: List[str] = []
+    in_rules = False  # A rule line ends the User-agent lines of a group
+
+    for line in robots_txt.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if ':' not in line:
+            continue
+        field, value = (part.strip() for part in line.split(':', 1))
+        field = field.lower()
+
+        if field == 'user-agent':
+            if in_rules:
+                agents, in_rules = [], False
+            agents.append(value.lower())
+        elif field == 'crawl-delay':
+            in_rules = True
+            try:
+                delay = float(value)
+            except ValueError:
+                continue
+            for agent in agents:
+                delays.setdefault(agent, delay)
+        else:
+            in_rules = True
+
+    token = user_agent.lower()
+    for agent, delay in delays.items():
+        if agent != '*' and agent in token:
+            return max(0.0, delay)
+    return max(0.0, delays.get('*', 0.0))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _header(headers: Optional[Mapping[str, str]], name: str) -> Optional[str]:
+    """Case-insensitive header lookup that also works on plain dicts."""
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None:
+        lowered = name.lower()
+        for key, candidate in headers.items():
+            if key.lower() == lowered:
+                return candidate
+    return value
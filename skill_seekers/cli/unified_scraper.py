@@ -25,6 +25,8 @@ from typing import Dict, List, Any, Optional
 try:
     from skill_seekers.cli.config_validator import ConfigValidator, validate_config
     from skill_seekers.cli.conflict_detector import ConflictDetector
+    from skill_seekers.cli.constants import DEFAULT_PAGE_STORE
+    from skill_seekers.cli.page_store import open_page_store
     from skill_seekers.cli.merge_sources import RuleBasedMerger, ClaudeEnhancedMerger
     from skill_seekers.cli.unified_skill_builder import UnifiedSkillBuilder
 except ImportError as e:
@@ -126,7 +128,8 @@ class UnifiedScraper:
             'url_patterns': source.get('url_patterns', {}),
             'categories': source.get('categories', {}),
             'rate_limit': source.get('rate_limit', 0.5),
-            'max_pages': source.get('max_pages', 100)
+            'max_pages': source.get('max_pages', 100),
+            'page_store': source.get('page_store', DEFAULT_PAGE_STORE)
         }
 
         # Write temporary config
@@ -155,7 +158,9 @@ class UnifiedScraper:
 
             self.scraped_data['documentation'] = {
                 'pages': summary.get('pages', []),
-                'data_file': docs_data_file
+                'data_file': docs_data_file,
+                'data_dir': f"output/{doc_config['name']}_data",
+                'page_store': doc_config['page_store']
             }
 
             logger.info(f"✅ Documentation: {summary.get('total_pages', 0)} pages scraped")
@@ -278,9 +283,17 @@ class UnifiedScraper:
         with open(github_data['data_file'], 'r', encoding='utf-8') as f:
             github_json = json.load(f)
 
-        # Detect conflicts
-        detector = ConflictDetector(docs_json, github_json)
-        conflicts = detector.detect_all_conflicts()
+        # Detect conflicts (full page content is streamed from the docs page store)
+        page_store = None
+        if docs_data.get('data_dir') and os.path.isdir(docs_data['data_dir']):
+            page_store = open_page_store(docs_data['data_dir'], docs_data.get('page_store', DEFAULT_PAGE_STORE))
+
+        try:
+            detector = ConflictDetector(docs_json, github_json, page_store=page_store)
+            conflicts = detector.detect_all_conflicts()
+        finally:
+            if page_store is not None:
+                page_store.close()
 
         # Save conflicts
         conflicts_file = os.path.join(self.data_dir, 'conflicts.json')
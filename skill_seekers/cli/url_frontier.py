@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+URL frontier for documentation crawlers.
+
+Provides a FIFO queue of pending URLs paired with a "seen" set so that
+enqueueing a discovered link is O(1) instead of a linear scan over the
+pending queue. URLs are deduplicated on a canonical key (scheme/host case,
+default ports, trailing slashes, query parameter order, fragments), while
+the queue keeps the first-seen spelling of each URL so requests go out
+exactly as the site linked them.
+
+Two stores are available:
+    - MemoryFrontierStore: deque + sets (default)
+    - SQLiteFrontierStore: disk-backed, for frontiers with millions of URLs
+
+Usage:
+    from skill_seekers.cli.url_frontier import URLFrontier
+
+    frontier = URLFrontier(['https://docs.example.com/'])
+    frontier.add('https://docs.example.com/guide/')
+    url = frontier.pop()
+"""
+
+import sqlite3
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def canonicalize_url(url: str, keep_fragment_routes: bool = True) -> str:
+    """Return the canonical form of a URL used as its deduplication key.
+
+    Normalizes:
+    - scheme and host case
+    - default ports (``:80`` for http, ``:443`` for https)
+    - trailing slashes (``/docs/`` and ``/docs`` are the same page)
+    - query parameter order (``?b=2&a=1`` == ``?a=1&b=2``)
+    - fragments (``#section`` anchors are dropped)
+
+    Args:
+        url: URL to canonicalize
+        keep_fragment_routes: Keep fragments that look like SPA routes
+            (``#/path`` or ``#!/path``), since those address distinct pages
+
+    Returns:
+        Canonical URL string
+
+    Example:
+        >>> canonicalize_url('HTTPS://Docs.Example.com:443/guide/?b=2&a=1#intro')
+        'https://docs.example.com/guide?a=1&b=2'
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+
+    host = (parts.hostname or '').lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host
+    if parts.username:
+        userinfo = parts.username
+        if parts.password:
+            userinfo += f":{parts.password}"
+        netloc = f"{userinfo}@{netloc}"
+    if port is not None and DEFAULT_PORTS.get(scheme) != port:
+        netloc = f"{netloc}:{port}"
+
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/') or '/'
+
+    query = ''
+    if parts.query:
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+
+    fragment = ''
+    if keep_fragment_routes and parts.fragment.startswith(('/', '!')):
+        fragment = parts.fragment
+
+    return urlunsplit((scheme, netloc, path, query, fragment))
+
+
+class MemoryFrontierStore:
+    """In-memory frontier store: deque of pending URLs plus key sets."""
+
+    def __init__(self) -> None:
+        self._queue: Deque[Tuple[str, str]] = deque()
+        self._pending: Set[str] = set()
+        self._seen: Set[str] = set()
+
+    def add(self, key: str, url: str) -> bool:
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self._pending.add(key)
+        self._queue.append((key, url))
+        return True
+
+    def pop(self) -> Optional[str]:
+        if not self._queue:
+            return None
+        key, url = self._queue.popleft()
+        self._pending.discard(key)
+        return url
+
+    def mark_seen(self, key: str) -> None:
+        self._seen.add(key)
+
+    def is_seen(self, key: str) -> bool:
+        return key in self._seen
+
+    def is_pending(self, key: str) -> bool:
+        return key in self._pending
+
+    def pending_count(self) -> int:
+        return len(self._queue)
+
+    def seen_count(self) -> int:
+        return len(self._seen)
+
+    def iter_pending(self) -> Iterator[str]:
+        return iter([url for _, url in self._queue])
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteFrontierStore:
+    """Disk-backed frontier store for very large crawls.
+
+    Every URL ever enqueued is a row keyed on its canonical form; popping a
+    URL flips its state instead of deleting it, so the same table doubles as
+    the seen set. Only the current page of the queue lives in memory.
+    """
+
+    STATE_PENDING = 0
+    STATE_POPPED = 1
+    COMMIT_EVERY = 1000
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS frontier ("
+            " key TEXT PRIMARY KEY,"
+            " url TEXT NOT NULL,"
+            " seq INTEGER NOT NULL,"
+            " state INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS frontier_pending ON frontier (state, seq)"
+        )
+        self._conn.commit()
+        row = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM frontier").fetchone()
+        self._seq = row[0]
+        self._seen_count = self._conn.execute("SELECT COUNT(*) FROM frontier").fetchone()[0]
+        self._pending_count = self._conn.execute(
+            "SELECT COUNT(*) FROM frontier WHERE state = ?", (self.STATE_PENDING,)
+        ).fetchone()[0]
+        self._uncommitted = 0
+
+    def _written(self) -> None:
+        self._uncommitted += 1
+        if self._uncommitted >= self.COMMIT_EVERY:
+            self.commit()
+
+    def add(self, key: str, url: str) -> bool:
+        self._seq += 1
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO frontier (key, url, seq, state) VALUES (?, ?, ?, ?)",
+            (key, url, self._seq, self.STATE_PENDING)
+        )
+        if cursor.rowcount <= 0:
+            return False
+        self._seen_count += 1
+        self._pending_count += 1
+        self._written()
+        return True
+
+    def pop(self) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT key, url FROM frontier WHERE state = ? ORDER BY seq LIMIT 1",
+            (self.STATE_PENDING,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._conn.execute(
+            "UPDATE frontier SET state = ? WHERE key = ?",
+            (self.STATE_POPPED, row[0])
+        )
+        self._pending_count -= 1
+        self._written()
+        return row[1]
+
+    def mark_seen(self, key: str) -> None:
+        self._seq += 1
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO frontier (key, url, seq, state) VALUES (?, ?, ?, ?)",
+            (key, key, self._seq, self.STATE_POPPED)
+        )
+        if cursor.rowcount > 0:
+            self._seen_count += 1
+            self._written()
+
+    def is_seen(self, key: str) -> bool:
+        row = self._conn.execute("SELECT 1 FROM frontier WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def is_pending(self, key: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM frontier WHERE key = ? AND state = ?",
+            (key, self.STATE_PENDING)
+        ).fetchone()
+        return row is not None
+
+    def pending_count(self) -> int:
+        return self._pending_count
+
+    def seen_count(self) -> int:
+        return self._seen_count
+
+    def iter_pending(self) -> Iterator[str]:
+        rows = self._conn.execute(
+            "SELECT url FROM frontier WHERE state = ? ORDER BY seq", (self.STATE_PENDING,)
+        ).fetchall()
+        return (row[0] for row in rows)
+
+    def commit(self) -> None:
+        self._conn.commit()
+        self._uncommitted = 0
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+
+class URLFrontier:
+    """
+    Deduplicating FIFO frontier of URLs to crawl.
+
+    All operations are O(1) (amortized, or O(log n) with the SQLite store)
+    and guarded by an internal lock, so one frontier can be shared by the
+    threaded, async and estimation crawlers.
+    """
+
+    def __init__(
+        self,
+        start_urls: Iterable[str] = (),
+        store_path: Optional[Union[str, Path]] = None,
+        keep_fragment_routes: bool = True
+    ) -> None:
+        """
+        Initialize the frontier.
+
+        Args:
+            start_urls: URLs to enqueue immediately
+            store_path: Path to a SQLite file for a disk-backed frontier.
+                None keeps everything in memory.
+            keep_fragment_routes: Treat ``#/route`` fragments as distinct pages
+        """
+        self.keep_fragment_routes = keep_fragment_routes
+        self._lock = threading.RLock()
+        self.store: Union[MemoryFrontierStore, SQLiteFrontierStore]
+        if store_path:
+            self.store = SQLiteFrontierStore(store_path)
+        else:
+            self.store = MemoryFrontierStore()
+        self.extend(start_urls)
+
+    def key(self, url: str) -> str:
+        """Return the canonical deduplication key for a URL."""
+        return canonicalize_url(url, self.keep_fragment_routes)
+
+    def add(self, url: str) -> bool:
+        """Enqueue a URL unless an equivalent URL was already seen.
+
+        Returns:
+            True if the URL was enqueued, False if it was a duplicate
+        """
+        with self._lock:
+            return self.store.add(self.key(url), url)
+
+    def extend(self, urls: Iterable[str]) -> int:
+        """Enqueue several URLs, returning how many were new."""
+        with self._lock:
+            added = sum(1 for url in urls if self.store.add(self.key(url), url))
+            self._commit()
+            return added
+
+    def pop(self) -> Optional[str]:
+        """Dequeue the oldest pending URL, or None if the frontier is empty."""
+        with self._lock:
+            return self.store.pop()
+
+    def mark_seen(self, url: str) -> None:
+        """Record a URL as seen without enqueueing it (e.g. restored from a checkpoint)."""
+        with self._lock:
+            self.store.mark_seen(self.key(url))
+
+    def seen(self, url: str) -> bool:
+        """Return True if the URL (or an equivalent one) was ever enqueued or marked seen."""
+        with self._lock:
+            return self.store.is_seen(self.key(url))
+
+    def is_pending(self, url: str) -> bool:
+        """Return True if the URL is still waiting in the queue."""
+        with self._lock:
+            return self.store.is_pending(self.key(url))
+
+    @property
+    def seen_count(self) -> int:
+        with self._lock:
+            return self.store.seen_count()
+
+    def pending(self) -> List[str]:
+        """Snapshot of pending URLs in queue order (used for checkpoints)."""
+        with self._lock:
+            self._commit()
+            return list(self.store.iter_pending())
+
+    def close(self) -> None:
+        """Flush and release the underlying store."""
+        with self._lock:
+            self.store.close()
+
+    def _commit(self) -> None:
+        if isinstance(self.store, SQLiteFrontierStore):
+            self.store.commit()
+
+    def __contains__(self, url: str) -> bool:
+        return self.is_pending(url)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.store.pending_count()
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.pending())
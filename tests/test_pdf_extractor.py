@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for page-range extraction, shard merging and diff mode of
+pdf_extractor_poc.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+if PYMUPDF_AVAILABLE:
+    from skill_seekers.cli.pdf_extractor_poc import PDFExtractor, iter_pages_file, parse_page_range
+
+
+def make_pdf(path, pages=12, edited_page=None):
+    """
+    Write a PDF whose pages each hold one code block continued on the next
+    page, so code blocks merge in a chain across page (and shard) boundaries.
+    """
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Section {i + 1}", fontsize=14)
+        for k in range(8):
+            line = f"int value_{i}_{k} = compute({k}, {i});"
+            if i + 1 == edited_page and k == 3:
+                line = "int edited = 42;"
+            page.insert_text((72, 102 + 14 * k), line, fontname="cour", fontsize=10)
+    doc.save(path)
+    doc.close()
+
+
+def without_timings(pages):
+    """Drop per-page timings, which differ between runs."""
+    return [{key: value for key, value in page.items() if key != 'timings'} for page in pages]
+
+
+def chunk_ranges(chunks):
+    """Drop the pages embedded in chunks (compared separately)."""
+    return [{key: value for key, value in chunk.items() if key != 'pages'} for chunk in chunks]
+
+
+@unittest.skipUnless(PYMUPDF_AVAILABLE, "PyMuPDF not installed")
+class TestPageRangeExtraction(unittest.TestCase):
+    """Shards merged and diff runs must match a full extraction"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.pdf = self.path('doc.pdf')
+        make_pdf(self.pdf)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def extract(self, pdf, summary_name=None, pages_file=None, **kwargs):
+        """Run extract_all() quietly, optionally saving the summary JSON."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = PDFExtractor(pdf, use_cache=False, **kwargs).extract_all(pages_file=pages_file)
+        if summary_name:
+            with open(self.path(summary_name), 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+        return result
+
+    def test_merged_shards_match_full_extraction(self):
+        """Merging shards gives the pages, chunks and stats of one extraction"""
+        full = self.extract(self.pdf)
+        merged_blocks = [c for p in full['pages'] for c in p['code_samples'] if c.get('merged_from_next_page')]
+        self.assertTrue(merged_blocks, "test PDF should have code blocks merged across pages")
+
+        # Shard boundaries fall inside merged chains; one shard is streamed
+        self.extract(self.pdf, 'shard1.json', page_range=(1, 3))
+        self.extract(self.pdf, 'shard2.json', pages_file=self.path('shard2.jsonl'), page_range=(4, 7))
+        self.extract(self.pdf, 'shard3.json', page_range=(8, None))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            merged = PDFExtractor(None).merge_shards(
+                [self.path('shard3.json'), self.path('shard1.json'), self.path('shard2.json')])
+
+        self.assertEqual(without_timings(merged['pages']), without_timings(full['pages']))
+        self.assertEqual(chunk_ranges(merged['chunks']), chunk_ranges(full['chunks']))
+        self.assertEqual(merged['chapters'], full['chapters'])
+        self.assertEqual(merged['total_code_blocks'], full['total_code_blocks'])
+        self.assertEqual(merged['quality_statistics'], full['quality_statistics'])
+        self.assertEqual(merged['page_range'], [1, 12])
+
+    def test_overlapping_shards_rejected(self):
+        """Shards covering the same pages can't be merged"""
+        self.extract(self.pdf, 'shard1.json', page_range=(1, 6))
+        self.extract(self.pdf, 'shard2.json', page_range=(5, None))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(ValueError):
+                PDFExtractor(None).merge_shards([self.path('shard1.json'), self.path('shard2.json')])
+
+    def test_diff_run_matches_fresh_extraction(self):
+        """Reusing unchanged pages of a previous run gives a fresh extraction's pages"""
+        self.extract(self.pdf, 'previous.json', pages_file=self.path('previous.jsonl'))
+        edited = self.path('edited.pdf')
+        make_pdf(edited, edited_page=5)
+
+        fresh = self.extract(edited)
+        diff = self.extract(edited, pages_file=self.path('diff.jsonl'), previous=self.path('previous.json'))
+
+        self.assertEqual(diff['diff']['changed_pages'], [5])
+        self.assertEqual(diff['diff']['unchanged_pages'], 11)
+        self.assertEqual(without_timings(iter_pages_file(self.path('diff.jsonl'))),
+                         without_timings(fresh['pages']))
+        self.assertEqual(diff['chunks'], chunk_ranges(fresh['chunks']))
+        self.assertEqual(diff['total_code_blocks'], fresh['total_code_blocks'])
+
+
+@unittest.skipUnless(PYMUPDF_AVAILABLE, "PyMuPDF not installed")
+class TestParsePageRange(unittest.TestCase):
+    """Test --pages argument parsing"""
+
+    def test_valid_ranges(self):
+        """Ranges, open ends and single pages"""
+        self.assertEqual(parse_page_range('10-20'), (10, 20))
+        self.assertEqual(parse_page_range('10-'), (10, None))
+        self.assertEqual(parse_page_range('-20'), (1, 20))
+        self.assertEqual(parse_page_range('7'), (7, 7))
+        self.assertEqual(parse_page_range(' 3-3 '), (3, 3))
+
+    def test_invalid_ranges(self):
+        """Malformed, zero and reversed ranges raise ValueError"""
+        for spec in ('abc', '1-x', '1-2-3', '0', '0-5', '20-10'):
+            with self.subTest(spec=spec):
+                with self.assertRaises(ValueError):
+                    parse_page_range(spec)
+
+
+if __name__ == '__main__':
+    unittest.main()